@@ -0,0 +1,262 @@
+"""On-disk cache of Depop's immutable static bundles.
+
+Every fresh browser context (and reset_session creates many) would otherwise
+download the same hashed JS/CSS bundles again. The Playwright route handler
+serves those from here instead: bodies are stored content-addressed by SHA-256,
+an index maps each asset URL to its body, and the least recently used entries
+are evicted once the cache grows past its size budget. The index is written
+back at most every few seconds and on close; bodies it lost track of in a
+crash are swept on the next open.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from singleflight import normalize_flight_url
+
+
+ASSET_CACHE_DIR = os.environ.get("DEBOT_ASSET_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".debot_assets"
+)
+ASSET_CACHE_ENABLED = (os.environ.get("DEBOT_ASSET_CACHE") or "on").strip().lower() not in {"0", "false", "no", "off"}
+try:
+    ASSET_CACHE_MAX_BYTES = max(int(os.environ.get("DEBOT_ASSET_CACHE_MAX_MB") or 200), 1) * 1024 * 1024
+except ValueError:
+    ASSET_CACHE_MAX_BYTES = 200 * 1024 * 1024
+CACHEABLE_RESOURCE_TYPES = {"script", "stylesheet"}
+# Build output whose file name carries a content hash never changes under the same URL
+HASHED_ASSET_RX = re.compile(r"(/_next/static/|[.\-_~][0-9a-f]{8,}\.(?:js|css|mjs)$)", re.IGNORECASE)
+ASSET_INDEX_FILE = "index.json"
+ASSET_INDEX_SAVE_INTERVAL_SECONDS = 30.0
+ASSET_BODY_NAME_RX = re.compile(r"[0-9a-f]{64}")
+
+
+def is_cacheable_asset(request: Any) -> bool:
+    """Return whether a Playwright request fetches an immutable hashed script or stylesheet."""
+    try:
+        if str(getattr(request, "method", "GET") or "GET").upper() != "GET":
+            return False
+        if str(getattr(request, "resource_type", "") or "").lower() not in CACHEABLE_RESOURCE_TYPES:
+            return False
+        return bool(HASHED_ASSET_RX.search(urlparse(str(request.url)).path))
+    except Exception:
+        return False
+
+
+def cached_asset_headers(content_type: str) -> Dict[str, str]:
+    """Response headers for an asset fulfilled from the cache."""
+    return {
+        "content-type": content_type or "application/octet-stream",
+        "cache-control": "public, max-age=31536000, immutable",
+        "access-control-allow-origin": "*",
+    }
+
+
+class StaticAssetCache:
+    """Content-addressed asset bodies with a size-bounded LRU index and hit-rate stats."""
+
+    def __init__(self, directory: str, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = False
+        self._lock = threading.Lock()
+        # url key -> (sha256 digest, content type, size), least recently used first
+        self._index: "OrderedDict[str, Tuple[str, str, int]]" = OrderedDict()
+        self._bytes_by_digest: Dict[str, int] = {}
+        self._refs_by_digest: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.enabled
+
+    def open(self) -> None:
+        """Load the index, dropping entries whose body file has gone missing."""
+        if self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            with open(os.path.join(self.directory, ASSET_INDEX_FILE), "r", encoding="utf-8") as handle:
+                entries = json.load(handle)
+        except (OSError, ValueError):
+            entries = []
+        with self._lock:
+            for entry in entries if isinstance(entries, list) else []:
+                try:
+                    key, digest, content_type, size = entry
+                except (TypeError, ValueError):
+                    continue
+                if key not in self._index and os.path.exists(self._body_path(digest)):
+                    self._index[key] = (digest, content_type, int(size))
+                    self._add_body_locked(digest, int(size))
+                    self._refs_by_digest[digest] = self._refs_by_digest.get(digest, 0) + 1
+            self._sweep_orphans_locked()
+            self.enabled = True
+            self._evict_locked()
+
+    def close(self) -> None:
+        if not self.enabled:
+            return
+        self._save(force=True)
+        with self._lock:
+            self.enabled = False
+            self._index.clear()
+            self._bytes_by_digest.clear()
+            self._refs_by_digest.clear()
+            self._total_bytes = 0
+
+    def _body_path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest)
+
+    def _sweep_orphans_locked(self) -> None:
+        """Delete body files the index lost track of, e.g. stored after the last save before a crash."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if ASSET_BODY_NAME_RX.fullmatch(name) and name not in self._bytes_by_digest:
+                try:
+                    os.unlink(self._body_path(name))
+                except OSError:
+                    pass
+
+    def _save(self, force: bool = False) -> None:
+        """Write the index if it changed and the save interval has passed (always with force)."""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                if not force and time.monotonic() - self._saved_at < ASSET_INDEX_SAVE_INTERVAL_SECONDS:
+                    return
+                entries = [[key, *entry] for key, entry in self._index.items()]
+                self._dirty = False
+                self._saved_at = time.monotonic()
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(prefix=".index.", suffix=".tmp", dir=self.directory)
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(entries, handle)
+                os.replace(temp_path, os.path.join(self.directory, ASSET_INDEX_FILE))
+            except OSError:
+                if temp_path and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                with self._lock:
+                    self._dirty = True
+
+    def _add_body_locked(self, digest: str, size: int) -> None:
+        if digest not in self._bytes_by_digest:
+            self._bytes_by_digest[digest] = size
+            self._total_bytes += size
+
+    def _release_locked(self, digest: str) -> None:
+        """Drop one index reference to a body, deleting the body once nothing points at it."""
+        refs = self._refs_by_digest.get(digest, 0) - 1
+        if refs > 0:
+            self._refs_by_digest[digest] = refs
+            return
+        self._refs_by_digest.pop(digest, None)
+        self._total_bytes -= self._bytes_by_digest.pop(digest, 0)
+        try:
+            os.unlink(self._body_path(digest))
+        except OSError:
+            pass
+
+    def _remove_locked(self, key: str) -> None:
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._release_locked(entry[0])
+            self._dirty = True
+
+    def _evict_locked(self) -> None:
+        while self._index and self._total_bytes > self.max_bytes:
+            _, (digest, _, _) = self._index.popitem(last=False)
+            self.evictions += 1
+            self._release_locked(digest)
+            self._dirty = True
+
+    def lookup(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Return the cached (body, content type) for an asset URL and count the hit or miss."""
+        key = normalize_flight_url(url, keep_query=True)
+        with self._lock:
+            if not self.enabled:
+                return None
+            entry = self._index.get(key)
+        body = None
+        if entry is not None:
+            try:
+                with open(self._body_path(entry[0]), "rb") as handle:
+                    body = handle.read()
+            except OSError:
+                pass
+        with self._lock:
+            if body is not None and key in self._index:
+                self._index.move_to_end(key)
+                self.hits += 1
+                return body, entry[1]
+            if entry is not None and body is None and self._index.get(key) == entry:
+                self._remove_locked(key)
+            self.misses += 1
+            return None
+
+    def store(self, url: str, body: bytes, content_type: str = "") -> None:
+        """Write an asset body under its digest, index it and evict down to the size budget."""
+        if not body or len(body) > self.max_bytes:
+            return
+        digest = hashlib.sha256(body).hexdigest()
+        key = normalize_flight_url(url, keep_query=True)
+        with self._lock:
+            if not self.enabled:
+                return
+            if digest not in self._bytes_by_digest:
+                temp_path = None
+                try:
+                    fd, temp_path = tempfile.mkstemp(prefix=".asset.", suffix=".tmp", dir=self.directory)
+                    with os.fdopen(fd, "wb") as handle:
+                        handle.write(body)
+                    os.replace(temp_path, self._body_path(digest))
+                except OSError:
+                    if temp_path and os.path.exists(temp_path):
+                        os.unlink(temp_path)
+                    return
+                self._add_body_locked(digest, len(body))
+            previous = self._index.get(key)
+            self._index[key] = (digest, content_type or "", len(body))
+            self._index.move_to_end(key)
+            self._refs_by_digest[digest] = self._refs_by_digest.get(digest, 0) + 1
+            if previous:
+                self._release_locked(previous[0])
+            self._dirty = True
+            self._evict_locked()
+        self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+            }
+
+
+STATIC_ASSETS = StaticAssetCache(ASSET_CACHE_DIR)
@@ -0,0 +1,709 @@
+"""Async Playwright counterparts of the scraper helpers for the asyncio engine.
+
+These mirror the sync helpers in ``scraper`` one-for-one so the asyncio engine
+can run seller, browse, and following pipelines as coroutines on the server's
+event loop. Pure text/HTML helpers, selectors, navigation pacing and every
+decision that needs no page I/O (LinkCollector, build_listing_from_snapshot)
+are shared with the sync engine, so this module only holds the awaits.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+from playwright.async_api import async_playwright, BrowserContext, Page
+
+from asset_cache import STATIC_ASSETS, cached_asset_headers, is_cacheable_asset
+from pacing import NAVIGATION_SCHEDULER
+from scraper import (
+    BROWSE_END_SCROLL_WAIT_MS,
+    BROWSER_CONTEXT_OPTIONS,
+    COOKIE_BUTTON_TEXTS,
+    DESCRIPTION_SELECTORS,
+    LISTING_EVIDENCE_SELECTORS,
+    LISTING_EXTRACTION_MODE,
+    LISTING_FETCH_MODE,
+    LISTING_FLIGHTS,
+    LISTING_LINK_HREFS_JS,
+    LISTING_LINK_SELECTOR,
+    LISTING_READY_SELECTOR,
+    LISTING_READY_TIMEOUT_MS,
+    LISTING_SNAPSHOT_JS,
+    LISTING_TILE_META_JS,
+    LOGIN_MODAL_CLOSE_SELECTORS,
+    LOGIN_MODAL_JS_DISMISS,
+    LOGIN_MODAL_MAX_ATTEMPTS,
+    LOGIN_MODAL_WAIT_MS,
+    MARK_SOLD_SECTIONS_JS,
+    OVERLAY_GUARD_BINDING,
+    OVERLAY_GUARD_JS,
+    PRICE_FALLBACK_SELECTORS,
+    RATE_LIMIT_PROBE_JS,
+    RATE_LIMIT_SAMPLE_CHARS,
+    SELLER_HREFS_JS,
+    SHOP_LINK_SELECTORS,
+    CancelCheck,
+    LinkCollector,
+    RateLimitError,
+    SearchCancelled,
+    _parse_retry_after_seconds,
+    _raise_rate_limit,
+    _response_status,
+    build_listing_from_snapshot,
+    extract_rate_limit_message,
+    extract_seller_sold_count_from_text,
+    fetch_listing_via_http,
+    has_overlay_guard,
+    is_product_list_response,
+    listing_item_has_evidence,
+    listing_meta_from_html,
+    log_debug,
+    mark_overlay_guarded,
+    raise_for_snapshot_rate_limit,
+    raise_if_cancelled,
+    rate_limit_expected_selectors,
+    rate_limit_needs_full_scan,
+    record_navigation_success,
+    record_overlay_suppression,
+    should_block_request,
+)
+from singleflight import normalize_flight_url
+
+
+class AsyncBrowserManager:
+    """One async Playwright driver and Firefox browser shared by every async search."""
+
+    def __init__(self, headless: bool = True, slowmo: int = 0):
+        self.headless = headless
+        self.slowmo = slowmo
+        self._pw = None
+        self._browser = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.launches = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def is_healthy(self) -> bool:
+        """Return whether the shared browser is still connected."""
+        try:
+            return bool(self._browser is not None and self._browser.is_connected())
+        except Exception:
+            return False
+
+    async def browser(self):
+        """Return the shared browser, launching (or relaunching) it on demand."""
+        async with self._get_lock():
+            if not self.is_healthy():
+                await self._launch()
+            return self._browser
+
+    async def new_context(self) -> BrowserContext:
+        """Create an isolated context on the shared browser."""
+        browser = await self.browser()
+        ctx = await browser.new_context(**BROWSER_CONTEXT_OPTIONS)
+        try:
+            await install_resource_blocking(ctx)
+        except Exception as exc:
+            log_debug(f"[browser] Failed to install resource blocking: {exc}")
+        try:
+            await install_overlay_guard(ctx)
+        except Exception as exc:
+            log_debug(f"[browser] Failed to install overlay guard: {exc}")
+        return ctx
+
+    async def relaunch(self) -> None:
+        """Replace the shared browser with a fresh one."""
+        async with self._get_lock():
+            await self._close_browser()
+            await self._launch()
+
+    async def close(self) -> None:
+        """Close the shared browser and stop the Playwright driver."""
+        async with self._get_lock():
+            await self._close_browser()
+            if self._pw is not None:
+                try:
+                    await self._pw.stop()
+                except Exception:
+                    pass
+                self._pw = None
+
+    async def _launch(self) -> None:
+        if self._pw is None:
+            self._pw = await async_playwright().start()
+        await self._close_browser()
+        self._browser = await self._pw.firefox.launch(headless=self.headless, slow_mo=self.slowmo)
+        self.launches += 1
+
+    async def _close_browser(self) -> None:
+        if self._browser is None:
+            return
+        try:
+            await self._browser.close()
+        except Exception:
+            pass
+        self._browser = None
+
+
+async def sleep_with_cancel(
+    delay_seconds: float,
+    should_cancel: CancelCheck = None,
+    interval_seconds: float = 0.1,
+) -> None:
+    """Sleep in short intervals so long waits can be interrupted promptly."""
+    remaining = max(delay_seconds, 0.0)
+    while remaining > 0:
+        raise_if_cancelled(should_cancel)
+        chunk = min(interval_seconds, remaining)
+        await asyncio.sleep(chunk)
+        remaining -= chunk
+    raise_if_cancelled(should_cancel)
+
+
+async def acquire_navigation_slot(should_cancel: CancelCheck = None) -> float:
+    """Async counterpart of scraper.acquire_navigation_slot that waits without holding an executor thread."""
+    waited = await NAVIGATION_SCHEDULER.acquire_async(should_cancel)
+    if waited is None:
+        raise_if_cancelled(should_cancel)
+    return waited or 0.0
+
+
+async def guarded_goto(
+    page: Page,
+    url: str,
+    *,
+    wait_until: str = "domcontentloaded",
+    timeout: int = 60_000,
+    should_cancel: CancelCheck = None,
+):
+    """Space navigation start times through the scheduler shared with the sync engine."""
+    await acquire_navigation_slot(should_cancel)
+    return await page.goto(url, wait_until=wait_until, timeout=timeout)
+
+
+async def install_overlay_guard(ctx: BrowserContext) -> None:
+    """Suppress cookie banners and login modals in every page of ctx as they mount."""
+    await ctx.expose_function(OVERLAY_GUARD_BINDING, record_overlay_suppression)
+    await ctx.add_init_script(script=OVERLAY_GUARD_JS)
+    mark_overlay_guarded(ctx)
+
+
+async def serve_static_asset(route) -> None:
+    """Async counterpart of scraper.serve_static_asset; cache file I/O runs off the event loop."""
+    url = route.request.url
+    cached = await asyncio.to_thread(STATIC_ASSETS.lookup, url)
+    if cached is not None:
+        body, content_type = cached
+        await route.fulfill(status=200, body=body, headers=cached_asset_headers(content_type))
+        return
+    response = await route.fetch()
+    body = await response.body()
+    if response.ok:
+        await asyncio.to_thread(STATIC_ASSETS.store, url, body, response.headers.get("content-type", ""))
+    await route.fulfill(response=response, body=body)
+
+
+async def install_resource_blocking(ctx: BrowserContext) -> None:
+    """Install a best-effort route that blocks heavy assets and trackers and serves cached static bundles."""
+    async def handle_route(route):
+        try:
+            if should_block_request(route.request):
+                await route.abort()
+                return
+            if STATIC_ASSETS.is_open and is_cacheable_asset(route.request):
+                await serve_static_asset(route)
+                return
+            await route.continue_()
+        except Exception:
+            try:
+                await route.continue_()
+            except Exception:
+                pass
+
+    await ctx.route("**/*", handle_route)
+
+
+async def extract_retry_after_seconds(response: Any) -> Optional[int]:
+    """Extract Retry-After seconds from a Playwright response when present."""
+    if response is None:
+        return None
+
+    try:
+        header_value = await response.header_value("retry-after")
+    except Exception:
+        header_value = None
+
+    return _parse_retry_after_seconds(header_value)
+
+
+async def _page_has_selector(page: Page, selector: str) -> bool:
+    """Best-effort check for whether a selector exists on the page."""
+    try:
+        return await page.locator(selector).first.count() > 0
+    except Exception:
+        return False
+
+
+async def check_page_for_rate_limit(
+    page: Page,
+    response_status: Optional[int] = None,
+    expect_product_links: bool = False,
+    expect_listing: bool = False,
+    retry_after_seconds: Optional[int] = None,
+) -> None:
+    """Inspect the current page cheapest-first (status, one probe evaluate, then full text on a signal)."""
+    _raise_rate_limit(extract_rate_limit_message("", status=response_status), response_status, retry_after_seconds)
+
+    selectors = rate_limit_expected_selectors(expect_product_links, expect_listing)
+    try:
+        probe = await page.evaluate(RATE_LIMIT_PROBE_JS, {"selectors": selectors, "sampleChars": RATE_LIMIT_SAMPLE_CHARS})
+    except Exception:
+        probe = None
+    if not isinstance(probe, dict):
+        await _check_page_for_rate_limit_full(
+            page,
+            response_status=response_status,
+            expect_product_links=expect_product_links,
+            expect_listing=expect_listing,
+            retry_after_seconds=retry_after_seconds,
+        )
+        return
+
+    text = "\n".join([probe.get("title") or "", probe.get("sample") or ""])
+    if rate_limit_needs_full_scan(probe, response_status, retry_after_seconds):
+        try:
+            text = "\n".join([probe.get("title") or "", await page.inner_text("body", timeout=1_000) or ""])
+        except Exception:
+            pass
+
+    _raise_rate_limit(
+        extract_rate_limit_message(text, status=response_status, expected_content_missing=not probe.get("hasExpected")),
+        response_status,
+        retry_after_seconds,
+    )
+
+
+async def _check_page_for_rate_limit_full(
+    page: Page,
+    response_status: Optional[int] = None,
+    expect_product_links: bool = False,
+    expect_listing: bool = False,
+    retry_after_seconds: Optional[int] = None,
+) -> None:
+    """Fallback rate-limit check that reads the full title and body text."""
+    text_parts: List[str] = []
+
+    try:
+        text_parts.append(await page.title() or "")
+    except Exception:
+        pass
+
+    try:
+        text_parts.append(await page.inner_text("body", timeout=1_000) or "")
+    except Exception:
+        pass
+
+    expected_content_missing = False
+    if expect_product_links:
+        expected_content_missing = not await _page_has_selector(page, LISTING_LINK_SELECTOR)
+    elif expect_listing:
+        expected_content_missing = True
+        for selector in LISTING_EVIDENCE_SELECTORS:
+            if await _page_has_selector(page, selector):
+                expected_content_missing = False
+                break
+
+    message = extract_rate_limit_message(
+        "\n".join(text_parts),
+        status=response_status,
+        expected_content_missing=expected_content_missing,
+    )
+    if message:
+        raise RateLimitError(
+            message,
+            status=response_status,
+            retry_after_seconds=retry_after_seconds,
+        )
+
+
+async def accept_cookies(page: Page) -> None:
+    """Dismiss cookie consent dialogs."""
+    for text in COOKIE_BUTTON_TEXTS:
+        try:
+            await page.locator(f"button:has-text('{text}')").first.click(timeout=1500)
+            return
+        except Exception:
+            continue
+
+
+async def dismiss_login_modal(page: Page) -> None:
+    """Dismiss login/signup modal popup if it appears ('Want in?' modal)."""
+    try:
+        for _ in range(LOGIN_MODAL_MAX_ATTEMPTS):
+            for selector in LOGIN_MODAL_CLOSE_SELECTORS:
+                try:
+                    close_btn = page.locator(selector).first
+                    if await close_btn.count() and await close_btn.is_visible(timeout=300):
+                        await close_btn.click(timeout=2000)
+                        log_debug(f"[login-modal] Dismissed login modal via: {selector}")
+                        await page.wait_for_timeout(LOGIN_MODAL_WAIT_MS)
+                        return
+                except Exception:
+                    continue
+
+            try:
+                if await page.evaluate(LOGIN_MODAL_JS_DISMISS):
+                    log_debug("[login-modal] Dismissed login modal via JS click")
+                    await page.wait_for_timeout(LOGIN_MODAL_WAIT_MS)
+                    return
+            except Exception:
+                pass
+
+            await page.wait_for_timeout(LOGIN_MODAL_WAIT_MS)
+
+        try:
+            await page.keyboard.press("Escape")
+            await page.wait_for_timeout(LOGIN_MODAL_WAIT_MS)
+            log_debug("[login-modal] Pressed Escape to dismiss modal", aggregate_key="login_modal_escape")
+        except Exception:
+            pass
+    except Exception as e:
+        log_debug(f"[login-modal] Error dismissing login modal: {e}")
+
+
+async def remove_sold_sections(page: Page) -> None:
+    """Mark sold item sections so link collection can skip them safely."""
+    try:
+        await page.evaluate(MARK_SOLD_SECTIONS_JS)
+    except Exception:
+        pass
+
+
+async def extract_seller_sold_count(page: Page) -> Optional[int]:
+    """Extract the seller's sold count from a seller page."""
+    try:
+        sold_count = extract_seller_sold_count_from_text(await page.inner_text("body", timeout=1_500) or "")
+        if sold_count is not None:
+            return sold_count
+    except Exception:
+        pass
+
+    try:
+        return extract_seller_sold_count_from_text(await page.content())
+    except Exception:
+        return None
+
+
+async def collect_listing_links(
+    page: Page,
+    max_scrolls: int = 2,
+    per_scroll_wait_ms: int = 1200,
+    max_links: Optional[int] = None,
+    should_cancel: CancelCheck = None,
+    aggressive_end_scroll: bool = False,
+    listing_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    harvest_responses: bool = False,
+    read_tiles: bool = False,
+    known_links: Optional[Set[str]] = None,
+) -> List[str]:
+    """Collect product listing links, optionally gathering partial listing records into listing_data.
+
+    Links in known_links are skipped, and scrolling stops once enough of them have appeared.
+    """
+    harvest_responses = harvest_responses and listing_data is not None
+    read_tiles = read_tiles and listing_data is not None
+    u = urlparse(page.url)
+    links = LinkCollector(
+        f"{u.scheme}://{u.netloc}", max_scrolls, max_links, aggressive_end_scroll, listing_data, known_links,
+    )
+    pending_responses: List[Any] = []
+
+    def on_response(response) -> None:
+        try:
+            if is_product_list_response(response.url, response.headers.get("content-type", "")):
+                pending_responses.append(response)
+        except Exception:
+            pass
+
+    async def drain_responses() -> None:
+        while pending_responses:
+            response = pending_responses.pop(0)
+            try:
+                payload = await response.json()
+            except Exception:
+                continue
+            links.add_payload(payload)
+
+    async def collect_visible_links() -> None:
+        if harvest_responses:
+            await drain_responses()
+        try:
+            if read_tiles:
+                links.add_tiles(await page.eval_on_selector_all(LISTING_LINK_SELECTOR, LISTING_TILE_META_JS))
+            else:
+                links.add_hrefs(await page.eval_on_selector_all(LISTING_LINK_SELECTOR, LISTING_LINK_HREFS_JS))
+        except Exception:
+            pass
+
+    if harvest_responses:
+        page.on("response", on_response)
+
+    try:
+        for step in range(links.total_steps):
+            raise_if_cancelled(should_cancel)
+            await collect_visible_links()
+            if links.done():
+                return links.ordered
+            if links.should_stop(step):
+                break
+
+            if aggressive_end_scroll:
+                try:
+                    await page.keyboard.press("End")
+                except Exception:
+                    pass
+                try:
+                    await page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
+                except Exception:
+                    pass
+                await page.wait_for_timeout(max(per_scroll_wait_ms, BROWSE_END_SCROLL_WAIT_MS))
+                continue
+
+            try:
+                viewport_height = await page.evaluate(
+                    "() => window.innerHeight || document.documentElement.clientHeight || 800"
+                )
+            except Exception:
+                viewport_height = 800
+            await page.evaluate("(amount) => window.scrollBy(0, amount)", links.scroll_amount(viewport_height))
+            await page.wait_for_timeout(per_scroll_wait_ms)
+    finally:
+        if harvest_responses:
+            try:
+                page.remove_listener("response", on_response)
+            except Exception:
+                pass
+            await drain_responses()
+
+    if not links.ordered:
+        await check_page_for_rate_limit(page, expect_product_links=True)
+
+    return links.ordered
+
+
+async def _first_inner_text(page: Page, selectors, timeout: int) -> str:
+    """Return the first non-empty inner text among the given selectors."""
+    for selector in selectors:
+        try:
+            loc = page.locator(selector).first
+            if await loc.count():
+                text = (await loc.inner_text(timeout=timeout) or "").strip()
+                if text:
+                    return text
+        except Exception:
+            continue
+    return ""
+
+
+async def _first_attribute(page: Page, selector: str, name: str) -> Optional[str]:
+    """Return an attribute of the first element matching selector, if any."""
+    try:
+        loc = page.locator(selector).first
+        return await loc.get_attribute(name) if await loc.count() else None
+    except Exception:
+        return None
+
+
+async def read_listing_dom(page: Page) -> Dict[str, Any]:
+    """Read LISTING_SNAPSHOT_JS's fields one locator call at a time (DEBOT_LISTING_EXTRACTION=dom)."""
+    try:
+        json_ld_texts = await page.locator("script[type='application/ld+json']").all_inner_texts()
+    except Exception:
+        json_ld_texts = []
+    try:
+        body_text = await page.inner_text("body", timeout=1_500) or ""
+    except Exception:
+        body_text = ""
+    try:
+        html = await page.content()
+    except Exception:
+        html = ""
+    try:
+        seller_hrefs = await page.eval_on_selector_all("a[href]", SELLER_HREFS_JS)
+    except Exception:
+        seller_hrefs = []
+    shop_selector = None
+    for selector in SHOP_LINK_SELECTORS:
+        if await _first_attribute(page, selector, "href"):
+            shop_selector = selector
+            break
+    return {
+        **listing_meta_from_html(html),
+        "bodyText": body_text,
+        "jsonLd": json_ld_texts,
+        "description": await _first_inner_text(page, DESCRIPTION_SELECTORS, 1_000),
+        "price": await _first_inner_text(page, ("p[aria-label='Price']", *PRICE_FALLBACK_SELECTORS), 800),
+        "imageItemSrc": await _first_attribute(page, "img.styles_imageItem__UWJs6", "src"),
+        "imageSrcset": await _first_attribute(page, "img[srcset], img[src]", "srcset"),
+        "imageSrc": await _first_attribute(page, "img[srcset], img[src]", "src"),
+        "shopText": await _first_inner_text(page, (shop_selector,), 500) if shop_selector else "",
+        "shopHref": await _first_attribute(page, shop_selector, "href") if shop_selector else None,
+        "sellerHrefs": seller_hrefs,
+        "timeDatetime": await _first_attribute(page, "time[datetime]", "datetime"),
+        "timeText": await _first_inner_text(page, ("time[datetime]",), 400),
+    }
+
+
+async def capture_listing_snapshot(page: Page) -> Optional[Dict[str, Any]]:
+    """Collect a listing's raw fields with a single page.evaluate round-trip."""
+    try:
+        snapshot = await page.evaluate(LISTING_SNAPSHOT_JS)
+    except Exception:
+        return None
+    return snapshot if isinstance(snapshot, dict) else None
+
+
+async def parse_listing(
+    page: Page,
+    url: str,
+    should_cancel: CancelCheck = None,
+) -> Optional[Dict[str, Any]]:
+    """Parse a single listing page; concurrent calls for the same listing share one navigation.
+
+    Returns None only when the page could not be loaded; a loaded page always yields an item.
+    """
+    item, shared = await LISTING_FLIGHTS.do_async(
+        normalize_flight_url(url),
+        lambda: _parse_listing_page(page, url, should_cancel),
+        check_cancelled=lambda: raise_if_cancelled(should_cancel),
+    )
+    return dict(item) if shared and item is not None else item
+
+
+async def _parse_listing_page(
+    page: Page,
+    url: str,
+    should_cancel: CancelCheck = None,
+) -> Optional[Dict[str, Any]]:
+    """Navigate page to a listing and extract its details."""
+    try:
+        if LISTING_FETCH_MODE == "http":
+            item = await asyncio.to_thread(fetch_listing_via_http, url, should_cancel)
+            if item is not None:
+                return item
+
+        raise_if_cancelled(should_cancel)
+        response = await guarded_goto(
+            page, url, wait_until="domcontentloaded", timeout=60_000, should_cancel=should_cancel,
+        )
+        raise_if_cancelled(should_cancel)
+        overlays_guarded = has_overlay_guard(page)
+        if not overlays_guarded:
+            await accept_cookies(page)
+        try:
+            await page.wait_for_selector(LISTING_READY_SELECTOR, timeout=LISTING_READY_TIMEOUT_MS)
+        except Exception:
+            pass
+        if not overlays_guarded:
+            await dismiss_login_modal(page)
+
+        if LISTING_EXTRACTION_MODE == "script":
+            snapshot = await capture_listing_snapshot(page)
+            if snapshot is not None:
+                raise_for_snapshot_rate_limit(
+                    snapshot,
+                    response_status=_response_status(response),
+                    retry_after_seconds=await extract_retry_after_seconds(response),
+                )
+                record_navigation_success()
+                return build_listing_from_snapshot(url, snapshot)
+
+        await check_page_for_rate_limit(
+            page,
+            response_status=_response_status(response),
+            expect_listing=True,
+            retry_after_seconds=await extract_retry_after_seconds(response),
+        )
+        item = build_listing_from_snapshot(url, await read_listing_dom(page))
+        if not listing_item_has_evidence(item):
+            await check_page_for_rate_limit(
+                page,
+                response_status=_response_status(response),
+                expect_listing=True,
+            )
+
+        record_navigation_success()
+        return item
+    except SearchCancelled:
+        raise
+    except RateLimitError:
+        raise
+    except Exception:
+        return None
+
+
+async def get_following_list(page: Page, username: str, should_cancel: CancelCheck = None) -> List[str]:
+    """Open a user's following modal and extract every followed username."""
+    profile_url = f"https://www.depop.com/{username.strip().lstrip('@').strip('/')}/"
+    log_debug(f"[following] Navigating to {profile_url}")
+
+    await guarded_goto(page, profile_url, wait_until="domcontentloaded", timeout=60000, should_cancel=should_cancel)
+    await accept_cookies(page)
+    await page.wait_for_load_state("networkidle", timeout=60000)
+    await dismiss_login_modal(page)
+
+    following_usernames: List[str] = []
+
+    try:
+        follow_btn = page.locator("button.styles_followCount__UzSsn").first
+        if not await follow_btn.count():
+            follow_btn = page.locator("button:has-text('Following')").first
+
+        if await follow_btn.count():
+            await follow_btn.click(timeout=5000)
+            await page.wait_for_timeout(1500)
+
+            modal_selector = "[class*='Modal'], [role='dialog'], [class*='modal']"
+            last_count = 0
+
+            for _ in range(20):
+                usernames = await page.eval_on_selector_all(
+                    "p._text_bevez_41._shared_bevez_6._normal_bevez_51._caption1_bevez_55",
+                    "els => els.map(e => e.textContent || '').filter(t => t.startsWith('@'))"
+                )
+
+                for uname in usernames:
+                    clean_name = uname.strip().lstrip('@')
+                    if clean_name and clean_name not in following_usernames:
+                        following_usernames.append(clean_name)
+
+                try:
+                    await page.evaluate(f"""() => {{
+                        const modal = document.querySelector("{modal_selector}");
+                        if (modal) {{
+                            const scrollable = modal.querySelector('[class*="scroll"], [style*="overflow"]') || modal;
+                            scrollable.scrollTop = scrollable.scrollHeight;
+                        }}
+                    }}""")
+                except Exception:
+                    pass
+
+                await page.wait_for_timeout(800)
+
+                if len(following_usernames) == last_count:
+                    break
+                last_count = len(following_usernames)
+
+            try:
+                await page.keyboard.press("Escape")
+            except Exception:
+                pass
+
+    except Exception as e:
+        log_debug(f"[following] Error extracting following list: {e}")
+
+    log_debug(f"[following] Found {len(following_usernames)} accounts")
+    return following_usernames
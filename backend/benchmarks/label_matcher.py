@@ -0,0 +1,49 @@
+"""Microbenchmark: precompiled LabelMatcher vs the per-call label regexes it replaced.
+
+Runs both over every line segment of the parser_corpus live examples,
+checks they agree, and prints the time per segment. Run from backend/:
+
+    python benchmarks/label_matcher.py [--repeat 200]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import List, Optional
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.parser_corpus import corpus_segments, legacy_values, matcher_values  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args_parser.add_argument("--repeat", type=int, default=200, help="passes over the corpus per timing")
+    args = args_parser.parse_args(argv)
+
+    segments = corpus_segments()
+    mismatches = [segment for segment in segments if legacy_values(segment) != matcher_values(segment)]
+    if mismatches:
+        print(f"LabelMatcher disagrees with the legacy lookup on {len(mismatches)} segment(s):")
+        for segment in mismatches[:10]:
+            print(f"  {segment!r}: legacy={legacy_values(segment)} matcher={matcher_values(segment)}")
+        return 1
+
+    timings = {}
+    for name, func in (("legacy", legacy_values), ("matcher", matcher_values)):
+        seconds = min(timeit.repeat(lambda: [func(segment) for segment in segments], number=args.repeat, repeat=5))
+        timings[name] = seconds / (args.repeat * len(segments))
+
+    print(f"{len(segments)} segments, {args.repeat} passes")
+    for name, per_segment in timings.items():
+        print(f"  {name:<8} {per_segment * 1e6:8.2f} us/segment")
+    print(f"  speedup  {timings['legacy'] / timings['matcher']:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
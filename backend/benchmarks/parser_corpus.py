@@ -0,0 +1,329 @@
+"""Frozen parser inputs for the benchmarks, also read by the parser tests.
+
+Holds the live listing examples with their expected measurements, seeded
+synthetic descriptions (long, emoji-heavy and dense inline), and the legacy
+per-family label lookup that LabelMatcher replaced, kept as a reference.
+"""
+
+import random
+import re
+from typing import Dict, List, Optional
+
+from parser import MeasurementParser, parser
+
+
+TOPS_EXAMPLES = [
+    {
+        "name": "warner bros acme tee",
+        "description": (
+            "Warner Bros x ACME Clothing 1995 Baseball Embroidered Looney Tunes Pocket Tee\n\n"
+            "Length 26.5\"\n"
+            "Pit-to-pit 20.5\"\n"
+            "Tagged Small\n\n"
+            "Made in Sri Lanka\n"
+            "#bugsBunny #taz"
+        ),
+        "expected": (20.5, 26.5),
+    },
+    {
+        "name": "hard rock cafe tee",
+        "description": (
+            "Vintage Tortola B.V.I. Hard Rock Cafe Promo Single Stitched T-shirt - XL - 90s\n\n"
+            "Great condition, no major wear or flaws.\n\n"
+            "Fabric made in USA. Assembled in Jamaica. 100% cotton. Single stitched sleeves.\n"
+            "__________________________________________________\n"
+            "Measurements\n"
+            "Length(shoulder-hem): 27\n"
+            "Chest(armpit-armpit): 23\n"
+            "Hem: 25\n"
+            "Neck: 7\n"
+            "Sleeves: 8\n"
+            "Shoulders: 23\n\n"
+            "All measurements taken laid flat.\n"
+            "__________________________________________________"
+        ),
+        "expected": (23.0, 27.0),
+    },
+    {
+        "name": "radically canadian cfl tee",
+        "description": (
+            "2000 Radically Canadian CFL Tee\n\n"
+            "- single stitch\n"
+            "- made in Canada\n\n"
+            "Size: XL\n"
+            "Fits like: XL\n"
+            "Measurements: 24x32”\n\n"
+            "All sales final"
+        ),
+        "expected": (24.0, 32.0),
+    },
+    {
+        "name": "reo speedwagon tee",
+        "description": (
+            "REO Speedwagon 1982 Good Trouble Tour T Shirt\n\n"
+            "Single stitch\n"
+            "Super bright graphics\n\n"
+            "Tagged large, fits true\n"
+            "Pit-to-Pit: 21.5\"\n"
+            "Length: 26\"\n\n"
+            "Excellent condition for age\n"
+            "Seems unworn"
+        ),
+        "expected": (21.5, 26.0),
+    },
+    {
+        "name": "dime crewneck with detailed measurements",
+        "description": (
+            "Dime MTL Sun-Faded Teal Crewneck Sweatshirt Size Medium Embroidered Logo\n"
+            "no.19\n\n"
+            "\u200bBrand: Dime\n"
+            "\u200bItem: Crewneck Sweatshirt\n"
+            "\u200bDetailed Measurements:\n\n"
+            "\u200bPit to Pit (Chest Width): 23 inches\n"
+            "\u200bLength (Neck to Hem): 27.5 inches\n"
+            "\u200bSleeve Length (Shoulder to Cuff): 25.5 inches\n"
+        ),
+        "expected": (23.0, 27.5),
+    },
+    {
+        "name": "genius tee with collar down measurement",
+        "description": (
+            "2000’s are you a genius tee\n"
+            "Cool graphic great condition\n"
+            "Measurements\n"
+            "Pit to pit 21”\n"
+            "Collar down 28”\n"
+            "#y2k #2000s #gr"
+        ),
+        "expected": (21.0, 28.0),
+    },
+    {
+        "name": "tops with number before labels",
+        "description": (
+            "single stitch tee\n"
+            "21 pit to pit\n"
+            "28 length\n"
+            "great fade"
+        ),
+        "expected": (21.0, 28.0),
+    },
+    {
+        "name": "tops with shoulder to hem label",
+        "description": (
+            "vintage crewneck\n"
+            "23 chest\n"
+            "27.5 shoulder to hem\n"
+        ),
+        "expected": (23.0, 27.5),
+    },
+    {
+        "name": "tops with x pair after measurements label",
+        "description": (
+            "measurements 22 x 28\n"
+            "fits boxy"
+        ),
+        "expected": (22.0, 28.0),
+    },
+]
+
+
+BOTTOMS_EXAMPLES = [
+    {
+        "name": "sears jeans with w l pair and explicit pair",
+        "description": (
+            "Vintage 70s Sears flare denim jeans. Made in USA in great condition, minor staining. W34 L28.5\n"
+            "34 x 28.5\n"
+            "Size: W34 L28.5"
+        ),
+        "expected": {"waist": 34.0, "inseam": 28.5},
+    },
+    {
+        "name": "navy sailor pants labeled",
+        "description": (
+            "Waist 28\n"
+            "Inseam 27"
+        ),
+        "expected": {"waist": 28.0, "inseam": 27.0},
+    },
+    {
+        "name": "ed hardy laid flat waist",
+        "description": (
+            "Size 32\n"
+            "Measurements\n"
+            "Waist 16.5\n"
+            "Inseam 31.5\n"
+            "Leg opening 7.5\n"
+            "Rise 10"
+        ),
+        "expected": {"waist": 33.0, "inseam": 31.5, "rise": 10.0, "legOpening": 7.5},
+    },
+    {
+        "name": "carhartt inline size pair plus labels",
+        "description": (
+            "Vintage Carhartt Denim Relaxed fit Denim Jeans Dark Washed Size 30 x 30.5in\n"
+            "Waist: 30in\n"
+            "Inseam: 30.5in"
+        ),
+        "expected": {"waist": 30.0, "inseam": 30.5},
+    },
+    {
+        "name": "levis black denim bottom hem and flat waist",
+        "description": (
+            "Levi's Black Denim Jeans Relaxed Fit 38x32\n"
+            "Measurements:\n"
+            "Waist: 18.5\n"
+            "Front Rise: 12\n"
+            "Inseam: 31\n"
+            "Bottom Hem: 9"
+        ),
+        "expected": {"waist": 37.0, "inseam": 31.0, "rise": 12.0, "legOpening": 9.0},
+    },
+    {
+        "name": "one line bottoms labels",
+        "description": (
+            "Vintage 90s Hemmed Levis Blue Wash Denim Red Tab Jeans\n"
+            "Waist 32 Inseam 25 Outseam 35 Hip 40 Rise 11 Leg 8"
+        ),
+        "expected": {"waist": 32.0, "inseam": 25.0, "rise": 11.0, "legOpening": 8.0},
+    },
+    {
+        "name": "measured pair overrides tagged pair",
+        "description": (
+            "Vintage Levis 550 blue jeans\n"
+            "Tagged 40x32\n"
+            "Measurements 38x27"
+        ),
+        "expected": {"waist": 38.0, "inseam": 27.0},
+    },
+    {
+        "name": "gap measured w l and flat waist",
+        "description": (
+            "Vintage GAP Lightwash Blue Straight Leg Fit Denim Jeans - 31x29\n"
+            "Tagged 31x30\n"
+            "Measured W31 L29\n"
+            "15.5 waist\n"
+            "29 inseam\n"
+            "11.5 rise\n"
+            "8.75 leg opening"
+        ),
+        "expected": {"waist": 31.0, "inseam": 29.0, "rise": 11.5, "legOpening": 8.75},
+    },
+    {
+        "name": "inline parenthetical measurements",
+        "description": (
+            "Cool faded baggy Sean John vintage Y2K jeans with relaxed fit\n"
+            "Size 32 Measurements (34 Waist, 30.5 Inseam, 12.5 Rise & 9.5 Leg opening)"
+        ),
+        "expected": {"waist": 34.0, "inseam": 30.5, "rise": 12.5, "legOpening": 9.5},
+    },
+]
+
+
+CORPUS_SEED = 20240601
+SYNTHETIC_PER_KIND = 40
+
+FILLER = [
+    "Vintage piece in great condition, no holes or stains.",
+    "Smoke free home, ships within 2 days of purchase.",
+    "Single stitch hems, made in USA, tag is faded but readable.",
+    "Bundle and save on multiple items from my shop!",
+    "Colours may vary slightly due to lighting.",
+    "Machine wash cold, hang dry to keep the print crisp.",
+    "Message me with any questions before buying.",
+]
+EMOJIS = ["✨", "\U0001f525", "\U0001f4cf", "\U0001f44d", "\U0001f9f5", "⭐", "\U0001f4e6", "❤️"]
+TOP_LABELS = ["pit to pit", "p2p", "chest", "length", "back length", "shoulder", "sleeve length"]
+BOTTOM_LABELS = ["waist", "inseam", "front rise", "leg opening", "bottom hem"]
+UNITS = ["", '"', " in", " inches", "cm", "″"]
+
+
+def _measurement(rng: random.Random, label: str) -> str:
+    unit = rng.choice(UNITS)
+    value = rng.randint(35, 80) if unit == "cm" else rng.randint(7, 34)
+    if unit != "cm" and rng.random() < 0.2:
+        return f"{label} {value} 1/2{unit}"
+    if rng.random() < 0.3:
+        return f"{value}{unit} {label}"
+    return f"{label}: {value}{unit}"
+
+
+def synthetic_descriptions(seed: int = CORPUS_SEED, per_kind: int = SYNTHETIC_PER_KIND) -> List[str]:
+    """Deterministic long, emoji-heavy and dense inline descriptions."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(per_kind):
+        paragraphs = [" ".join(rng.choices(FILLER, k=6)) for _ in range(rng.randint(8, 14))]
+        paragraphs.insert(rng.randrange(len(paragraphs)), "\n".join(
+            _measurement(rng, label) for label in rng.sample(TOP_LABELS + BOTTOM_LABELS, 4)
+        ))
+        texts.append("\n\n".join(paragraphs))
+    for _ in range(per_kind):
+        lines = []
+        for label in rng.sample(TOP_LABELS + BOTTOM_LABELS, 5):
+            lines.append(" ".join(rng.choices(EMOJIS, k=3)) + f" {_measurement(rng, label)} " + rng.choice(EMOJIS))
+        texts.append("\n".join(lines))
+    for _ in range(per_kind):
+        labels = rng.sample(TOP_LABELS, 3) + rng.sample(BOTTOM_LABELS, 3)
+        separators = [" | ", ", ", "; ", " & ", " "]
+        text = ""
+        for label in labels:
+            text += _measurement(rng, label) + rng.choice(separators)
+        texts.append(rng.choice(FILLER) + " " + text.strip(" |,;&"))
+    return texts
+
+
+def corpus_segments() -> List[str]:
+    """Every non-empty line segment extract_tops/extract_bottoms would scan in the live examples."""
+    segments = []
+    for case in [*TOPS_EXAMPLES, *BOTTOMS_EXAMPLES]:
+        text = case["description"].lower().replace("\u201d", '"').replace("\u2033", '"')
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if line:
+                segments.extend(parser._split_measurement_segments(line))
+    return segments
+
+
+def legacy_labeled_value(line: str, label_pattern: str) -> Optional[float]:
+    """The pre-LabelMatcher per-family lookup: two regexes built per call, value after the label first."""
+    patterns = (
+        re.compile(
+            rf'\b{label_pattern}\b[^0-9\n]{{0,{MeasurementParser.LINE_LABEL_GAP}}}'
+            rf'{MeasurementParser.NUM}{MeasurementParser.UNIT}',
+            re.I,
+        ),
+        re.compile(
+            rf'{MeasurementParser.NUM}{MeasurementParser.UNIT}'
+            rf'[^a-z0-9\n]{{0,{MeasurementParser.LINE_LABEL_GAP}}}\b{label_pattern}\b',
+            re.I,
+        ),
+    )
+    for pattern in patterns:
+        match = pattern.search(line)
+        if not match:
+            continue
+        try:
+            return parser.to_inches(match.group("val"), match.group("unit") or "")
+        except Exception:
+            continue
+    return None
+
+
+LEGACY_FAMILIES = {
+    "p2p": MeasurementParser.P2P_LABELS,
+    "length": MeasurementParser.LENGTH_LABELS,
+    "waist": MeasurementParser.WAIST_LABELS,
+    "inseam": MeasurementParser.INSEAM_LABELS,
+    "rise": MeasurementParser.RISE_LABELS,
+    "legOpening": MeasurementParser.LEG_OPENING_LABELS,
+}
+
+
+def legacy_values(segment: str) -> Dict[str, float]:
+    values = {family: legacy_labeled_value(segment, pattern) for family, pattern in LEGACY_FAMILIES.items()}
+    return {family: value for family, value in values.items() if value is not None}
+
+
+def matcher_values(segment: str) -> Dict[str, float]:
+    values = parser.LABEL_MATCHER.values(segment, parser.to_inches)
+    return {family: value for family, value in values.items() if family in LEGACY_FAMILIES}
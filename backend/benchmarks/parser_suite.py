@@ -0,0 +1,189 @@
+"""Parser benchmark suite over a frozen description corpus.
+
+Times extract_tops, extract_bottoms, to_inches and _split_measurement_segments
+over the parser_corpus live examples plus its seeded synthetic descriptions,
+reports throughput and p99 latency, saves the results as JSON and exits
+non-zero when a result regresses past the threshold against the committed
+baseline (parser_baseline.json, recorded on one machine; re-save it with
+--save-baseline when the reference machine changes). Run from backend/:
+
+    python benchmarks/parser_suite.py [--repeat 10] [--rounds 5] [--threshold 0.25]
+                                      [--save-baseline | --require-baseline]
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from parser import parser  # noqa: E402
+from benchmarks.parser_corpus import BOTTOMS_EXAMPLES, TOPS_EXAMPLES, synthetic_descriptions  # noqa: E402
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+RESULTS_PATH = RESULTS_DIR / "parser.json"
+BASELINE_PATH = Path(__file__).resolve().parent / "parser_baseline.json"
+# Each timed batch runs about this long, so clock overhead stays small even for to_inches
+BATCH_TARGET_NS = 50_000
+
+
+def load_corpus() -> Dict[str, List[Any]]:
+    """The frozen inputs for each benchmarked function."""
+    descriptions = [case["description"] for case in [*TOPS_EXAMPLES, *BOTTOMS_EXAMPLES]]
+    descriptions.extend(synthetic_descriptions())
+
+    lines = []
+    numbers = []
+    for text in descriptions:
+        normalized = text.lower().replace("”", '"').replace("″", '"')
+        for raw_line in normalized.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            lines.append(line)
+            for segment in parser._split_measurement_segments(line):
+                for candidates in parser.LABEL_MATCHER.candidates(segment).values():
+                    numbers.extend((candidate.val, candidate.unit or "") for candidate in candidates)
+    return {"descriptions": descriptions, "lines": lines, "numbers": numbers}
+
+
+def corpus_fingerprint(corpus: Dict[str, List[Any]]) -> str:
+    return hashlib.sha256(json.dumps(corpus, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def benchmarks(corpus: Dict[str, List[Any]]) -> Dict[str, Tuple[Callable[[Any], Any], Sequence[Any]]]:
+    return {
+        "extract_tops": (parser.extract_tops, corpus["descriptions"]),
+        "extract_bottoms": (parser.extract_bottoms, corpus["descriptions"]),
+        "to_inches": (lambda pair: parser.to_inches(*pair), corpus["numbers"]),
+        "split_measurement_segments": (parser._split_measurement_segments, corpus["lines"]),
+    }
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    return sorted_samples[min(int(len(sorted_samples) * fraction), len(sorted_samples) - 1)]
+
+
+def measure(func: Callable[[Any], Any], inputs: Sequence[Any], repeat: int, rounds: int = 5) -> Dict[str, float]:
+    """Time ``repeat`` passes per round in batches and keep each metric's best round, like timeit.
+
+    Consecutive calls are timed together in batches sized from a warm-up pass;
+    the latency percentiles are per-call means over those batches.
+    """
+    clock = time.perf_counter_ns
+    started = clock()
+    for item in inputs:
+        func(item)
+    warm_up_ns = max(clock() - started, 1)
+    size = min(max(int(BATCH_TARGET_NS * len(inputs) / warm_up_ns), 1), len(inputs))
+    batches = [inputs[start:start + size] for start in range(0, len(inputs), size)]
+    best = None
+    for _ in range(rounds):
+        samples = []
+        calls = 0
+        total_ns = 0
+        for _ in range(repeat):
+            for batch in batches:
+                started = clock()
+                for item in batch:
+                    func(item)
+                elapsed = clock() - started
+                total_ns += elapsed
+                calls += len(batch)
+                samples.append(elapsed / len(batch))
+        samples.sort()
+        result = {
+            "calls": calls,
+            "batch": size,
+            "throughput": round(calls / (total_ns / 1e9), 1) if total_ns else 0.0,
+            "p50Us": round(_percentile(samples, 0.50) / 1e3, 2),
+            "p99Us": round(_percentile(samples, 0.99) / 1e3, 2),
+        }
+        if best is None:
+            best = result
+            continue
+        # Each metric keeps its best round, since noise only ever makes a round slower
+        best["throughput"] = max(best["throughput"], result["throughput"])
+        best["p50Us"] = min(best["p50Us"], result["p50Us"])
+        best["p99Us"] = min(best["p99Us"], result["p99Us"])
+    return best
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Describe every benchmark that lost more than ``threshold`` throughput or p99 latency."""
+    if current.get("corpus", {}).get("sha256") != baseline.get("corpus", {}).get("sha256"):
+        return ["corpus changed since the baseline was saved; re-run with --save-baseline"]
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        result = current["results"].get(name)
+        if result is None:
+            continue
+        if result["throughput"] < base["throughput"] * (1 - threshold):
+            regressions.append(f"{name}: throughput {result['throughput']:.0f}/s vs baseline {base['throughput']:.0f}/s")
+        if result["p99Us"] > base["p99Us"] * (1 + threshold):
+            regressions.append(f"{name}: p99 {result['p99Us']:.2f}us vs baseline {base['p99Us']:.2f}us")
+    return regressions
+
+
+def run_suite(repeat: int, rounds: int = 5) -> Dict[str, Any]:
+    corpus = load_corpus()
+    return {
+        "corpus": {"sha256": corpus_fingerprint(corpus), **{key: len(values) for key, values in corpus.items()}},
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "rounds": rounds,
+        "results": {
+            name: measure(func, inputs, repeat, rounds) for name, (func, inputs) in benchmarks(corpus).items()
+        },
+    }
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args_parser.add_argument("--repeat", type=int, default=10, help="timed passes over the corpus per round")
+    args_parser.add_argument("--rounds", type=int, default=5, help="rounds per benchmark; each metric keeps its best")
+    args_parser.add_argument("--threshold", type=float, default=0.25, help="allowed fractional regression")
+    args_parser.add_argument("--output", type=Path, default=RESULTS_PATH, help="where to write this run's JSON")
+    args_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON to compare against")
+    baseline_mode = args_parser.add_mutually_exclusive_group()
+    baseline_mode.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    baseline_mode.add_argument("--require-baseline", action="store_true", help="fail when there is no baseline")
+    args = args_parser.parse_args(argv)
+
+    current = run_suite(max(args.repeat, 1), max(args.rounds, 1))
+    _write_json(args.output, current)
+    corpus = current["corpus"]
+    print(f"{corpus['descriptions']} descriptions, {corpus['lines']} lines, {corpus['numbers']} numbers")
+    for name, result in current["results"].items():
+        print(f"  {name:<28} {result['throughput']:>12.0f}/s  p50 {result['p50Us']:8.2f}us  p99 {result['p99Us']:8.2f}us")
+
+    if args.save_baseline:
+        _write_json(args.baseline, current)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return 2 if args.require_baseline else 0
+
+    regressions = compare_results(current, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""Process-wide pool of warm Playwright Firefox browsers.
+
+Sync Playwright objects are bound to the thread that created them, so each
+pooled browser lives on its own long-lived worker thread. Search streams are
+submitted to the pool as jobs and run on whichever worker is free, reusing its
+already-launched browser instead of cold-starting Firefox per request. Streams
+use try_submit, which never queues behind a busy pool, so a search that finds
+no free slot starts at once on its own browser instead of waiting silently.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+from scraper import launch_browser, log_debug, navigation_count, new_browser_context
+
+
+def _read_int_env(name: str, default: int) -> int:
+    """Read a non-negative integer environment value with a safe fallback."""
+    try:
+        value = int(os.environ.get(name, default))
+        return value if value >= 0 else default
+    except Exception:
+        return default
+
+
+BROWSER_POOL_SIZE = _read_int_env("DEBOT_BROWSER_POOL_SIZE", 2)
+BROWSER_RECYCLE_NAVIGATIONS = _read_int_env("DEBOT_BROWSER_RECYCLE_NAVIGATIONS", 300)
+
+
+class BrowserSlot:
+    """A warm browser owned by a single pool worker thread."""
+
+    def __init__(self, index: int, pw, headless: bool = True):
+        self.index = index
+        self.pw = pw
+        self.headless = headless
+        self.browser = None
+        self.warm_ctx = None
+        self.busy = False
+        self.navigations = 0
+        self.leases = 0
+        self.recycles = 0
+        self.crashes = 0
+
+    def launch(self) -> None:
+        """Launch a fresh browser and pre-warm a context for the next lease."""
+        self.browser = launch_browser(self.pw, headless=self.headless)
+        self.navigations = 0
+        self.warm()
+
+    def warm(self) -> None:
+        """Create the context handed out on the next lease, if missing."""
+        if self.warm_ctx is not None or self.browser is None:
+            return
+        try:
+            self.warm_ctx = new_browser_context(self.browser)
+        except Exception as exc:
+            log_debug(f"[browser-pool] slot {self.index} failed to pre-warm context: {exc}")
+            self.warm_ctx = None
+
+    def is_healthy(self) -> bool:
+        """Return whether the slot's browser is still connected."""
+        try:
+            return bool(self.browser is not None and self.browser.is_connected())
+        except Exception:
+            return False
+
+    def new_context(self):
+        """Hand out the pre-warmed context, creating one if none is ready."""
+        if not self.is_healthy():
+            self.relaunch(crashed=True)
+        ctx = self.warm_ctx
+        self.warm_ctx = None
+        return ctx if ctx is not None else new_browser_context(self.browser)
+
+    def relaunch(self, crashed: bool = False) -> None:
+        """Close the current browser and launch a new one in this slot."""
+        if crashed:
+            self.crashes += 1
+        else:
+            self.recycles += 1
+        self.close()
+        self.launch()
+
+    def close(self) -> None:
+        """Close the warm context and browser, ignoring teardown errors."""
+        for closable in (self.warm_ctx, self.browser):
+            if closable is None:
+                continue
+            try:
+                closable.close()
+            except Exception:
+                pass
+        self.warm_ctx = None
+        self.browser = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize this slot for occupancy reporting."""
+        return {
+            "index": self.index,
+            "busy": self.busy,
+            "healthy": self.is_healthy(),
+            "navigations": self.navigations,
+            "leases": self.leases,
+            "recycles": self.recycles,
+            "crashes": self.crashes,
+        }
+
+
+class BrowserPool:
+    """Lease warm browsers to search jobs running on dedicated worker threads."""
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_navigations: int = BROWSER_RECYCLE_NAVIGATIONS,
+        headless: bool = True,
+    ):
+        self.size = max(size, 0)
+        self.max_navigations = max_navigations
+        self.headless = headless
+        self._jobs: "queue.Queue[Optional[tuple[Callable[[BrowserSlot], Any], Future]]]" = queue.Queue()
+        self._slots: List[Optional[BrowserSlot]] = [None] * self.size
+        self._threads: List[threading.Thread] = []
+        # Jobs submitted but not yet finished; try_submit only leases below self.size
+        self._leased = 0
+        self._lease_lock = threading.Lock()
+        self._running = False
+        self._started_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Spawn one worker thread (and browser) per slot."""
+        if self._running:
+            return
+        self._running = True
+        self._started_at = time.time()
+        for index in range(self.size):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(index,),
+                name=f"debot-browser-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        log_debug(f"[browser-pool] started {self.size} warm browser slot(s)")
+
+    def is_running(self) -> bool:
+        """Return whether the pool accepts jobs."""
+        return self._running and self.size > 0
+
+    def submit(self, job: Callable[[BrowserSlot], Any]) -> Future:
+        """Queue a job to run on the next free slot's thread."""
+        if not self.is_running():
+            raise RuntimeError("Browser pool is not running")
+        future: Future = Future()
+        with self._lease_lock:
+            self._leased += 1
+        self._jobs.put((job, future))
+        return future
+
+    def try_submit(self, job: Callable[[BrowserSlot], Any]) -> Optional[Future]:
+        """Run a job on a free slot's thread, or return None when every slot is taken."""
+        if not self.is_running():
+            return None
+        with self._lease_lock:
+            if self._leased >= self.size:
+                return None
+            self._leased += 1
+        future: Future = Future()
+        self._jobs.put((job, future))
+        return future
+
+    def _release(self) -> None:
+        with self._lease_lock:
+            self._leased -= 1
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Stop accepting jobs and close every pooled browser."""
+        if not self._running:
+            return
+        self._running = False
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        """Report pool occupancy and per-slot health."""
+        slots = [slot.stats() for slot in self._slots if slot is not None]
+        busy = sum(1 for slot in slots if slot["busy"])
+        return {
+            "running": self.is_running(),
+            "size": self.size,
+            "ready": len(slots),
+            "busy": busy,
+            "idle": len(slots) - busy,
+            "queued": self._jobs.qsize(),
+            "maxNavigations": self.max_navigations,
+            "slots": slots,
+        }
+
+    def _maintain(self, slot: BrowserSlot) -> None:
+        """Health-check a slot between leases, recycling it when needed."""
+        try:
+            if not slot.is_healthy():
+                log_debug(f"[browser-pool] slot {slot.index} browser disconnected; relaunching")
+                slot.relaunch(crashed=True)
+            elif self.max_navigations and slot.navigations >= self.max_navigations:
+                log_debug(f"[browser-pool] slot {slot.index} recycled after {slot.navigations} navigations")
+                slot.relaunch()
+            else:
+                slot.warm()
+        except Exception as exc:
+            log_debug(f"[browser-pool] slot {slot.index} maintenance failed: {exc}")
+
+    def _worker(self, index: int) -> None:
+        """Own one browser for the pool's lifetime and run queued jobs on it."""
+        with sync_playwright() as pw:
+            slot = BrowserSlot(index, pw, headless=self.headless)
+            try:
+                slot.launch()
+            except Exception as exc:
+                log_debug(f"[browser-pool] slot {index} failed to launch: {exc}")
+            self._slots[index] = slot
+
+            try:
+                while True:
+                    entry = self._jobs.get()
+                    if entry is None:
+                        break
+
+                    job, future = entry
+                    if not future.set_running_or_notify_cancel():
+                        self._release()
+                        continue
+
+                    slot.busy = True
+                    slot.leases += 1
+                    navigations_before = navigation_count()
+                    result = error = None
+                    try:
+                        result = job(slot)
+                    except BaseException as exc:
+                        error = exc
+                    finally:
+                        slot.navigations += navigation_count() - navigations_before
+                        slot.busy = False
+                        self._maintain(slot)
+                        self._release()
+                    # Resolve only once the slot is free again, so a done job means a leasable slot
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+            finally:
+                slot.close()
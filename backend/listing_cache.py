@@ -0,0 +1,607 @@
+"""Durable caches of scraped Depop data.
+
+Parsed listings are stored in SQLite (WAL mode) so repeat searches with
+different measurement targets can skip listing navigations entirely. Writes
+are buffered and flushed in batches by a background thread, and each field
+carries its own timestamp so volatile fields such as price expire sooner than
+stable ones such as the description.
+
+Seller sold counts live in the same database behind a small in-memory LRU, so
+browse searches can apply the sold-count gate without reopening profiles.
+Seller shop watermarks record the newest listing URLs seen per (seller, group,
+gender), letting repeat seller searches crawl only what was listed since.
+A negative cache remembers listings not worth opening again (sold, too old,
+no measurements, failed to parse) so collected links can be filtered before
+any navigation.
+"""
+
+import datetime as dt
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from singleflight import normalize_flight_url
+
+
+LISTING_CACHE_PATH = os.environ.get("DEBOT_LISTING_CACHE_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".debot_listings.sqlite3"
+)
+LISTING_CACHE_ENABLED = (os.environ.get("DEBOT_LISTING_CACHE") or "on").strip().lower() not in {"0", "false", "no", "off"}
+# Seconds each cached field stays fresh; a listing is served only while all of them are
+LISTING_FIELD_TTLS: Dict[str, float] = {
+    "price": 6 * 3600,
+    "description": 14 * 86400,
+    "image": 14 * 86400,
+    "sizeLabel": 14 * 86400,
+    "seller": 30 * 86400,
+    "listedAt": 30 * 86400,
+    "measurements": 14 * 86400,
+    "category": 30 * 86400,
+    "gender": 30 * 86400,
+}
+# Fields recomputable from the others: optional for freshness and dropped once stale
+LISTING_DERIVED_FIELDS = {"measurements"}
+# Fields that must stay within their TTL even when a caller accepts stale listings
+LISTING_VOLATILE_FIELDS = {"price"}
+# The category and gender a listing was crawled under; optional for freshness, as older entries lack them
+LISTING_ORIGIN_FIELDS = {"category", "gender"}
+LISTING_CACHE_FLUSH_INTERVAL_SECONDS = 2.0
+LISTING_CACHE_BATCH_SIZE = 50
+LISTING_CACHE_SEARCH_STATS_LIMIT = 64
+SELLER_STATS_TTL_SECONDS = 24 * 3600
+SELLER_STATS_MAX_ENTRIES = 5_000
+# Older watermarks trigger a full crawl, which also bounds how stale merged listings can be
+WATERMARK_TTL_SECONDS = 14 * 86400
+WATERMARK_MAX_URLS = 500
+# Seconds a negative verdict holds; sold and too-old listings never recover, descriptions can be edited
+NEGATIVE_REASON_TTLS: Dict[str, float] = {
+    "sold": 30 * 86400,
+    "too_old": 30 * 86400,
+    "no_measurements": 3 * 86400,
+    "parse_failed": 6 * 3600,
+}
+# Verdicts that rule a listing out of every category; no_measurements only rules out measured tops
+UNIVERSAL_NEGATIVE_REASONS = frozenset({"sold", "too_old", "parse_failed"})
+NEGATIVE_LOOKUP_CHUNK = 500
+
+
+def _age_days(listed_at: Optional[str]) -> Optional[float]:
+    """Recompute ageDays from a stored ISO listedAt."""
+    if not listed_at:
+        return None
+    try:
+        listed = dt.datetime.fromisoformat(str(listed_at).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if listed.tzinfo is None:
+        listed = listed.replace(tzinfo=dt.timezone.utc)
+    delta = dt.datetime.now(dt.timezone.utc) - listed
+    return max(delta.total_seconds() / 86400.0, 0.0)
+
+
+class ListingCache:
+    """SQLite-backed listing store with write-behind batching and per-field TTLs."""
+
+    def __init__(
+        self,
+        path: str,
+        field_ttls: Optional[Dict[str, float]] = None,
+        flush_interval: float = LISTING_CACHE_FLUSH_INTERVAL_SECONDS,
+        batch_size: int = LISTING_CACHE_BATCH_SIZE,
+    ):
+        self.path = path
+        self.field_ttls = dict(LISTING_FIELD_TTLS if field_ttls is None else field_ttls)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[Dict[str, Any], Dict[str, float]]] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._search_stats: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def open(self) -> None:
+        """Open the database and start the write-behind flusher."""
+        if self._conn is not None:
+            return
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            "url TEXT PRIMARY KEY, fields TEXT NOT NULL, field_times TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        conn.commit()
+        self._conn = conn
+        self._stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="listing-cache-flusher", daemon=True)
+        self._flusher.start()
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._conn is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=10)
+            self._flusher = None
+        self.flush()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+
+    def _flush_loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered listings in one transaction; return how many were written."""
+        with self._lock:
+            if self._conn is None or not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            rows = []
+            for key, (fields, times) in batch.items():
+                stored = self._read_row(key)
+                merged_fields, merged_times = stored if stored else ({}, {})
+                merged_fields.update(fields)
+                merged_times.update(times)
+                rows.append((key, json.dumps(merged_fields), json.dumps(merged_times), max(times.values(), default=0.0)))
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO listings (url, fields, field_times, updated_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            return len(rows)
+
+    def _read_row(self, key: str) -> Optional[Tuple[Dict[str, Any], Dict[str, float]]]:
+        row = self._conn.execute("SELECT fields, field_times FROM listings WHERE url = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0]), json.loads(row[1])
+        except ValueError:
+            return None
+
+    def _lookup(self, key: str) -> Optional[Tuple[Dict[str, Any], Dict[str, float]]]:
+        with self._lock:
+            if self._conn is None:
+                return None
+            pending = self._pending.get(key)
+            stored = self._read_row(key)
+        if pending is None:
+            return stored
+        fields, times = stored if stored else ({}, {})
+        return {**fields, **pending[0]}, {**times, **pending[1]}
+
+    def _is_fresh(self, times: Dict[str, float], now: float, allow_stale: bool = False,
+                  refreshed: Iterable[str] = ()) -> bool:
+        return all(
+            field in refreshed or field in times and (
+                (allow_stale and field not in LISTING_VOLATILE_FIELDS) or now - float(times[field]) <= ttl
+            )
+            for field, ttl in self.field_ttls.items()
+            if field not in LISTING_DERIVED_FIELDS | LISTING_ORIGIN_FIELDS
+        )
+
+    def get(self, url: str, allow_stale: bool = False,
+            fresh: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Return a cached listing whose fields are all within their TTLs, else None.
+
+        ``allow_stale`` relaxes the TTLs of stable fields such as the description;
+        volatile fields such as price must still be fresh, so the listing is re-parsed.
+        ``fresh`` holds field values just read elsewhere (a grid tile's price); they
+        replace the cached ones and count as fresh.
+        """
+        entry = self._lookup(normalize_flight_url(url))
+        if entry is None:
+            return None
+        now = time.time()
+        fresh = fresh or {}
+        if not self._is_fresh(entry[1], now, allow_stale, fresh):
+            return None
+        item = {**entry[0], **fresh}
+        for field in LISTING_DERIVED_FIELDS:
+            if field in item and now - float(entry[1].get(field, 0.0)) > self.field_ttls.get(field, 0.0):
+                del item[field]
+        item["url"] = url
+        item["ageDays"] = _age_days(item.get("listedAt"))
+        return item
+
+    def has_fresh(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def put(self, url: str, item: Dict[str, Any]) -> None:
+        """Buffer a parsed listing for the next batched write."""
+        if self._conn is None or not item:
+            return
+        now = time.time()
+        fields = {field: item.get(field) for field in self.field_ttls if field in item}
+        if not fields:
+            return
+        times = {field: now for field in fields}
+        key = normalize_flight_url(url)
+        with self._lock:
+            previous = self._pending.get(key)
+            if previous:
+                fields = {**previous[0], **fields}
+                times = {**previous[1], **times}
+            self._pending[key] = (fields, times)
+            pending_count = len(self._pending)
+        if pending_count >= self.batch_size:
+            self._wake.set()
+
+    def _unexpired_fields(self, fields: Dict[str, Any], times: Dict[str, float], now: float) -> Optional[Dict[str, Any]]:
+        """Return fields without expired volatile or derived ones, or None once a stable field has expired."""
+        stable_fresh = all(
+            field in times and now - float(times[field]) <= ttl
+            for field, ttl in self.field_ttls.items()
+            if field not in LISTING_DERIVED_FIELDS | LISTING_VOLATILE_FIELDS | LISTING_ORIGIN_FIELDS
+        )
+        if not stable_fresh:
+            return None
+        return {
+            field: value for field, value in fields.items()
+            if field not in LISTING_VOLATILE_FIELDS | LISTING_DERIVED_FIELDS
+            or now - float(times.get(field, 0.0)) <= self.field_ttls.get(field, 0.0)
+        }
+
+    def scan(self, page_size: int = 500, fresh_only: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (url key, stored fields) for every listing, paging by url so writes can interleave.
+
+        ``fresh_only`` skips listings with an expired stable field and leaves out
+        expired volatile and derived fields, such as a stale price.
+        """
+        self.flush()
+        after = ""
+        while True:
+            with self._lock:
+                if self._conn is None:
+                    return
+                rows = self._conn.execute(
+                    "SELECT url, fields, field_times FROM listings WHERE url > ? ORDER BY url LIMIT ?",
+                    (after, page_size),
+                ).fetchall()
+            if not rows:
+                return
+            now = time.time()
+            for url, fields, times in rows:
+                try:
+                    fields = json.loads(fields)
+                    if fresh_only:
+                        fields = self._unexpired_fields(fields, json.loads(times), now)
+                except ValueError:
+                    continue
+                if fields is not None:
+                    yield url, fields
+            after = rows[-1][0]
+
+    def record(self, search_id: Optional[str], hit: bool) -> None:
+        """Count a lookup globally and for one search."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if not search_id:
+                return
+            stats = self._search_stats.pop(str(search_id), None) or {"hits": 0, "misses": 0}
+            stats["hits" if hit else "misses"] += 1
+            self._search_stats[str(search_id)] = stats
+            while len(self._search_stats) > LISTING_CACHE_SEARCH_STATS_LIMIT:
+                self._search_stats.popitem(last=False)
+
+    def search_stats(self, search_id: Optional[str]) -> Optional[Dict[str, int]]:
+        with self._lock:
+            stats = self._search_stats.get(str(search_id or ""))
+            return dict(stats) if stats else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self._conn is not None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "pendingWrites": len(self._pending),
+            }
+
+
+class SellerStatsCache:
+    """Seller sold counts with a TTL, an in-memory LRU and write-through SQLite persistence."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = SELLER_STATS_TTL_SECONDS,
+        max_entries: int = SELLER_STATS_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(seller: str) -> str:
+        return (seller or "").strip().lstrip("@").lower()
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def open(self) -> None:
+        """Open the database, drop expired rows and warm the LRU with the newest entries."""
+        if self._conn is not None:
+            return
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS seller_stats ("
+            "seller TEXT PRIMARY KEY, sold_count INTEGER NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        with conn:
+            conn.execute("DELETE FROM seller_stats WHERE fetched_at < ?", (time.time() - self.ttl_seconds,))
+        rows = conn.execute(
+            "SELECT seller, sold_count, fetched_at FROM seller_stats ORDER BY fetched_at DESC LIMIT ?",
+            (self.max_entries,),
+        ).fetchall()
+        with self._lock:
+            self._conn = conn
+            for seller, sold_count, fetched_at in reversed(rows):
+                self._entries[seller] = (int(sold_count), float(fetched_at))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._entries.clear()
+
+    def get(self, seller: str) -> Optional[int]:
+        """Return a seller's sold count while it is within the TTL, else None."""
+        key = self._key(seller)
+        with self._lock:
+            if self._conn is None or not key:
+                return None
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[1] > self.ttl_seconds:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, seller: str, sold_count: Optional[int]) -> None:
+        """Record a sold count read from any seller page."""
+        key = self._key(seller)
+        if sold_count is None or not key:
+            return
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            self._entries[key] = (int(sold_count), now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO seller_stats (seller, sold_count, fetched_at) VALUES (?, ?, ?)",
+                    (key, int(sold_count), now),
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self._conn is not None,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class WatermarkStore:
+    """Newest listing URLs seen on each seller shop grid, keyed by (seller, group, gender)."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = WATERMARK_TTL_SECONDS,
+        max_urls: int = WATERMARK_MAX_URLS,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_urls = max_urls
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(seller: str, group: Optional[str], gender: Optional[str]) -> str:
+        return "|".join([
+            (seller or "").strip().lstrip("@").lower(),
+            (group or "").strip().lower(),
+            (gender or "").strip().lower(),
+        ])
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def open(self) -> None:
+        if self._conn is not None:
+            return
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS seller_watermarks ("
+            "shop TEXT PRIMARY KEY, urls TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        with conn:
+            conn.execute("DELETE FROM seller_watermarks WHERE updated_at < ?", (time.time() - self.ttl_seconds,))
+        with self._lock:
+            self._conn = conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def known_urls(self, seller: str, group: Optional[str], gender: Optional[str]) -> List[str]:
+        """Return the shop's known listing URLs, newest first, or [] when none are recent enough."""
+        with self._lock:
+            if self._conn is None:
+                return []
+            row = self._conn.execute(
+                "SELECT urls, updated_at FROM seller_watermarks WHERE shop = ?",
+                (self._key(seller, group, gender),),
+            ).fetchone()
+        if row is None or time.time() - float(row[1]) > self.ttl_seconds:
+            return []
+        try:
+            return [str(url) for url in json.loads(row[0])]
+        except ValueError:
+            return []
+
+    def advance(self, seller: str, group: Optional[str], gender: Optional[str], new_urls: List[str]) -> None:
+        """Put newly collected URLs ahead of the known ones and store the capped list."""
+        merged: List[str] = []
+        for url in [*new_urls, *self.known_urls(seller, group, gender)]:
+            if url not in merged:
+                merged.append(url)
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO seller_watermarks (shop, urls, updated_at) VALUES (?, ?, ?)",
+                    (self._key(seller, group, gender), json.dumps(merged[: self.max_urls]), time.time()),
+                )
+
+
+class NegativeCache:
+    """Listings known not to be worth opening, each with a reason code and a reason-specific TTL."""
+
+    def __init__(self, path: str, reason_ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.reason_ttls = dict(NEGATIVE_REASON_TTLS if reason_ttls is None else reason_ttls)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._search_skips: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self.skips: Dict[str, int] = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def open(self) -> None:
+        """Open the database and drop verdicts whose reason TTL has passed."""
+        if self._conn is not None:
+            return
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS negative_listings ("
+            "url TEXT PRIMARY KEY, reason TEXT NOT NULL, recorded_at REAL NOT NULL)"
+        )
+        now = time.time()
+        with conn:
+            for reason, ttl in self.reason_ttls.items():
+                conn.execute(
+                    "DELETE FROM negative_listings WHERE reason = ? AND recorded_at < ?",
+                    (reason, now - ttl),
+                )
+        with self._lock:
+            self._conn = conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def put(self, url: str, reason: str) -> None:
+        """Record why a listing should not be opened again."""
+        if reason not in self.reason_ttls:
+            raise ValueError(f"Unknown negative cache reason: {reason}")
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO negative_listings (url, reason, recorded_at) VALUES (?, ?, ?)",
+                    (normalize_flight_url(url), reason, time.time()),
+                )
+
+    def reasons(self, urls: List[str]) -> Dict[str, str]:
+        """Map each URL with a live negative verdict to its reason code."""
+        keys = {url: normalize_flight_url(url) for url in urls}
+        found: Dict[str, Tuple[str, float]] = {}
+        with self._lock:
+            if self._conn is None or not keys:
+                return {}
+            distinct = list(set(keys.values()))
+            for start in range(0, len(distinct), NEGATIVE_LOOKUP_CHUNK):
+                chunk = distinct[start:start + NEGATIVE_LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT url, reason, recorded_at FROM negative_listings "
+                    f"WHERE url IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                found.update({row[0]: (row[1], float(row[2])) for row in rows})
+        now = time.time()
+        verdicts = {}
+        for url, key in keys.items():
+            entry = found.get(key)
+            if entry and now - entry[1] <= self.reason_ttls.get(entry[0], 0):
+                verdicts[url] = entry[0]
+        return verdicts
+
+    def record_skips(self, search_id: Optional[str], skipped: Dict[str, int]) -> None:
+        """Count links skipped by reason, globally and for one search."""
+        if not skipped:
+            return
+        with self._lock:
+            for reason, count in skipped.items():
+                self.skips[reason] = self.skips.get(reason, 0) + count
+            if not search_id:
+                return
+            counts = self._search_skips.pop(str(search_id), None) or {}
+            for reason, count in skipped.items():
+                counts[reason] = counts.get(reason, 0) + count
+            self._search_skips[str(search_id)] = counts
+            while len(self._search_skips) > LISTING_CACHE_SEARCH_STATS_LIMIT:
+                self._search_skips.popitem(last=False)
+
+    def search_skips(self, search_id: Optional[str]) -> Optional[Dict[str, int]]:
+        with self._lock:
+            counts = self._search_skips.get(str(search_id or ""))
+            return dict(counts) if counts else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"enabled": self._conn is not None, "skips": dict(self.skips)}
+
+
+LISTING_CACHE = ListingCache(LISTING_CACHE_PATH)
+SELLER_STATS = SellerStatsCache(LISTING_CACHE_PATH)
+SELLER_WATERMARKS = WatermarkStore(LISTING_CACHE_PATH)
+NEGATIVE_CACHE = NegativeCache(LISTING_CACHE_PATH)
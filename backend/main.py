@@ -2,13 +2,16 @@
 
 import sys
 import asyncio
+import contextvars
 import datetime as dt
 import json
+import os
 import queue
 import random
 import re
 import threading
 import time
+from contextlib import asynccontextmanager, contextmanager
 from typing import Dict, Any, Optional, Callable
 
 from fastapi import FastAPI, Request, Body
@@ -16,7 +19,30 @@ from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from playwright.sync_api import sync_playwright
 
+import async_scraper
+from async_scraper import AsyncBrowserManager
+from browser_pool import BrowserPool, BROWSER_POOL_SIZE
+from pacing import (
+    NAVIGATION_BREAKER,
+    NAVIGATION_PACER,
+    NAVIGATION_SCHEDULER,
+    PACING_STATE,
+    current_navigation_owner,
+    navigation_owner,
+)
+from asset_cache import ASSET_CACHE_ENABLED, STATIC_ASSETS
+from listing_cache import (
+    LISTING_CACHE,
+    LISTING_CACHE_ENABLED,
+    LISTING_VOLATILE_FIELDS,
+    NEGATIVE_CACHE,
+    SELLER_STATS,
+    SELLER_WATERMARKS,
+    UNIVERSAL_NEGATIVE_REASONS,
+)
+from measurement_index import MEASUREMENT_INDEX, MEASUREMENT_INDEX_ENABLED
 from parser import parser
+from singleflight import normalize_flight_url
 from scraper import (
     build_seller_url,
     build_browse_url,
@@ -27,15 +53,25 @@ from scraper import (
     remove_sold_sections,
     collect_listing_links,
     parse_listing,
+    begin_listing_navigation,
     extract_seller_sold_count,
     extract_retry_after_seconds,
     create_browser_context,
+    new_browser_context,
     get_following_list,
     guarded_goto,
+    has_overlay_guard,
     log_debug,
+    HTTP_FETCH_STATS,
+    LISTING_FETCH_MODE,
+    LISTING_FLIGHTS,
+    LISTING_XHR_HARVEST,
+    OVERLAY_SUPPRESSIONS,
+    SELLER_PROFILE_FLIGHTS,
     RateLimitError,
     SearchCancelled,
     raise_if_cancelled,
+    record_navigation_success,
     sleep_with_cancel,
 )
 
@@ -46,7 +82,64 @@ if sys.platform.startswith("win"):
     except Exception:
         pass
 
-app = FastAPI()
+# Warm browsers shared by every headless search stream (started with the app)
+BROWSER_POOL: Optional[BrowserPool] = None
+# Single async Playwright driver/browser shared by every async-engine search
+ASYNC_BROWSER = AsyncBrowserManager()
+SEARCH_ENGINES = {"sync", "async"}
+SEARCH_ENGINE = (os.environ.get("DEBOT_SEARCH_ENGINE") or "sync").strip().lower()
+# Navigate the next browse listing in a second tab while the current one is extracted
+LISTING_PREFETCH = (os.environ.get("DEBOT_LISTING_PREFETCH") or "").strip().lower() in {"1", "true", "yes", "on"}
+# Drop grid tiles whose size badge already fails the size range before opening them
+GRID_PREFILTER = (os.environ.get("DEBOT_GRID_PREFILTER") or "on").strip().lower() not in {"0", "false", "no", "off"}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Restore pacing state and start the warm browser pool on startup; close it on shutdown."""
+    global BROWSER_POOL, RECENT_RATE_LIMIT_UNTIL_TS
+    PACING_STATE.load()
+    if LISTING_CACHE_ENABLED:
+        LISTING_CACHE.open()
+        SELLER_STATS.open()
+        SELLER_WATERMARKS.open()
+        NEGATIVE_CACHE.open()
+    if ASSET_CACHE_ENABLED:
+        STATIC_ASSETS.open()
+    if MEASUREMENT_INDEX_ENABLED:
+        MEASUREMENT_INDEX.open()
+        if LISTING_CACHE.is_open:
+            threading.Thread(
+                target=MEASUREMENT_INDEX.load,
+                args=(LISTING_CACHE, NEGATIVE_CACHE if NEGATIVE_CACHE.is_open else None),
+                name="measurement-index-load",
+                daemon=True,
+            ).start()
+    RECENT_RATE_LIMIT_UNTIL_TS = max(
+        RECENT_RATE_LIMIT_UNTIL_TS, float(PACING_STATE.extras.get("recentRateLimitUntil") or 0.0)
+    )
+    if NAVIGATION_BREAKER.state == "open":
+        log_debug(f"[pacing] Resuming saved cooldown until {NAVIGATION_BREAKER.retry_available_at}")
+    if BROWSER_POOL_SIZE > 0:
+        BROWSER_POOL = BrowserPool(size=BROWSER_POOL_SIZE)
+        BROWSER_POOL.start()
+    try:
+        yield
+    finally:
+        pool, BROWSER_POOL = BROWSER_POOL, None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown)
+        await ASYNC_BROWSER.close()
+        PACING_STATE.flush()
+        await asyncio.to_thread(LISTING_CACHE.close)
+        SELLER_STATS.close()
+        SELLER_WATERMARKS.close()
+        NEGATIVE_CACHE.close()
+        STATIC_ASSETS.close()
+        MEASUREMENT_INDEX.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -67,15 +160,43 @@ MAX_LISTING_AGE_DAYS = 80
 RECENT_RATE_LIMIT_PACING_WINDOW_SECONDS = 180
 RECENT_RATE_LIMIT_JITTER_RANGE_SECONDS = (1.25, 3.0)
 MEASUREMENT_CATEGORIES = {"tops", "coats-jackets"}
+# A loaded listing page with none of these is unparsable rather than a failed load
+LISTING_EVIDENCE_FIELDS = ("description", "price", "image", "seller")
 SUPPORTED_CATEGORIES = MEASUREMENT_CATEGORIES | {"bottoms", "footwear", "accessories"}
 RECENT_RATE_LIMIT_UNTIL_TS = 0.0
+# Session recovery tiers, cheapest first, with how often each ran and what it cost
+RECOVERY_TIERS = ("page", "context", "browser")
+RECOVERY_STATS: Dict[str, Dict[str, float]] = {
+    tier: {"count": 0, "totalSeconds": 0.0, "lastSeconds": 0.0} for tier in RECOVERY_TIERS
+}
 
 # SSE helpers
 SSE_PREAMBLE = (":" + (" " * 2048) + "\n").encode("utf-8")
+SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+    "Access-Control-Allow-Origin": "*",
+}
 
 
 def _sse(data: Dict[str, Any]) -> bytes:
-    """Encode data as an SSE event."""
+    """Encode data as an SSE event; progress events carry pacing and done events listing-cache counts.
+
+    Progress and done events of a search that skipped negatively cached links also carry the skip counts.
+    """
+    if data.get("type") == "done" and data.get("searchId") and "listingCache" not in data:
+        cache_stats = LISTING_CACHE.search_stats(data["searchId"])
+        if cache_stats:
+            data = {**data, "listingCache": cache_stats}
+    if data.get("type") in {"progress", "done"} and data.get("searchId") and "negativeSkips" not in data:
+        skips = NEGATIVE_CACHE.search_skips(data["searchId"])
+        if skips:
+            data = {**data, "negativeSkips": skips}
+    if data.get("type") == "progress" and "pacing" not in data:
+        data = {**data, "pacing": NAVIGATION_PACER.stats()}
+        if data.get("searchId"):
+            data["navigationWait"] = NAVIGATION_SCHEDULER.wait_stats(data["searchId"])
     return f"data: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
 
 
@@ -206,11 +327,150 @@ def _listing_exceeds_age_window(item: Dict[str, Any] | None, max_age_days: int =
         return False
 
 
+def _without_harvested_sold(links: list[str], listing_data: Dict[str, Dict[str, Any]]) -> list[str]:
+    """Drop links whose harvested grid record already marks them sold, remembering them as sold."""
+    kept = []
+    for url in links:
+        if (listing_data.get(url) or {}).get("sold"):
+            _remember_negative(url, "sold")
+        else:
+            kept.append(url)
+    return kept
+
+
+def _harvested_past_age_window(listing_data: Dict[str, Dict[str, Any]], url: str) -> Dict[str, Any] | None:
+    """Return the harvested grid record when it already places a listing past the age window."""
+    record = listing_data.get(url)
+    if not _listing_exceeds_age_window(record):
+        return None
+    _remember_negative(url, "too_old")
+    return record
+
+
+def _negative_reason(item: Dict[str, Any] | None) -> str | None:
+    """Return why no later search needs to open this parsed listing again, if anything.
+
+    A None item means the page never loaded (timeout, closed page), which may be
+    transient and is not remembered; only a loaded page with no listing evidence is.
+    """
+    if item is None:
+        return None
+    if not any(item.get(field) for field in LISTING_EVIDENCE_FIELDS):
+        return "parse_failed"
+    if item.get("sold"):
+        return "sold"
+    if _listing_exceeds_age_window(item):
+        return "too_old"
+    record = _measurement_record(item)
+    if parser.value(record, "p2p") is None and parser.value(record, "length") is None:
+        return "no_measurements"
+    return None
+
+
+def _filter_negative_links(links: list[str], search_id: str, category: str = "tops",
+                           newest_first: bool = False) -> tuple[list[str], bool]:
+    """Drop negatively cached links before navigation; return kept links and whether the age window was reached.
+
+    On newest-first seller grids a too-old link also rules out every link after it.
+    """
+    reasons = NEGATIVE_CACHE.reasons(links)
+    if not reasons:
+        return links, False
+    kept = []
+    skipped: Dict[str, int] = {}
+    past_age_window = False
+    for url in links:
+        reason = reasons.get(url)
+        if reason == "no_measurements" and category not in MEASUREMENT_CATEGORIES:
+            reason = None
+        if reason is None:
+            kept.append(url)
+            continue
+        skipped[reason] = skipped.get(reason, 0) + 1
+        if newest_first and reason == "too_old":
+            past_age_window = True
+            break
+    NEGATIVE_CACHE.record_skips(search_id, skipped)
+    return kept, past_age_window
+
+
+def _cached_listing(url: str, search_id: str, allow_stale: bool = False,
+                   fresh: Dict[str, Any] | None = None) -> Dict[str, Any] | None:
+    """Return a fresh cached listing, counting the lookup toward the search's done event."""
+    if not LISTING_CACHE.is_open:
+        return None
+    item = LISTING_CACHE.get(url, allow_stale=allow_stale, fresh=fresh)
+    LISTING_CACHE.record(search_id, item is not None)
+    return item
+
+
+def _known_listing(url: str, listing_data: Dict[str, Dict[str, Any]], search_id: str,
+                   allow_stale: bool = False) -> Dict[str, Any] | None:
+    """Return the listing without navigating: a harvested record past the age window or a cached parse.
+
+    A price read from the grid for this search replaces the cached one, so it need not be re-parsed.
+    """
+    record = listing_data.get(url) or {}
+    fresh = {field: record[field] for field in LISTING_VOLATILE_FIELDS if record.get(field)}
+    return _harvested_past_age_window(listing_data, url) or _cached_listing(
+        url, search_id, allow_stale=allow_stale, fresh=fresh,
+    )
+
+
+def _remember_negative(url: str, reason: str) -> None:
+    """Record a negative verdict and drop the listing from the measurement index if it rules out every search."""
+    NEGATIVE_CACHE.put(url, reason)
+    if reason in UNIVERSAL_NEGATIVE_REASONS:
+        MEASUREMENT_INDEX.remove(normalize_flight_url(url))
+
+
+def _remember_listing(url: str, item: Dict[str, Any] | None, category: str = "tops",
+                      gender: str | None = None) -> Dict[str, Any] | None:
+    """Queue a freshly parsed listing for the listing cache, note any negative verdict and pass it through.
+
+    The category and gender it was crawled under are stored with it, so the
+    measurement index only offers it to searches of that category.
+    """
+    reason = _negative_reason(item)
+    if item and reason != "parse_failed":
+        record = _measurement_record(item)
+        stored = {**item, "category": category, "gender": gender}
+        LISTING_CACHE.put(url, stored)
+        if reason not in UNIVERSAL_NEGATIVE_REASONS:
+            MEASUREMENT_INDEX.add(normalize_flight_url(url), stored, record)
+    if reason:
+        _remember_negative(url, reason)
+    return item
+
+
+def _merge_known_seller_links(seller, group, gender, links, known_links, listing_data, capacity) -> list[str]:
+    """Advance the shop watermark and follow the newly collected links with the still-listed known ones.
+
+    A known link counts as still listed only when this crawl saw it on the grid
+    (its tile or product-list record is in listing_data) and not as sold.
+    """
+    fresh = _without_harvested_sold(links, listing_data)
+    SELLER_WATERMARKS.advance(seller, group, gender, fresh)
+    fresh_set = set(fresh)
+    known = [
+        url for url in _without_harvested_sold(known_links, listing_data)
+        if url not in fresh_set and url in listing_data
+    ]
+    return (fresh + known)[:capacity]
+
+
+async def _remember_listing_async(url: str, pending, category: str = "tops",
+                                  gender: str | None = None) -> Dict[str, Any] | None:
+    """Await a listing parse and queue the result for the listing cache."""
+    return _remember_listing(url, await pending, category, gender)
+
+
 def _mark_recent_rate_limit(delay_seconds: int) -> None:
     """Extend the pacing window after a detected rate limit."""
     global RECENT_RATE_LIMIT_UNTIL_TS
     pacing_until = time.time() + max(min(delay_seconds, RECENT_RATE_LIMIT_PACING_WINDOW_SECONDS), 0)
     RECENT_RATE_LIMIT_UNTIL_TS = max(RECENT_RATE_LIMIT_UNTIL_TS, pacing_until)
+    PACING_STATE.extras["recentRateLimitUntil"] = RECENT_RATE_LIMIT_UNTIL_TS
 
 
 def _sleep_request_jitter(should_cancel: Callable[[], bool], force: bool = False) -> None:
@@ -229,6 +489,25 @@ def _rate_limit_delay_for_attempt(exc: RateLimitError, attempt_index: int) -> in
     return max(floor_delay, hinted_delay)
 
 
+def _trip_rate_limit_breaker(exc: RateLimitError, attempt_index: int, on_rate_limit=None) -> int:
+    """Pause every search on a rate limit and return the shared seconds until retry."""
+    NAVIGATION_PACER.record_rate_limit(exc.retry_after_seconds)
+    delay = NAVIGATION_BREAKER.trip(
+        _rate_limit_delay_for_attempt(exc, min(attempt_index, len(RATE_LIMIT_RETRY_DELAYS) - 1))
+    )
+    _mark_recent_rate_limit(delay)
+    PACING_STATE.record_rate_limit()
+    source = current_navigation_owner()[0]
+    for search_id, notify in NAVIGATION_BREAKER.listeners():
+        if notify is on_rate_limit or search_id == source:
+            continue
+        try:
+            notify(1, len(RATE_LIMIT_RETRY_DELAYS), delay, exc, "another search is rate limited")
+        except Exception as notify_exc:
+            log_debug(f"[pacing] Could not notify search {search_id} of shared cooldown: {notify_exc}")
+    return delay
+
+
 def _is_transient_navigation_error(exc: Exception) -> bool:
     """Detect Playwright navigation errors that are safe to recover by rebuilding the session."""
     message = str(exc or "").lower()
@@ -260,6 +539,7 @@ def _run_with_rate_limit_retries(
         except SearchCancelled:
             raise
         except RateLimitError as exc:
+            delay = _trip_rate_limit_breaker(exc, attempt, on_rate_limit)
             if attempt >= len(RATE_LIMIT_RETRY_DELAYS):
                 raise RateLimitError(
                     f"Rate limited after {len(RATE_LIMIT_RETRY_DELAYS)} cooldown attempts while {label}.",
@@ -267,8 +547,6 @@ def _run_with_rate_limit_retries(
                     retry_after_seconds=exc.retry_after_seconds,
                 ) from exc
 
-            delay = _rate_limit_delay_for_attempt(exc, attempt)
-            _mark_recent_rate_limit(delay)
             if on_rate_limit:
                 on_rate_limit(attempt + 1, len(RATE_LIMIT_RETRY_DELAYS), delay, exc, label)
             log_debug(f"[stream] Rate limited during {label}; retrying in {delay}s")
@@ -290,6 +568,115 @@ def _run_with_rate_limit_retries(
                 before_retry(attempt + 1, len(TRANSIENT_NAVIGATION_RETRY_DELAYS), delay, exc, label)
 
 
+def _recovery_tier(exc: Optional[Exception], attempt: int) -> str:
+    """Pick the cheapest session reset likely to clear exc on this retry attempt."""
+    if isinstance(exc, RateLimitError):
+        # Rate limits stick to cookies/storage, so start from a fresh context
+        return "context" if attempt < len(RATE_LIMIT_RETRY_DELAYS) else "browser"
+    return RECOVERY_TIERS[min(max(attempt, 1), len(RECOVERY_TIERS)) - 1]
+
+
+def _record_recovery(tier: str, seconds: float) -> None:
+    """Accumulate how often a recovery tier ran and how long it took."""
+    stats = RECOVERY_STATS[tier]
+    stats["count"] += 1
+    stats["totalSeconds"] += seconds
+    stats["lastSeconds"] = seconds
+    log_debug(f"[stream] Recovered session with a new {tier} in {seconds:.2f}s")
+
+
+def _browser_connected(browser) -> bool:
+    try:
+        return bool(browser.is_connected())
+    except Exception:
+        return False
+
+
+def _recover_session(pw, slot, browser, ctx, page, tier: str, headless: bool, slowmo: int) -> tuple:
+    """Rebuild a sync session at the given tier, escalating when the cheaper tier fails."""
+    try:
+        page.close()
+    except Exception:
+        pass
+    if not _browser_connected(browser):
+        tier = "browser"
+
+    for current in RECOVERY_TIERS[RECOVERY_TIERS.index(tier):]:
+        started = time.perf_counter()
+        try:
+            if current == "page":
+                new_browser, new_ctx = browser, ctx
+            elif current == "context":
+                try:
+                    ctx.close()
+                except Exception:
+                    pass
+                new_browser = browser
+                new_ctx = slot.new_context() if slot is not None else new_browser_context(browser)
+            else:
+                _close_browser(browser, ctx, slot)
+                if slot is not None:
+                    slot.relaunch()
+                new_browser, new_ctx = _open_browser(pw, slot, headless, slowmo)
+            new_page = new_ctx.new_page()
+        except Exception as exc:
+            if current == RECOVERY_TIERS[-1]:
+                raise
+            log_debug(f"[stream] Session recovery with a new {current} failed; escalating: {exc}")
+            continue
+
+        _record_recovery(current, time.perf_counter() - started)
+        return new_browser, new_ctx, new_page
+
+
+@contextmanager
+def _playwright_for(slot):
+    """Yield the pooled slot's Playwright driver, or start a private one."""
+    if slot is not None:
+        yield slot.pw
+        return
+    with sync_playwright() as pw:
+        yield pw
+
+
+def _open_browser(pw, slot, headless: bool, slowmo: int) -> tuple:
+    """Lease a warm context from a pooled slot, or cold-launch a private browser."""
+    if slot is not None:
+        return slot.browser, slot.new_context()
+    return create_browser_context(pw, headless=headless, slowmo=slowmo)
+
+
+def _close_browser(browser, ctx, slot) -> None:
+    """Close a stream's context, keeping pooled browsers alive for the next lease."""
+    try:
+        ctx.close()
+    except Exception:
+        pass
+    if slot is None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+
+
+def _start_stream_worker(target: Callable[[Any], None], use_pool: bool) -> tuple[Callable[[], bool], Callable[[], bool]]:
+    """Start a stream worker and return (liveness probe, cancel).
+
+    The worker gets a free pooled browser when there is one and otherwise its
+    own thread and browser at once, so streams never queue silently behind the
+    pool; how they share navigations is left to NAVIGATION_SCHEDULER. Cancel
+    drops a pooled job that has not started yet and returns whether it did.
+    """
+    pool = BROWSER_POOL
+    future = pool.try_submit(target) if use_pool and pool is not None else None
+    if future is not None:
+        return (lambda: not future.done()), future.cancel
+
+    thread = threading.Thread(target=target, args=(None,), daemon=True)
+    thread.start()
+    return thread.is_alive, (lambda: False)
+
+
 def _response_status(response) -> Optional[int]:
     """Best-effort response status extraction."""
     try:
@@ -318,15 +705,18 @@ def _load_page_with_retries(
         page = get_page()
         raise_if_cancelled(should_cancel)
         _sleep_request_jitter(should_cancel)
-        response = guarded_goto(page, url, wait_until="domcontentloaded", timeout=60000)
+        response = guarded_goto(page, url, wait_until="domcontentloaded", timeout=60000, should_cancel=should_cancel)
         raise_if_cancelled(should_cancel)
-        accept_cookies(page)
+        overlays_guarded = has_overlay_guard(page)
+        if not overlays_guarded:
+            accept_cookies(page)
         try:
             page.wait_for_load_state("networkidle", timeout=20000)
         except Exception:
             pass
         raise_if_cancelled(should_cancel)
-        dismiss_login_modal(page)
+        if not overlays_guarded:
+            dismiss_login_modal(page)
         check_page_for_rate_limit(
             page,
             response_status=_response_status(response),
@@ -334,6 +724,7 @@ def _load_page_with_retries(
             expect_listing=expect_listing,
             retry_after_seconds=extract_retry_after_seconds(response),
         )
+        record_navigation_success()
 
     _run_with_rate_limit_retries(
         action,
@@ -344,11 +735,72 @@ def _load_page_with_retries(
     )
 
 
+class _ListingPrefetchRing:
+    """Two listing tabs: one is extracted while the next URL is already navigating in the other."""
+
+    def __init__(self, page, spare_page, should_cancel: Callable[[], bool]):
+        self.should_cancel = should_cancel
+        self.reset(page, spare_page)
+
+    def reset(self, page, spare_page) -> None:
+        """Adopt fresh tabs, forgetting any in-flight prefetches."""
+        self.pages = [page, spare_page]
+        self.current = 0
+        self.loading: Dict[int, tuple[str, Any]] = {}
+
+    def _begin(self, index: int, url: str) -> None:
+        self.loading.pop(index, None)
+        try:
+            response = begin_listing_navigation(self.pages[index], url, should_cancel=self.should_cancel)
+        except SearchCancelled:
+            raise
+        except Exception as exc:
+            # parse_listing navigates again (with the usual retries) when the prefetch failed
+            log_debug(f"[prefetch] could not start {url}: {exc}")
+            return
+        self.loading[index] = (url, response)
+
+    def prefetch(self, url: str) -> None:
+        """Make sure url is loading in the current tab."""
+        if self.loading.get(self.current, (None, None))[0] != url:
+            self._begin(self.current, url)
+
+    def prefetch_next(self, url: str) -> None:
+        """Start url in the spare tab and make it current; call once the current listing is parsed."""
+        self.current = 1 - self.current
+        self._begin(self.current, url)
+
+    def open(self, url: str) -> Optional[Dict[str, Any]]:
+        """Parse url in the current tab, reusing its prefetched navigation on the first attempt."""
+        entry = self.loading.pop(self.current, None)
+        if entry and entry[0] == url:
+            return parse_listing(
+                self.pages[self.current],
+                url,
+                should_cancel=self.should_cancel,
+                prefetched=True,
+                prefetched_response=entry[1],
+            )
+        return parse_listing(self.pages[self.current], url, should_cancel=self.should_cancel)
+
+    def close_spare(self) -> None:
+        try:
+            self.pages[1 - self.current].close()
+        except Exception:
+            pass
+
+
+def _remember_seller_sold_count(seller: str, sold_count: Optional[int]) -> Optional[int]:
+    """Share a sold count read from any seller page with later searches and pass it through."""
+    SELLER_STATS.put(seller, sold_count)
+    return sold_count
+
+
 def _resolve_seller_sold_count(ctx, seller_cache: Dict[str, int], seller: str,
                                search_id: str = "",
                                groups: Any = "tops", gender: str = "male",
                                on_rate_limit: Optional[Callable[[int, int, int, Exception, str], None]] = None,
-                               reset_session: Optional[Callable[[], tuple[Any, Any]]] = None) -> int:
+                               reset_session: Optional[Callable[..., tuple[Any, Any]]] = None) -> int:
     """Load and cache seller sold counts from seller pages."""
     seller_key = (seller or "").strip().lstrip("@")
     if not seller_key:
@@ -357,87 +809,77 @@ def _resolve_seller_sold_count(ctx, seller_cache: Dict[str, int], seller: str,
     if seller_key in seller_cache:
         return seller_cache[seller_key]
 
+    shared_count = SELLER_STATS.get(seller_key)
+    if shared_count is not None:
+        seller_cache[seller_key] = shared_count
+        return shared_count
+
     groups_value = _normalize_groups(groups)[0]
+    seller_url = build_seller_url(seller_key, groups=groups_value, gender=gender)
     current_ctx = ctx
 
-    profile_page = current_ctx.new_page()
+    def load_sold_count() -> int:
+        nonlocal current_ctx
+        profile_page = current_ctx.new_page()
 
-    def rebuild_profile_page(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
-        nonlocal current_ctx, profile_page
-        try:
-            profile_page.close()
-        except Exception:
-            pass
+        def rebuild_profile_page(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
+            nonlocal current_ctx, profile_page
+            try:
+                profile_page.close()
+            except Exception:
+                pass
 
-        if reset_session:
-            current_ctx, _ = reset_session()
-        profile_page = current_ctx.new_page()
+            if reset_session:
+                current_ctx, _ = reset_session(exc, attempt)
+            profile_page = current_ctx.new_page()
 
-    try:
-        _load_page_with_retries(
-            lambda: profile_page,
-            build_seller_url(seller_key, groups=groups_value, gender=gender),
-            search_id,
-            "checking seller sold count",
-            on_rate_limit=on_rate_limit,
-            before_retry=rebuild_profile_page,
-        )
-        sold_count = extract_seller_sold_count(profile_page) or 0
-    except SearchCancelled:
-        raise
-    except RateLimitError:
-        raise
-    except Exception as e:
-        log_debug(f"[seller-stats] Failed to load @{seller_key}: {e}")
-        sold_count = 0
-    finally:
-        profile_page.close()
+        try:
+            _load_page_with_retries(
+                lambda: profile_page,
+                seller_url,
+                search_id,
+                "checking seller sold count",
+                on_rate_limit=on_rate_limit,
+                before_retry=rebuild_profile_page,
+            )
+            return _remember_seller_sold_count(seller_key, extract_seller_sold_count(profile_page)) or 0
+        except SearchCancelled:
+            raise
+        except RateLimitError:
+            raise
+        except Exception as e:
+            log_debug(f"[seller-stats] Failed to load @{seller_key}: {e}")
+            return 0
+        finally:
+            profile_page.close()
 
+    # Parallel searches resolving the same seller share one profile navigation
+    sold_count, _ = SELLER_PROFILE_FLIGHTS.do(
+        normalize_flight_url(seller_url, keep_query=True),
+        load_sold_count,
+        check_cancelled=lambda: raise_if_cancelled(_cancel_check(search_id)),
+    )
     seller_cache[seller_key] = sold_count
     return sold_count
 
 
 def _extract_bottoms_size(size_label: str) -> Optional[float]:
     """Extract a numeric waist size from a Depop bottoms label."""
-    text = (size_label or "").strip().lower()
-    if not text:
-        return None
-
-    match = None
-    for pattern in (
-        r"\bw\s*(\d{2})(?:\.\d+)?\b",
-        r"\b(\d{2})(?:\.\d+)?\s*(?:\"|in)?\b",
-    ):
-        match = re.search(pattern, text, re.I)
-        if match:
-            break
-
-    if not match:
-        return None
-
-    try:
-        return float(match.group(1))
-    except Exception:
-        return None
+    return parser.size_label_waist(size_label)
 
 
 def _extract_footwear_size(size_label: str) -> Optional[float]:
     """Extract a numeric US shoe size from a Depop footwear label."""
-    text = (size_label or "").strip().upper()
-    if not text:
-        return None
+    return parser.size_label_shoe(size_label)
 
-    match = re.search(r"\bUS\s*(\d+(?:\.\d+)?)\b", text)
-    if not match:
-        match = re.search(r"\b(\d+(?:\.\d+)?)\b", text)
-
-    if not match:
-        return None
 
-    try:
-        return float(match.group(1))
-    except Exception:
-        return None
+def _measurement_record(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the listing's parser.extract_all record, parsing its description at most once."""
+    record = item.get("measurements")
+    if not isinstance(record, dict) or record.get("version") != parser.RECORD_VERSION:
+        record = parser.extract_all(item.get("description") or "", item.get("sizeLabel") or "")
+        item["measurements"] = record
+    return record
 
 
 def _build_match_payload(item: Dict[str, Any], p2p: Optional[float] = None,
@@ -470,9 +912,10 @@ def _process_item(item: Dict[str, Any], target_p2p: float, target_length: float,
                   size_range: Dict[str, Any] | None = None,
                   bottoms_measurements: Dict[str, Dict[str, float]] | None = None) -> Dict[str, Any] | None:
     """Check if item matches the active category filter and return a formatted result."""
+    record = _measurement_record(item)
     if category in MEASUREMENT_CATEGORIES:
-        text = item.get("description", "")
-        w, L = parser.extract_tops(text)
+        w = parser.value(record, "p2p")
+        L = parser.value(record, "length")
         matched_any = False
 
         if w is not None:
@@ -493,11 +936,10 @@ def _process_item(item: Dict[str, Any], target_p2p: float, target_length: float,
         return _build_match_payload(item)
 
     if category == "bottoms":
-        description = item.get("description", "")
         if bottoms_measurements:
-            values = parser.extract_bottoms(description)
+            values = {key: parser.value(record, key) for key in ("waist", "inseam", "rise", "legOpening")}
             if values.get("waist") is None:
-                size_waist = _extract_bottoms_size(item.get("sizeLabel") or "")
+                size_waist = parser.value(record, "sizeWaist")
                 if size_waist is not None:
                     values["waist"] = size_waist
             inseam_rise = None
@@ -526,23 +968,246 @@ def _process_item(item: Dict[str, Any], target_p2p: float, target_length: float,
                 leg_opening=values.get("legOpening"),
             )
 
-        size_value = _extract_bottoms_size(item.get("sizeLabel") or "")
+        size_value = parser.value(record, "sizeWaist")
     elif category == "footwear":
-        size_value = _extract_footwear_size(item.get("sizeLabel") or "")
+        size_value = parser.value(record, "shoeSize")
     else:
         size_value = None
 
-    if size_value is None:
+    if size_value is None or not _size_within_range(size_value, size_range):
         return None
 
+    return _build_match_payload(item)
+
+
+def _size_within_range(size_value: float, size_range: Dict[str, Any] | None) -> bool:
+    """Check a numeric size against an optional min/max size range."""
     lower = float(size_range.get("min")) if size_range and size_range.get("min") is not None else None
     upper = float(size_range.get("max")) if size_range and size_range.get("max") is not None else None
     if lower is not None and size_value < lower:
-        return None
+        return False
     if upper is not None and size_value > upper:
-        return None
+        return False
+    return True
+
+
+def _uses_size_prefilter(category: str, bottoms_measurements: Dict[str, Dict[str, float]] | None) -> bool:
+    """Return whether _process_item decides this category from the size label alone."""
+    return GRID_PREFILTER and (category == "footwear" or (category == "bottoms" and not bottoms_measurements))
+
+
+def _grid_capture_kwargs(listing_data: Dict[str, Dict[str, Any]], category: str = "tops",
+                         bottoms_measurements: Dict[str, Dict[str, float]] | None = None,
+                         known_links: set | None = None) -> Dict[str, Any]:
+    """Build the collect_listing_links options that gather partial listings from the grid.
+
+    Known shop links need their tiles read, which confirms they are still listed
+    and refreshes their price and sold marker.
+    """
+    read_tiles = _uses_size_prefilter(category, bottoms_measurements) or bool(known_links)
+    if not (LISTING_XHR_HARVEST or read_tiles):
+        return {}
+    return {"listing_data": listing_data, "harvest_responses": LISTING_XHR_HARVEST, "read_tiles": read_tiles}
+
+
+def _apply_grid_prefilter(links: list[str], listing_data: Dict[str, Dict[str, Any]], category: str,
+                          size_range: Dict[str, Any] | None,
+                          bottoms_measurements: Dict[str, Dict[str, float]] | None) -> tuple[list[str], int]:
+    """Split off links whose grid tile already fails the size range; return kept links and the dropped count."""
+    kept = [
+        url for url in links
+        if not _grid_prefilter_rejects(listing_data.get(url), category, size_range, bottoms_measurements)
+    ]
+    return kept, len(links) - len(kept)
+
+
+def _grid_prefilter_rejects(record: Dict[str, Any] | None, category: str, size_range: Dict[str, Any] | None,
+                            bottoms_measurements: Dict[str, Dict[str, float]] | None) -> bool:
+    """Return whether a grid tile's size badge provably fails the size range."""
+    if not record or not record.get("sizeLabel") or not _uses_size_prefilter(category, bottoms_measurements):
+        return False
+    if category == "footwear":
+        size_value = _extract_footwear_size(record["sizeLabel"])
+    else:
+        size_value = _extract_bottoms_size(record["sizeLabel"])
+    return size_value is not None and not _size_within_range(size_value, size_range)
+
+
+def _screen_links(links: list[str], listing_data: Dict[str, Dict[str, Any]], search_id: str,
+                  category: str = "tops", size_range: Dict[str, Any] | None = None,
+                  bottoms_measurements: Dict[str, Dict[str, float]] | None = None,
+                  newest_first: bool = False) -> tuple[list[str], int, bool]:
+    """Drop negatively cached and grid-prefiltered links; return the candidates, the prefiltered count and the age-window flag."""
+    kept, past_age_window = _filter_negative_links(links, search_id, category, newest_first=newest_first)
+    candidates, dropped = _apply_grid_prefilter(kept, listing_data, category, size_range, bottoms_measurements)
+    return candidates, dropped, past_age_window
+
+
+def _listing_matcher(target_p2p: float, target_length: float, p2p_tol: float, length_tol: float,
+                     category: str = "tops", size_range: Dict[str, Any] | None = None,
+                     bottoms_measurements: Dict[str, Dict[str, float]] | None = None):
+    """Build a callback that returns (past age window, match payload) for a looked-up listing."""
+    def evaluate(item: Dict[str, Any] | None) -> tuple[bool, Dict[str, Any] | None]:
+        if not item:
+            return False, None
+        if _listing_exceeds_age_window(item):
+            return True, None
+        return False, _process_item(
+            item, target_p2p, target_length, p2p_tol, length_tol,
+            category, size_range, bottoms_measurements,
+        )
+
+    return evaluate
+
+
+def _progress_event(search_id: str, processed: int, total: int | None, matches: int, prefiltered: int,
+                    **extra: Any) -> Dict[str, Any]:
+    """Build a seller/browse progress event."""
+    return {
+        "type": "progress",
+        **extra,
+        "processed": processed,
+        "total": total,
+        "matches": matches,
+        "prefiltered": prefiltered,
+        "searchId": search_id or None,
+    }
+
+
+def _done_event(search_id: str, processed: int, total: int, matches: int, prefiltered: int,
+                stop_reason: str = "completed") -> Dict[str, Any]:
+    """Build the done event that closes a seller/browse pipeline."""
+    return {
+        "type": "done",
+        "processed": processed,
+        "total": total,
+        "matches": matches,
+        "prefiltered": prefiltered,
+        "stopReason": stop_reason,
+        "searchId": search_id or None,
+    }
+
+
+def _match_event(search_id: str, match: Dict[str, Any], seller: str | None = None) -> Dict[str, Any]:
+    """Build a match event, naming the seller when the pipeline spans several shops."""
+    event = {"type": "match", "item": match}
+    if seller is not None:
+        event["seller"] = seller
+    event["searchId"] = search_id or None
+    return event
 
-    return _build_match_payload(item)
+
+def _seller_finished_event(kind: str, seller: str, processed: int, total: int, search_id: str,
+                           **extra: Any) -> Dict[str, Any]:
+    """Build the seller_done/seller_error event a following search emits per followed shop."""
+    return {
+        "type": kind,
+        "seller": seller,
+        **extra,
+        "processed": processed,
+        "total": total,
+        "searchId": search_id,
+    }
+
+
+class _StreamTally:
+    """Counters and SSE chunks of one seller or browse stream, shared by the sync and async engines.
+
+    The engines only do page I/O; what to report after each listing, and
+    whether the stream is finished, is decided here.
+    """
+
+    def __init__(self, search_id: str, max_matches: int, total: int | None = None):
+        self.search_id = search_id
+        self.max_matches = max_matches
+        self.total = total
+        self.processed = 0
+        self.matches = 0
+        self.prefiltered = 0
+        self.age_window_hit = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters for rate-limit notices."""
+        return {"processed": self.processed, "total": self.total, "matches": self.matches, "prefiltered": self.prefiltered}
+
+    def progress(self, **extra: Any) -> bytes:
+        return _sse(_progress_event(
+            self.search_id, self.processed, self.total, self.matches, self.prefiltered, **extra,
+        ))
+
+    def done(self, stop_reason: str | None = None) -> bytes:
+        stop_reason = stop_reason or ("age_window" if self.age_window_hit else "completed")
+        return _sse(_done_event(
+            self.search_id, self.processed, self.total or 0, self.matches, self.prefiltered, stop_reason,
+        ))
+
+    def stop_for_age(self, item: Dict[str, Any], scope: str) -> bytes:
+        """Record that ``scope`` reached a listing past the age window; return the progress chunk to send."""
+        self.age_window_hit = True
+        log_debug(
+            f"[stream] stopping {scope} at {float(item.get('ageDays')):.1f}d (>{MAX_LISTING_AGE_DAYS}d window)"
+        )
+        return self.progress()
+
+    def count_match(self, match: Dict[str, Any], seller: str | None = None) -> list[bytes]:
+        """Count a match and return its chunks, closing the stream once max_matches is reached."""
+        self.matches += 1
+        chunks = [_sse(_match_event(self.search_id, match, seller=seller))]
+        if self.reached_limit():
+            chunks.append(self.done("match_limit"))
+        return chunks
+
+    def reached_limit(self) -> bool:
+        return self.matches >= self.max_matches
+
+
+def _seller_group_candidates(seller, group, gender, links, known_links, listing_data, capacity,
+                             seen_urls: set, tally: _StreamTally, search_id: str, category: str = "tops",
+                             size_range=None, bottoms_measurements=None) -> list[str]:
+    """Turn one collected seller group into the listings to open, newest first.
+
+    Known links still on the grid are merged in, links seen in an earlier group
+    are dropped, and the rest are screened, with what the screen drops counted
+    on ``tally``.
+    """
+    merged = _merge_known_seller_links(seller, group, gender, links, known_links, listing_data, capacity)
+    unique = [url for url in merged if url not in seen_urls]
+    seen_urls.update(unique)
+    candidates, dropped, past_age_window = _screen_links(
+        unique, listing_data, search_id, category, size_range, bottoms_measurements, newest_first=True,
+    )
+    tally.age_window_hit = tally.age_window_hit or past_age_window
+    tally.prefiltered += dropped
+    return candidates
+
+
+def _browse_batch_candidates(links, listing_data, seen_urls: set, tally: _StreamTally, search_id: str,
+                             category: str = "tops", size_range=None, bottoms_measurements=None) -> list[str] | None:
+    """Screen one batch of browse links; None when the batch brought no new link at all."""
+    unique = [url for url in _without_harvested_sold(links, listing_data) if url not in seen_urls]
+    if not unique:
+        return None
+    seen_urls.update(unique)
+    tally.total = len(seen_urls)
+    candidates, dropped, _ = _screen_links(unique, listing_data, search_id, category, size_range, bottoms_measurements)
+    tally.prefiltered += dropped
+    return candidates
+
+
+def _following_verdict(evaluate_listing, item: Dict[str, Any] | None, seller: str,
+                       sold_count: int, search_id: str) -> tuple[bool, Dict[str, Any] | None]:
+    """Return (stop this seller, match event or None) for one listing of a followed shop."""
+    past_age_window, match = evaluate_listing(item)
+    if past_age_window:
+        log_debug(
+            f"[following] {seller}: item is {float(item.get('ageDays')):.1f} days old, "
+            f"stopping at {MAX_LISTING_AGE_DAYS}d window"
+        )
+        return True, None
+    if not match:
+        return False, None
+    match["soldCount"] = sold_count
+    return False, _match_event(search_id, match, seller=seller)
 
 
 @app.post("/api/search/stream")
@@ -580,40 +1245,54 @@ async def search_stream(request: Request):
     if search_id:
         CANCEL_FLAGS[search_id] = False
 
+    if _resolve_engine(payload) == "async":
+        def async_pipeline(session, emit_event):
+            if seller:
+                return _search_seller_async(
+                    session, seller, groups, gender,
+                    target_p2p, target_length, p2p_tol, length_tol,
+                    max_items, max_links, max_scrolls, search_id,
+                    category, size_range, bottoms_measurements,
+                    emit_event=emit_event,
+                )
+            return _browse_all_async(
+                session, groups, gender,
+                target_p2p, target_length, p2p_tol, length_tol,
+                max_items, max_links, max_scrolls, search_id,
+                category, size_range, bottoms_measurements,
+                emit_event=emit_event,
+            )
+
+        return StreamingResponse(
+            _run_async_pipeline(
+                search_id, "stream", async_pipeline, navigation_kind="seller" if seller else "browse",
+                headless=headless, slowmo=slowmo,
+            ),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+
     result_queue = queue.Queue()
     error_holder = [None]
 
     def emit_stream_event(payload: Dict[str, Any]) -> None:
         result_queue.put(("data", _sse(payload)))
 
-    def run_search():
+    def run_search(slot=None):
         """Synchronous search generator."""
         try:
             yield SSE_PREAMBLE
             yield _sse({"type": "hello", "searchId": search_id or None, "ts": dt.datetime.utcnow().isoformat()})
             
-            with sync_playwright() as pw:
-                browser, ctx = create_browser_context(pw, headless=headless, slowmo=slowmo)
+            with navigation_owner(search_id, "seller" if seller else "browse"), _playwright_for(slot) as pw:
+                browser, ctx = _open_browser(pw, slot, headless, slowmo)
                 page = ctx.new_page()
 
-                def reset_session() -> tuple[Any, Any]:
+                def reset_session(exc: Optional[Exception] = None, attempt: int = 1) -> tuple[Any, Any]:
                     nonlocal browser, ctx, page
-                    try:
-                        page.close()
-                    except Exception:
-                        pass
-                    try:
-                        ctx.close()
-                    except Exception:
-                        pass
-                    try:
-                        browser.close()
-                    except Exception:
-                        pass
-
-                    browser, ctx = create_browser_context(pw, headless=headless, slowmo=slowmo)
-                    page = ctx.new_page()
-                    log_debug("[stream] Rebuilt Playwright browser session after rate limit")
+                    browser, ctx, page = _recover_session(
+                        pw, slot, browser, ctx, page, _recovery_tier(exc, attempt), headless, slowmo,
+                    )
                     return ctx, page
                 
                 try:
@@ -639,8 +1318,7 @@ async def search_stream(request: Request):
                     except SearchCancelled:
                         yield _sse({"type": "cancelled", "searchId": search_id or None})
                 finally:
-                    ctx.close()
-                    browser.close()
+                    _close_browser(browser, ctx, slot)
                     
         except RateLimitError as e:
             log_debug(f"[stream] rate limited: {e}")
@@ -651,68 +1329,74 @@ async def search_stream(request: Request):
             log_debug(f"[stream] error: {e}")
             yield _sse(_error_payload_for_exception(e, search_id))
         finally:
+            NAVIGATION_BREAKER.unsubscribe(search_id)
             flush_debug_logs()
             if search_id and search_id in CANCEL_FLAGS:
                 del CANCEL_FLAGS[search_id]
 
     async def async_wrapper():
         """Run sync generator in thread and yield results async."""
-        def worker():
+        def worker(slot=None):
             try:
-                for chunk in run_search():
+                for chunk in run_search(slot):
                     result_queue.put(("data", chunk))
                 result_queue.put(("done", None))
             except Exception as e:
                 error_holder[0] = e
                 result_queue.put(("error", None))
         
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        is_alive, cancel_worker = _start_stream_worker(worker, use_pool=headless and not slowmo)
+        finished = False
         
-        while True:
-            try:
-                if await request.is_disconnected():
-                    CANCEL_FLAGS[search_id] = True
-                    break
-            except Exception:
-                pass
-            
-            start = time.time()
+        try:
             while True:
                 try:
-                    msg_type, data = result_queue.get_nowait()
+                    if await request.is_disconnected():
+                        break
+                except Exception:
+                    pass
+                
+                start = time.time()
+                while True:
+                    try:
+                        msg_type, data = result_queue.get_nowait()
+                        break
+                    except queue.Empty:
+                        if time.time() - start > 0.1:
+                            if not is_alive():
+                                finished = True
+                                if error_holder[0]:
+                                    raise error_holder[0]
+                                try:
+                                    msg_type, data = result_queue.get_nowait()
+                                    break
+                                except queue.Empty:
+                                    return
+                            await asyncio.sleep(0.01)
+                            start = time.time()
+                        else:
+                            await asyncio.sleep(0.001)
+                
+                if msg_type == "done":
+                    finished = True
                     break
-                except queue.Empty:
-                    if time.time() - start > 0.1:
-                        if not thread.is_alive():
-                            if error_holder[0]:
-                                raise error_holder[0]
-                            try:
-                                msg_type, data = result_queue.get_nowait()
-                                break
-                            except queue.Empty:
-                                return
-                        await asyncio.sleep(0.01)
-                        start = time.time()
-                    else:
-                        await asyncio.sleep(0.001)
-            
-            if msg_type == "done":
-                break
-            elif msg_type == "error" and error_holder[0]:
-                raise error_holder[0]
-            elif msg_type == "data":
-                yield data
+                elif msg_type == "error" and error_holder[0]:
+                    finished = True
+                    raise error_holder[0]
+                elif msg_type == "data":
+                    yield data
+        finally:
+            # A disconnected or closed stream stops its crawl, started or not
+            if not finished:
+                CANCEL_FLAGS[search_id] = True
+                if cancel_worker():
+                    # The job never ran, so its own cleanup will not clear the flag
+                    CANCEL_FLAGS.pop(search_id, None)
 
     return StreamingResponse(
         async_wrapper(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache, no-transform",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-            "Access-Control-Allow-Origin": "*",
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -721,57 +1405,32 @@ def _search_seller(ctx, page, seller, groups, gender,
                    max_items, max_links, max_scrolls, search_id,
                    category="tops", size_range=None, bottoms_measurements=None,
                    emit_event: Optional[Callable[[Dict[str, Any]], None]] = None,
-                   reset_session: Optional[Callable[[], tuple[Any, Any]]] = None):
+                   reset_session: Optional[Callable[..., tuple[Any, Any]]] = None):
     """Search a specific seller's listings."""
     should_cancel = _cancel_check(search_id)
+    evaluate_listing = _listing_matcher(
+        target_p2p, target_length, p2p_tol, length_tol, category, size_range, bottoms_measurements,
+    )
     normalized_groups = _normalize_groups(groups)
-    processed = 0
-    matches = 0
-    total = 0
-    age_window_hit = False
+    tally = _StreamTally(search_id, max_items)
 
-    def notify_rate_limit(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
-        if not emit_event:
-            return
-        retry_available_at = (
-            dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=delay)
-        ).isoformat()
-        emit_event({
-            "type": "progress",
-            "phase": "rate_limited",
-            "processed": processed,
-            "total": total if total else None,
-            "matches": matches,
-            "message": f"Paused while {label}.",
-            "retryAttempt": attempt,
-            "retryTotalAttempts": total_attempts,
-            "retryDelaySeconds": delay,
-            "retryAvailableAt": retry_available_at,
-            "searchId": search_id or None,
-        })
+    notify_rate_limit = _rate_limit_notifier(emit_event, search_id, tally.snapshot)
+    _follow_shared_cooldown(search_id, notify_rate_limit)
 
     def rebuild_seller_page(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
         nonlocal ctx, page, current_seller_page_url
         if reset_session:
-            ctx, page = reset_session()
+            ctx, page = reset_session(exc, attempt)
         current_seller_page_url = None
 
-    def emit_done(stop_reason: str = "completed") -> bytes:
-        return _sse({
-            "type": "done",
-            "processed": processed,
-            "total": total,
-            "matches": matches,
-            "stopReason": stop_reason,
-            "searchId": search_id or None,
-        })
-
-    yield _sse({"type": "progress", "phase": "landing", "processed": 0, "total": None, "matches": 0, "searchId": search_id or None})
+    yield tally.progress(phase="landing")
 
     seller_sold_count = 0
     seen_urls = set()
+    known_urls: set = set()
     grouped_links = []
     current_seller_page_url = None
+    listing_data: Dict[str, Dict[str, Any]] = {}
 
     for group in normalized_groups:
         raise_if_cancelled(should_cancel)
@@ -790,15 +1449,17 @@ def _search_seller(ctx, page, seller, groups, gender,
         current_seller_page_url = search_url
 
         if seller_sold_count <= 0:
-            seller_sold_count = extract_seller_sold_count(page) or 0
+            seller_sold_count = _remember_seller_sold_count(seller, extract_seller_sold_count(page)) or 0
 
         remove_sold_sections(page)
 
         remaining_capacity = max(max_links - len(seen_urls), 0)
         if remaining_capacity <= 0:
             break
+        group_known_links = SELLER_WATERMARKS.known_urls(seller, group, gender)
+        known_urls.update(group_known_links)
 
-        def collect_group_links(current_capacity=remaining_capacity, current_url=search_url):
+        def collect_group_links(current_capacity=remaining_capacity, current_url=search_url, current_known=set(group_known_links)):
             nonlocal current_seller_page_url
             if current_seller_page_url != current_url:
                 _load_page_with_retries(
@@ -821,6 +1482,8 @@ def _search_seller(ctx, page, seller, groups, gender,
                 max_links=current_capacity,
                 should_cancel=should_cancel,
                 aggressive_end_scroll=False,
+                known_links=current_known or None,
+                **_grid_capture_kwargs(listing_data, category, bottoms_measurements, current_known),
             )
 
         links = _run_with_rate_limit_retries(
@@ -830,14 +1493,16 @@ def _search_seller(ctx, page, seller, groups, gender,
             on_rate_limit=notify_rate_limit,
             before_retry=rebuild_seller_page,
         )
-        unique_links = [url for url in links if url not in seen_urls]
-        seen_urls.update(unique_links)
-        grouped_links.append((group, unique_links))
-
-    total = sum(len(urls) for _, urls in grouped_links)
-    log_debug(f"[stream] collected {total} links for @{seller}")
+        grouped_links.append((group, _seller_group_candidates(
+            seller, group, gender, links, group_known_links, listing_data, remaining_capacity,
+            seen_urls, tally, search_id, category, size_range, bottoms_measurements,
+        )))
+
+    tally.total = sum(len(urls) for _, urls in grouped_links)
+    known_links = sum(url in known_urls for _, urls in grouped_links for url in urls)
+    log_debug(f"[stream] collected {tally.total} links for @{seller} ({known_links} already known)")
     
-    yield _sse({"type": "meta", "links": total, "seller": seller, "searchId": search_id or None})
+    yield _sse({"type": "meta", "links": tally.total, "knownLinks": known_links, "prefiltered": tally.prefiltered, "seller": seller, "searchId": search_id or None})
 
     for group, links in grouped_links:
         for idx, url in enumerate(links):
@@ -845,120 +1510,82 @@ def _search_seller(ctx, page, seller, groups, gender,
 
             def open_listing(current_url=url):
                 _sleep_request_jitter(should_cancel)
-                return parse_listing(page, current_url, should_cancel=should_cancel)
+                return _remember_listing(
+                    current_url, parse_listing(page, current_url, should_cancel=should_cancel), category, gender,
+                )
 
-            item = _run_with_rate_limit_retries(
+            item = _known_listing(url, listing_data, search_id, allow_stale=url in known_urls) or _run_with_rate_limit_retries(
                 open_listing,
                 should_cancel,
                 "opening listing page",
                 on_rate_limit=notify_rate_limit,
                 before_retry=rebuild_seller_page,
             )
-            processed += 1
-
-            if item:
-                if _listing_exceeds_age_window(item):
-                    age_days = float(item.get("ageDays"))
-                    age_window_hit = True
-                    log_debug(
-                        f"[stream] stopping @{seller} group={group} at {age_days:.1f}d "
-                        f"(>{MAX_LISTING_AGE_DAYS}d window)"
-                    )
-                    yield _sse({"type": "progress", "processed": processed, "total": total, "matches": matches, "searchId": search_id or None})
-                    break
+            tally.processed += 1
 
-                match = _process_item(
-                    item,
-                    target_p2p,
-                    target_length,
-                    p2p_tol,
-                    length_tol,
-                    category,
-                    size_range,
-                    bottoms_measurements,
-                )
-                if match:
-                    match["soldCount"] = seller_sold_count
-                    log_debug(
-                        f"[stream] MATCH seller=@{seller} url={match.get('url')} "
-                        f"p2p={match.get('p2p')} len={match.get('length')} size={match.get('sizeLabel')}"
-                    )
-                    yield _sse({"type": "match", "item": match, "searchId": search_id or None})
-                    matches += 1
+            past_age_window, match = evaluate_listing(item)
+            if past_age_window:
+                yield tally.stop_for_age(item, f"@{seller} group={group}")
+                break
 
-                    if matches >= max_items:
-                        yield emit_done("match_limit")
-                        return
+            if match:
+                match["soldCount"] = seller_sold_count
+                log_debug(
+                    f"[stream] MATCH seller=@{seller} url={match.get('url')} "
+                    f"p2p={match.get('p2p')} len={match.get('length')} size={match.get('sizeLabel')}"
+                )
+                yield from tally.count_match(match)
+                if tally.reached_limit():
+                    return
 
-            yield _sse({"type": "progress", "processed": processed, "total": total, "matches": matches, "searchId": search_id or None})
+            yield tally.progress()
 
-    yield emit_done("age_window" if age_window_hit else "completed")
+    yield tally.done()
 
 
 def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, length_tol,
                 max_items, max_links, max_scrolls, search_id,
                 category="tops", size_range=None, bottoms_measurements=None,
                 emit_event: Optional[Callable[[Dict[str, Any]], None]] = None,
-                reset_session: Optional[Callable[[], tuple[Any, Any]]] = None):
+                reset_session: Optional[Callable[..., tuple[Any, Any]]] = None):
     """Browse all listings on the category page."""
     should_cancel = _cancel_check(search_id)
+    evaluate_listing = _listing_matcher(
+        target_p2p, target_length, p2p_tol, length_tol, category, size_range, bottoms_measurements,
+    )
     normalized_groups = _normalize_groups(groups)
-    target_matches = max(max_items or 0, 1)
     max_parsed_links = max(max_links or 0, 1)
-    processed = 0
-    matches = 0
+    tally = _StreamTally(search_id, max(max_items or 0, 1), total=0)
     seen_urls = set()
-    age_window_hit = False
 
-    def notify_rate_limit(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
-        if not emit_event:
-            return
-        retry_available_at = (
-            dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=delay)
-        ).isoformat()
-        emit_event({
-            "type": "progress",
-            "phase": "rate_limited",
-            "processed": processed,
-            "total": len(seen_urls),
-            "matches": matches,
-            "message": f"Paused while {label}.",
-            "retryAttempt": attempt,
-            "retryTotalAttempts": total_attempts,
-            "retryDelaySeconds": delay,
-            "retryAvailableAt": retry_available_at,
-            "searchId": search_id or None,
-        })
+    notify_rate_limit = _rate_limit_notifier(emit_event, search_id, tally.snapshot)
+    _follow_shared_cooldown(search_id, notify_rate_limit)
 
-    yield _sse({"type": "progress", "phase": "browsing", "processed": 0, "total": 0, "matches": 0, "searchId": search_id or None})
+    yield tally.progress(phase="browsing")
     seller_stats_cache: Dict[str, int] = {}
+    listing_data: Dict[str, Dict[str, Any]] = {}
     item_page = ctx.new_page()
+    prefetch_ring = _ListingPrefetchRing(item_page, ctx.new_page(), should_cancel) if LISTING_PREFETCH else None
     current_browse_page_url = None
 
     def rebuild_browse_session(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
         nonlocal ctx, page, item_page, current_browse_page_url
         try:
-            item_page.close()
+            (prefetch_ring.pages[prefetch_ring.current] if prefetch_ring else item_page).close()
         except Exception:
             pass
+        if prefetch_ring:
+            prefetch_ring.close_spare()
         if reset_session:
-            ctx, page = reset_session()
+            ctx, page = reset_session(exc, attempt)
         item_page = ctx.new_page()
+        if prefetch_ring:
+            prefetch_ring.reset(item_page, ctx.new_page())
         current_browse_page_url = None
 
-    def emit_done(stop_reason: str = "completed") -> bytes:
-        return _sse({
-            "type": "done",
-            "processed": processed,
-            "total": len(seen_urls),
-            "matches": matches,
-            "stopReason": stop_reason,
-            "searchId": search_id or None,
-        })
-
     try:
         for group in normalized_groups:
-            if processed >= max_parsed_links or matches >= target_matches:
+            if tally.processed >= max_parsed_links or tally.reached_limit():
                 break
 
             browse_url = build_browse_url(groups=group, gender=gender)
@@ -979,7 +1606,7 @@ def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, l
             stalled_batches = 0
             stop_group_for_age = False
 
-            while processed < max_parsed_links and matches < target_matches:
+            while tally.processed < max_parsed_links and not tally.reached_limit():
                 raise_if_cancelled(should_cancel)
 
                 remaining_capacity = max_parsed_links - len(seen_urls)
@@ -1008,6 +1635,7 @@ def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, l
                         max_links=current_capacity,
                         should_cancel=should_cancel,
                         aggressive_end_scroll=True,
+                        **_grid_capture_kwargs(listing_data, category, bottoms_measurements),
                     )
 
                 links = _run_with_rate_limit_retries(
@@ -1017,9 +1645,11 @@ def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, l
                     on_rate_limit=notify_rate_limit,
                     before_retry=rebuild_browse_session,
                 )
-                unique_new = [url for url in links if url not in seen_urls]
+                unique_new = _browse_batch_candidates(
+                    links, listing_data, seen_urls, tally, search_id, category, size_range, bottoms_measurements,
+                )
 
-                if not unique_new:
+                if unique_new is None:
                     stalled_batches += 1
                     if stalled_batches >= BROWSE_ALL_STALLED_BATCHES:
                         break
@@ -1027,20 +1657,27 @@ def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, l
                     continue
 
                 stalled_batches = 0
-                seen_urls.update(unique_new)
                 log_debug(f"[stream] Collected {len(unique_new)} new browse links for {group} ({len(seen_urls)} total)")
 
-                for url in unique_new:
+                for index, url in enumerate(unique_new):
                     raise_if_cancelled(should_cancel)
 
-                    if processed >= max_parsed_links or matches >= target_matches:
+                    if tally.processed >= max_parsed_links or tally.reached_limit():
                         break
 
+                    known_item = _known_listing(url, listing_data, search_id)
+                    if prefetch_ring is not None and known_item is None:
+                        prefetch_ring.prefetch(url)
+
                     def open_listing(current_url=url):
                         _sleep_request_jitter(should_cancel)
-                        return parse_listing(item_page, current_url, should_cancel=should_cancel)
+                        if prefetch_ring:
+                            return _remember_listing(current_url, prefetch_ring.open(current_url), category, gender)
+                        return _remember_listing(
+                            current_url, parse_listing(item_page, current_url, should_cancel=should_cancel), category, gender,
+                        )
 
-                    item = _run_with_rate_limit_retries(
+                    item = known_item or _run_with_rate_limit_retries(
                         open_listing,
                         should_cancel,
                         "opening listing page",
@@ -1048,30 +1685,26 @@ def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, l
                         before_retry=rebuild_browse_session,
                     )
 
-                    processed += 1
+                    tally.processed += 1
+                    next_url = None
+                    if prefetch_ring is not None and tally.processed < max_parsed_links and index + 1 < len(unique_new):
+                        next_url = unique_new[index + 1]
+                        # Cached listings never need a tab, so don't spend a navigation prefetching them
+                        if LISTING_CACHE.has_fresh(next_url):
+                            next_url = None
+
+                    if _listing_exceeds_age_window(item):
+                        stop_group_for_age = True
+                        yield tally.stop_for_age(item, f"browse group={group}")
+                        break
 
                     if item:
-                        if _listing_exceeds_age_window(item):
-                            age_days = float(item.get("ageDays"))
-                            stop_group_for_age = True
-                            age_window_hit = True
-                            log_debug(
-                                f"[stream] stopping browse group={group} at {age_days:.1f}d "
-                                f"(>{MAX_LISTING_AGE_DAYS}d window)"
-                            )
-                            yield _sse({"type": "progress", "processed": processed, "total": len(seen_urls), "matches": matches, "searchId": search_id or None})
-                            break
+                        if next_url and tally.matches + 1 < tally.max_matches:
+                            # This listing cannot end the search, so the next one may load while it is matched
+                            prefetch_ring.prefetch_next(next_url)
+                            next_url = None
 
-                        match = _process_item(
-                            item,
-                            target_p2p,
-                            target_length,
-                            p2p_tol,
-                            length_tol,
-                            category,
-                            size_range,
-                            bottoms_measurements,
-                        )
+                        _, match = evaluate_listing(item)
                         if match:
                             seller_name = (match.get("seller") or "").strip()
                             sold_count = _resolve_seller_sold_count(
@@ -1089,24 +1722,819 @@ def _browse_all(ctx, page, groups, gender, target_p2p, target_length, p2p_tol, l
                             # Check seller reputation in browse mode
                             if sold_count > 50:
                                 log_debug(f"[stream] MATCH seller=@{seller_name} url={match.get('url')} sold={sold_count}")
-                                yield _sse({"type": "match", "item": match, "seller": seller_name, "searchId": search_id or None})
-                                matches += 1
-
-                                if matches >= target_matches:
-                                    yield emit_done("match_limit")
+                                yield from tally.count_match(match, seller=seller_name)
+                                if tally.reached_limit():
                                     return
 
-                    yield _sse({"type": "progress", "processed": processed, "total": len(seen_urls), "matches": matches, "searchId": search_id or None})
+                    if next_url:
+                        prefetch_ring.prefetch_next(next_url)
+
+                    yield tally.progress()
 
                 if stop_group_for_age:
                     break
     finally:
+        for open_page in (prefetch_ring.pages if prefetch_ring else [item_page]):
+            try:
+                open_page.close()
+            except Exception:
+                pass
+    
+    yield tally.done()
+
+
+# Asyncio engine: the same seller/browse/following pipelines as coroutines on
+# the server's event loop, sharing one async Playwright driver and browser.
+
+
+async def _sleep_request_jitter_async(should_cancel: Callable[[], bool], force: bool = False) -> None:
+    """Async counterpart of _sleep_request_jitter."""
+    if not force and time.time() >= RECENT_RATE_LIMIT_UNTIL_TS:
+        return
+
+    delay_seconds = random.uniform(*RECENT_RATE_LIMIT_JITTER_RANGE_SECONDS)
+    await async_scraper.sleep_with_cancel(delay_seconds, should_cancel)
+
+
+async def _run_with_rate_limit_retries_async(
+    action,
+    should_cancel: Callable[[], bool],
+    label: str,
+    on_rate_limit: Optional[Callable[[int, int, int, Exception, str], None]] = None,
+    before_retry=None,
+):
+    """Async counterpart of _run_with_rate_limit_retries; before_retry is awaited."""
+    for attempt in range(len(RATE_LIMIT_RETRY_DELAYS) + 1):
+        raise_if_cancelled(should_cancel)
+        try:
+            return await action()
+        except SearchCancelled:
+            raise
+        except RateLimitError as exc:
+            delay = _trip_rate_limit_breaker(exc, attempt, on_rate_limit)
+            if attempt >= len(RATE_LIMIT_RETRY_DELAYS):
+                raise RateLimitError(
+                    f"Rate limited after {len(RATE_LIMIT_RETRY_DELAYS)} cooldown attempts while {label}.",
+                    status=exc.status,
+                    retry_after_seconds=exc.retry_after_seconds,
+                ) from exc
+
+            if on_rate_limit:
+                on_rate_limit(attempt + 1, len(RATE_LIMIT_RETRY_DELAYS), delay, exc, label)
+            log_debug(f"[stream] Rate limited during {label}; retrying in {delay}s")
+            await async_scraper.sleep_with_cancel(delay, should_cancel)
+            if before_retry:
+                await before_retry(attempt + 1, len(RATE_LIMIT_RETRY_DELAYS), delay, exc, label)
+            await _sleep_request_jitter_async(should_cancel, force=True)
+        except Exception as exc:
+            if not _is_transient_navigation_error(exc):
+                raise
+
+            if attempt >= len(TRANSIENT_NAVIGATION_RETRY_DELAYS):
+                raise
+
+            delay = TRANSIENT_NAVIGATION_RETRY_DELAYS[attempt]
+            log_debug(f"[stream] Transient navigation error during {label}; rebuilding session and retrying in {delay}s")
+            await async_scraper.sleep_with_cancel(delay, should_cancel)
+            if before_retry:
+                await before_retry(attempt + 1, len(TRANSIENT_NAVIGATION_RETRY_DELAYS), delay, exc, label)
+
+
+async def _load_page_with_retries_async(
+    get_page: Callable[[], Any],
+    url: str,
+    search_id: str,
+    label: str,
+    *,
+    expect_product_links: bool = False,
+    expect_listing: bool = False,
+    on_rate_limit: Optional[Callable[[int, int, int, Exception, str], None]] = None,
+    before_retry=None,
+) -> None:
+    """Async counterpart of _load_page_with_retries."""
+    should_cancel = _cancel_check(search_id)
+
+    async def action():
+        page = get_page()
+        raise_if_cancelled(should_cancel)
+        await _sleep_request_jitter_async(should_cancel)
+        response = await async_scraper.guarded_goto(
+            page, url, wait_until="domcontentloaded", timeout=60000, should_cancel=should_cancel,
+        )
+        raise_if_cancelled(should_cancel)
+        overlays_guarded = has_overlay_guard(page)
+        if not overlays_guarded:
+            await async_scraper.accept_cookies(page)
         try:
-            item_page.close()
+            await page.wait_for_load_state("networkidle", timeout=20000)
         except Exception:
             pass
-    
-    yield emit_done("age_window" if age_window_hit else "completed")
+        raise_if_cancelled(should_cancel)
+        if not overlays_guarded:
+            await async_scraper.dismiss_login_modal(page)
+        await async_scraper.check_page_for_rate_limit(
+            page,
+            response_status=_response_status(response),
+            expect_product_links=expect_product_links,
+            expect_listing=expect_listing,
+            retry_after_seconds=await async_scraper.extract_retry_after_seconds(response),
+        )
+        record_navigation_success()
+
+    await _run_with_rate_limit_retries_async(
+        action,
+        should_cancel,
+        label,
+        on_rate_limit=on_rate_limit,
+        before_retry=before_retry,
+    )
+
+
+class _AsyncSession:
+    """The context and working page one async search leases from the shared (or its own) browser."""
+
+    def __init__(self, browser: Optional[AsyncBrowserManager] = None):
+        self.browser = browser if browser is not None else ASYNC_BROWSER
+        self.ctx = None
+        self.page = None
+
+    async def open(self) -> "_AsyncSession":
+        self.ctx = await self.browser.new_context()
+        self.page = await self.ctx.new_page()
+        return self
+
+    async def reset(self, exc: Optional[Exception] = None, attempt: int = 1) -> None:
+        """Swap in a fresh page or context; a dead browser is relaunched by new_context()."""
+        relaunching = not self.browser.is_healthy()
+        started = time.perf_counter()
+        if not relaunching and _recovery_tier(exc, attempt) == "page" and self.ctx is not None:
+            try:
+                await self.page.close()
+            except Exception:
+                pass
+            try:
+                self.page = await self.ctx.new_page()
+                _record_recovery("page", time.perf_counter() - started)
+                return
+            except Exception as page_exc:
+                log_debug(f"[stream] Session recovery with a new page failed; escalating: {page_exc}")
+
+        # A healthy shared browser is never relaunched for one search, so a context is the top tier
+        await self.close()
+        await self.open()
+        _record_recovery("browser" if relaunching else "context", time.perf_counter() - started)
+
+    async def close(self) -> None:
+        if self.ctx is not None:
+            try:
+                await self.ctx.close()
+            except Exception:
+                pass
+        self.ctx = None
+        self.page = None
+
+
+def _follow_shared_cooldown(search_id: str, notify_rate_limit) -> None:
+    """Route breaker trips caused by other searches to this search's rate-limit notifier."""
+    NAVIGATION_BREAKER.subscribe(search_id, notify_rate_limit)
+
+
+def _rate_limit_notifier(emit_event, search_id: str, snapshot: Callable[[], Dict[str, Any]]):
+    """Build an on_rate_limit callback that reports cooldowns as progress events."""
+    def notify(attempt: int, total_attempts: int, delay: int, exc: Exception, label: str) -> None:
+        if not emit_event:
+            return
+        retry_available_at = (
+            dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=delay)
+        ).isoformat()
+        emit_event({
+            "type": "progress",
+            "phase": "rate_limited",
+            **snapshot(),
+            "message": f"Paused while {label}.",
+            "retryAttempt": attempt,
+            "retryTotalAttempts": total_attempts,
+            "retryDelaySeconds": delay,
+            "retryAvailableAt": retry_available_at,
+            "searchId": search_id or None,
+        })
+
+    return notify
+
+
+async def _resolve_seller_sold_count_async(session: _AsyncSession, seller_cache: Dict[str, int], seller: str,
+                                           search_id: str = "", groups: Any = "tops", gender: str = "male",
+                                           on_rate_limit=None) -> int:
+    """Async counterpart of _resolve_seller_sold_count."""
+    seller_key = (seller or "").strip().lstrip("@")
+    if not seller_key:
+        return 0
+
+    if seller_key in seller_cache:
+        return seller_cache[seller_key]
+
+    shared_count = SELLER_STATS.get(seller_key)
+    if shared_count is not None:
+        seller_cache[seller_key] = shared_count
+        return shared_count
+
+    seller_url = build_seller_url(seller_key, groups=_normalize_groups(groups)[0], gender=gender)
+
+    async def load_sold_count() -> int:
+        profile_page = await session.ctx.new_page()
+
+        async def rebuild_profile_page(attempt, total_attempts, delay, exc, label) -> None:
+            nonlocal profile_page
+            try:
+                await profile_page.close()
+            except Exception:
+                pass
+            await session.reset(exc, attempt)
+            profile_page = await session.ctx.new_page()
+
+        try:
+            await _load_page_with_retries_async(
+                lambda: profile_page,
+                seller_url,
+                search_id,
+                "checking seller sold count",
+                on_rate_limit=on_rate_limit,
+                before_retry=rebuild_profile_page,
+            )
+            return _remember_seller_sold_count(seller_key, await async_scraper.extract_seller_sold_count(profile_page)) or 0
+        except (SearchCancelled, RateLimitError):
+            raise
+        except Exception as e:
+            log_debug(f"[seller-stats] Failed to load @{seller_key}: {e}")
+            return 0
+        finally:
+            try:
+                await profile_page.close()
+            except Exception:
+                pass
+
+    sold_count, _ = await SELLER_PROFILE_FLIGHTS.do_async(
+        normalize_flight_url(seller_url, keep_query=True),
+        load_sold_count,
+        check_cancelled=lambda: raise_if_cancelled(_cancel_check(search_id)),
+    )
+    seller_cache[seller_key] = sold_count
+    return sold_count
+
+
+async def _search_seller_async(session: _AsyncSession, seller, groups, gender,
+                               target_p2p, target_length, p2p_tol, length_tol,
+                               max_items, max_links, max_scrolls, search_id,
+                               category="tops", size_range=None, bottoms_measurements=None,
+                               emit_event: Optional[Callable[[Dict[str, Any]], None]] = None):
+    """Async counterpart of _search_seller."""
+    should_cancel = _cancel_check(search_id)
+    evaluate_listing = _listing_matcher(
+        target_p2p, target_length, p2p_tol, length_tol, category, size_range, bottoms_measurements,
+    )
+    tally = _StreamTally(search_id, max_items)
+    current_seller_page_url = None
+
+    notify_rate_limit = _rate_limit_notifier(emit_event, search_id, tally.snapshot)
+    _follow_shared_cooldown(search_id, notify_rate_limit)
+
+    async def rebuild_seller_page(attempt, total_attempts, delay, exc, label) -> None:
+        nonlocal current_seller_page_url
+        await session.reset(exc, attempt)
+        current_seller_page_url = None
+
+    yield tally.progress(phase="landing")
+
+    seller_sold_count = 0
+    seen_urls = set()
+    known_urls: set = set()
+    grouped_links = []
+    listing_data: Dict[str, Dict[str, Any]] = {}
+
+    for group in _normalize_groups(groups):
+        raise_if_cancelled(should_cancel)
+        search_url = build_seller_url(seller, groups=group, gender=gender)
+        log_debug(f"[stream] navigating: {search_url}")
+
+        await _load_page_with_retries_async(
+            lambda: session.page,
+            search_url,
+            search_id,
+            "opening seller page",
+            expect_product_links=True,
+            on_rate_limit=notify_rate_limit,
+            before_retry=rebuild_seller_page,
+        )
+        current_seller_page_url = search_url
+
+        if seller_sold_count <= 0:
+            seller_sold_count = _remember_seller_sold_count(seller, await async_scraper.extract_seller_sold_count(session.page)) or 0
+
+        remaining_capacity = max(max_links - len(seen_urls), 0)
+        if remaining_capacity <= 0:
+            break
+        group_known_links = SELLER_WATERMARKS.known_urls(seller, group, gender)
+        known_urls.update(group_known_links)
+
+        async def collect_group_links(current_capacity=remaining_capacity, current_url=search_url, current_known=set(group_known_links)):
+            nonlocal current_seller_page_url
+            if current_seller_page_url != current_url:
+                await _load_page_with_retries_async(
+                    lambda: session.page,
+                    current_url,
+                    search_id,
+                    "opening seller page",
+                    expect_product_links=True,
+                    on_rate_limit=notify_rate_limit,
+                    before_retry=rebuild_seller_page,
+                )
+                current_seller_page_url = current_url
+
+            await _sleep_request_jitter_async(should_cancel)
+            await async_scraper.remove_sold_sections(session.page)
+            return await async_scraper.collect_listing_links(
+                session.page,
+                max_scrolls=max_scrolls,
+                per_scroll_wait_ms=1200,
+                max_links=current_capacity,
+                should_cancel=should_cancel,
+                aggressive_end_scroll=False,
+                known_links=current_known or None,
+                **_grid_capture_kwargs(listing_data, category, bottoms_measurements, current_known),
+            )
+
+        links = await _run_with_rate_limit_retries_async(
+            collect_group_links,
+            should_cancel,
+            "collecting listings",
+            on_rate_limit=notify_rate_limit,
+            before_retry=rebuild_seller_page,
+        )
+        grouped_links.append((group, _seller_group_candidates(
+            seller, group, gender, links, group_known_links, listing_data, remaining_capacity,
+            seen_urls, tally, search_id, category, size_range, bottoms_measurements,
+        )))
+
+    tally.total = sum(len(urls) for _, urls in grouped_links)
+    known_links = sum(url in known_urls for _, urls in grouped_links for url in urls)
+    log_debug(f"[stream] collected {tally.total} links for @{seller} ({known_links} already known)")
+
+    yield _sse({"type": "meta", "links": tally.total, "knownLinks": known_links, "prefiltered": tally.prefiltered, "seller": seller, "searchId": search_id or None})
+
+    for group, links in grouped_links:
+        for url in links:
+            raise_if_cancelled(should_cancel)
+
+            async def open_listing(current_url=url):
+                await _sleep_request_jitter_async(should_cancel)
+                return _remember_listing(
+                    current_url,
+                    await async_scraper.parse_listing(session.page, current_url, should_cancel=should_cancel),
+                    category,
+                    gender,
+                )
+
+            item = _known_listing(url, listing_data, search_id, allow_stale=url in known_urls) or await _run_with_rate_limit_retries_async(
+                open_listing,
+                should_cancel,
+                "opening listing page",
+                on_rate_limit=notify_rate_limit,
+                before_retry=rebuild_seller_page,
+            )
+            tally.processed += 1
+
+            past_age_window, match = evaluate_listing(item)
+            if past_age_window:
+                yield tally.stop_for_age(item, f"@{seller} group={group}")
+                break
+
+            if match:
+                match["soldCount"] = seller_sold_count
+                log_debug(f"[stream] MATCH seller=@{seller} url={match.get('url')}")
+                for chunk in tally.count_match(match):
+                    yield chunk
+                if tally.reached_limit():
+                    return
+
+            yield tally.progress()
+
+    yield tally.done()
+
+
+async def _browse_all_async(session: _AsyncSession, groups, gender, target_p2p, target_length, p2p_tol, length_tol,
+                            max_items, max_links, max_scrolls, search_id,
+                            category="tops", size_range=None, bottoms_measurements=None,
+                            emit_event: Optional[Callable[[Dict[str, Any]], None]] = None):
+    """Async counterpart of _browse_all."""
+    should_cancel = _cancel_check(search_id)
+    evaluate_listing = _listing_matcher(
+        target_p2p, target_length, p2p_tol, length_tol, category, size_range, bottoms_measurements,
+    )
+    max_parsed_links = max(max_links or 0, 1)
+    tally = _StreamTally(search_id, max(max_items or 0, 1), total=0)
+    seen_urls = set()
+    seller_stats_cache: Dict[str, int] = {}
+    listing_data: Dict[str, Dict[str, Any]] = {}
+    item_page = await session.ctx.new_page()
+    current_browse_page_url = None
+
+    notify_rate_limit = _rate_limit_notifier(emit_event, search_id, tally.snapshot)
+    _follow_shared_cooldown(search_id, notify_rate_limit)
+
+    async def rebuild_browse_session(attempt, total_attempts, delay, exc, label) -> None:
+        nonlocal item_page, current_browse_page_url
+        await session.reset(exc, attempt)
+        item_page = await session.ctx.new_page()
+        current_browse_page_url = None
+
+    yield tally.progress(phase="browsing")
+
+    try:
+        for group in _normalize_groups(groups):
+            if tally.processed >= max_parsed_links or tally.reached_limit():
+                break
+
+            browse_url = build_browse_url(groups=group, gender=gender)
+            log_debug(f"[stream] browsing: {browse_url}")
+
+            await _load_page_with_retries_async(
+                lambda: session.page,
+                browse_url,
+                search_id,
+                "opening browse page",
+                expect_product_links=True,
+                on_rate_limit=notify_rate_limit,
+                before_retry=rebuild_browse_session,
+            )
+            current_browse_page_url = browse_url
+            await session.page.wait_for_timeout(500)
+
+            stalled_batches = 0
+            stop_group_for_age = False
+
+            while tally.processed < max_parsed_links and not tally.reached_limit():
+                raise_if_cancelled(should_cancel)
+
+                remaining_capacity = max_parsed_links - len(seen_urls)
+                if remaining_capacity <= 0:
+                    break
+
+                async def collect_browse_links(current_capacity=remaining_capacity, current_url=browse_url):
+                    nonlocal current_browse_page_url
+                    if current_browse_page_url != current_url:
+                        await _load_page_with_retries_async(
+                            lambda: session.page,
+                            current_url,
+                            search_id,
+                            "opening browse page",
+                            expect_product_links=True,
+                            on_rate_limit=notify_rate_limit,
+                            before_retry=rebuild_browse_session,
+                        )
+                        current_browse_page_url = current_url
+
+                    await _sleep_request_jitter_async(should_cancel)
+                    return await async_scraper.collect_listing_links(
+                        session.page,
+                        max_scrolls=max_scrolls,
+                        per_scroll_wait_ms=1200,
+                        max_links=current_capacity,
+                        should_cancel=should_cancel,
+                        aggressive_end_scroll=True,
+                        **_grid_capture_kwargs(listing_data, category, bottoms_measurements),
+                    )
+
+                links = await _run_with_rate_limit_retries_async(
+                    collect_browse_links,
+                    should_cancel,
+                    "collecting listings",
+                    on_rate_limit=notify_rate_limit,
+                    before_retry=rebuild_browse_session,
+                )
+                unique_new = _browse_batch_candidates(
+                    links, listing_data, seen_urls, tally, search_id, category, size_range, bottoms_measurements,
+                )
+
+                if unique_new is None:
+                    stalled_batches += 1
+                    if stalled_batches >= BROWSE_ALL_STALLED_BATCHES:
+                        break
+                    await session.page.wait_for_timeout(400)
+                    continue
+
+                stalled_batches = 0
+
+                for url in unique_new:
+                    raise_if_cancelled(should_cancel)
+
+                    if tally.processed >= max_parsed_links or tally.reached_limit():
+                        break
+
+                    async def open_listing(current_url=url):
+                        await _sleep_request_jitter_async(should_cancel)
+                        return _remember_listing(
+                            current_url,
+                            await async_scraper.parse_listing(item_page, current_url, should_cancel=should_cancel),
+                            category,
+                            gender,
+                        )
+
+                    item = _known_listing(url, listing_data, search_id) or await _run_with_rate_limit_retries_async(
+                        open_listing,
+                        should_cancel,
+                        "opening listing page",
+                        on_rate_limit=notify_rate_limit,
+                        before_retry=rebuild_browse_session,
+                    )
+                    tally.processed += 1
+
+                    past_age_window, match = evaluate_listing(item)
+                    if past_age_window:
+                        stop_group_for_age = True
+                        yield tally.stop_for_age(item, f"browse group={group}")
+                        break
+
+                    if match:
+                        seller_name = (match.get("seller") or "").strip()
+                        sold_count = await _resolve_seller_sold_count_async(
+                            session,
+                            seller_stats_cache,
+                            seller_name,
+                            search_id=search_id,
+                            groups=group,
+                            gender=gender,
+                            on_rate_limit=notify_rate_limit,
+                        )
+                        match["soldCount"] = sold_count
+
+                        if sold_count > 50:
+                            log_debug(f"[stream] MATCH seller=@{seller_name} url={match.get('url')} sold={sold_count}")
+                            for chunk in tally.count_match(match, seller=seller_name):
+                                yield chunk
+                            if tally.reached_limit():
+                                return
+
+                    yield tally.progress()
+
+                if stop_group_for_age:
+                    break
+    finally:
+        try:
+            await item_page.close()
+        except Exception:
+            pass
+
+    yield tally.done()
+
+
+async def _following_search_async(session: _AsyncSession, username, following_concurrency,
+                                  target_p2p, target_length, p2p_tol, length_tol,
+                                  max_items_per_seller, max_links_per_seller, max_scrolls,
+                                  groups, gender, search_id,
+                                  emit_event: Callable[[Dict[str, Any]], None]):
+    """Async counterpart of the following-stream worker pool, using tasks instead of threads."""
+    should_cancel = _cancel_check(search_id)
+    evaluate_listing = _listing_matcher(target_p2p, target_length, p2p_tol, length_tol)
+    yield _sse({"type": "progress", "phase": "getting_following", "message": f"Getting following list for @{username}", "searchId": search_id})
+
+    following_list = await async_scraper.get_following_list(session.page, username, should_cancel)
+    if not following_list:
+        yield _sse({"type": "error", "message": f"Could not find any accounts that @{username} follows", "searchId": search_id})
+        return
+
+    yield _sse({
+        "type": "following_list",
+        "usernames": following_list,
+        "count": len(following_list),
+        "searchId": search_id
+    })
+
+    semaphore = asyncio.Semaphore(max(following_concurrency, 1))
+    processed_sellers = 0
+
+    async def search_one_seller(seller_name: str) -> None:
+        nonlocal processed_sellers
+        async with semaphore:
+            try:
+                raise_if_cancelled(should_cancel)
+                seller_page = await session.ctx.new_page()
+                try:
+                    await _load_page_with_retries_async(
+                        lambda: seller_page,
+                        build_seller_url(seller_name, groups=groups, gender=gender),
+                        search_id,
+                        f"following seller page for @{seller_name}",
+                        expect_product_links=True,
+                    )
+                    seller_sold_count = _remember_seller_sold_count(
+                        seller_name, await async_scraper.extract_seller_sold_count(seller_page),
+                    ) or 0
+                    await async_scraper.remove_sold_sections(seller_page)
+                    listing_data: Dict[str, Dict[str, Any]] = {}
+                    links = await async_scraper.collect_listing_links(
+                        seller_page,
+                        max_scrolls=max_scrolls,
+                        max_links=max_links_per_seller,
+                        should_cancel=should_cancel,
+                        **_grid_capture_kwargs(listing_data),
+                    )
+
+                    seller_matches = 0
+                    candidates, _, _ = _screen_links(
+                        _without_harvested_sold(links, listing_data), listing_data, search_id, newest_first=True,
+                    )
+                    for url in candidates:
+                        raise_if_cancelled(should_cancel)
+                        item = _known_listing(url, listing_data, search_id) or await _run_with_rate_limit_retries_async(
+                            lambda current_url=url: _remember_listing_async(
+                                current_url, async_scraper.parse_listing(seller_page, current_url, should_cancel=should_cancel),
+                                "tops", gender,
+                            ),
+                            should_cancel,
+                            f"listing page {url}",
+                        )
+                        stop, match_event = _following_verdict(
+                            evaluate_listing, item, seller_name, seller_sold_count, search_id,
+                        )
+                        if stop:
+                            break
+
+                        if match_event:
+                            emit_event(match_event)
+                            seller_matches += 1
+                            if seller_matches >= max_items_per_seller:
+                                break
+
+                    processed_sellers += 1
+                    emit_event(_seller_finished_event(
+                        "seller_done", seller_name, processed_sellers, len(following_list), search_id,
+                        matches=seller_matches,
+                    ))
+                finally:
+                    await seller_page.close()
+            except SearchCancelled:
+                return
+            except Exception as e:
+                log_debug(f"[following-task] Error searching {seller_name}: {e}")
+                processed_sellers += 1
+                emit_event(_seller_finished_event(
+                    "seller_error", seller_name, processed_sellers, len(following_list), search_id,
+                    error=str(e),
+                ))
+
+    await asyncio.gather(*(search_one_seller(seller) for seller in following_list))
+    if _is_cancelled(search_id):
+        yield _sse({"type": "cancelled", "searchId": search_id})
+
+
+def _resolve_engine(payload: Dict[str, Any]) -> str:
+    """Pick the search engine from the request, falling back to DEBOT_SEARCH_ENGINE."""
+    engine = str(payload.get("engine") or SEARCH_ENGINE or "sync").strip().lower()
+    return engine if engine in SEARCH_ENGINES else "sync"
+
+
+async def _run_async_pipeline(
+    search_id: str,
+    label: str,
+    pipeline_factory,
+    final_done: bool = False,
+    navigation_kind: str = "browse",
+    headless: bool = True,
+    slowmo: int = 0,
+):
+    """Run an async pipeline as a task and stream its SSE chunks, including out-of-band events.
+
+    Like the sync pool, the shared browser only serves headless runs without
+    slow motion; any other request launches its own browser for the search.
+    """
+    outbox: asyncio.Queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    loop_thread = threading.get_ident()
+
+    def emit_event(payload: Dict[str, Any]) -> None:
+        # Breaker trips from other searches arrive on their threads
+        if threading.get_ident() == loop_thread:
+            outbox.put_nowait(_sse(payload))
+        else:
+            loop.call_soon_threadsafe(outbox.put_nowait, _sse(payload))
+
+    async def runner() -> None:
+        browser = ASYNC_BROWSER if headless and not slowmo else AsyncBrowserManager(headless=headless, slowmo=slowmo)
+        session = _AsyncSession(browser)
+        try:
+            await outbox.put(SSE_PREAMBLE)
+            await outbox.put(_sse({"type": "hello", "searchId": search_id or None, "ts": dt.datetime.now(dt.timezone.utc).isoformat(), "engine": "async"}))
+            await session.open()
+            async for chunk in pipeline_factory(session, emit_event):
+                await outbox.put(chunk)
+        except SearchCancelled:
+            await outbox.put(_sse({"type": "cancelled", "searchId": search_id or None}))
+        except RateLimitError as e:
+            log_debug(f"[{label}] rate limited: {e}")
+            await outbox.put(_sse(_error_payload_for_exception(e, search_id)))
+        except Exception as e:
+            log_debug(f"[{label}] error: {e}")
+            await outbox.put(_sse(_error_payload_for_exception(e, search_id)))
+        finally:
+            NAVIGATION_BREAKER.unsubscribe(search_id)
+            await session.close()
+            if browser is not ASYNC_BROWSER:
+                await browser.close()
+            flush_debug_logs()
+            if final_done:
+                await outbox.put(_sse({"type": "done", "searchId": search_id or None}))
+            await outbox.put(None)
+
+    # The task copies the current context, so every navigation it starts is billed to this search
+    with navigation_owner(search_id, navigation_kind):
+        task = asyncio.create_task(runner())
+    try:
+        while True:
+            chunk = await outbox.get()
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        if not task.done():
+            if search_id:
+                CANCEL_FLAGS[search_id] = True
+            task.cancel()
+        if search_id and search_id in CANCEL_FLAGS:
+            del CANCEL_FLAGS[search_id]
+
+
+@app.get("/api/stats")
+async def backend_stats():
+    """Report shared scraping resources such as browser pool occupancy."""
+    return {
+        "browserPool": BROWSER_POOL.stats() if BROWSER_POOL is not None else None,
+        "asyncBrowser": {"healthy": ASYNC_BROWSER.is_healthy(), "launches": ASYNC_BROWSER.launches},
+        "defaultEngine": SEARCH_ENGINE,
+        "listingFetch": {"mode": LISTING_FETCH_MODE, **HTTP_FETCH_STATS},
+        "overlaySuppressions": dict(OVERLAY_SUPPRESSIONS),
+        "sessionRecovery": {tier: dict(stats) for tier, stats in RECOVERY_STATS.items()},
+        "pacing": NAVIGATION_PACER.stats(),
+        "circuitBreaker": NAVIGATION_BREAKER.stats(),
+        "rateLimitHistory": list(PACING_STATE.rate_limit_history),
+        "listingCache": LISTING_CACHE.stats(),
+        "sellerStats": SELLER_STATS.stats(),
+        "negativeCache": NEGATIVE_CACHE.stats(),
+        "assetCache": STATIC_ASSETS.stats(),
+        "measurementIndex": MEASUREMENT_INDEX.stats(),
+        "navigationScheduler": NAVIGATION_SCHEDULER.wait_stats(),
+        "singleflight": {flights.name: flights.stats() for flights in (LISTING_FLIGHTS, SELLER_PROFILE_FLIGHTS)},
+    }
+
+
+@app.post("/api/search/instant")
+async def instant_search(payload: Dict[str, Any] = Body(...)):
+    """Re-filter every indexed listing against new targets without crawling."""
+    if not MEASUREMENT_INDEX.is_open:
+        return {"ok": False, "error": "measurement index unavailable", "matches": []}
+    category = (payload.get("category") or "tops").lower()
+    if category not in SUPPORTED_CATEGORIES:
+        return {"ok": True, "total": 0, "matches": [], "indexed": len(MEASUREMENT_INDEX)}
+
+    ms = payload.get("measurements") or {}
+    max_price = payload.get("maxPrice")
+    min_sold_count = payload.get("minSoldCount")
+    started = time.perf_counter()
+    result = await asyncio.to_thread(
+        MEASUREMENT_INDEX.query,
+        category,
+        float(ms["first"]) if ms.get("first") is not None else None,
+        float(ms["second"]) if ms.get("second") is not None else None,
+        float(payload.get("p2pTolerance") or DEFAULT_P2P_TOL),
+        float(payload.get("lengthTolerance") or DEFAULT_LENGTH_TOL),
+        _normalize_size_range(payload.get("sizeRange")),
+        _normalize_bottoms_measurements(payload.get("bottomsMeasurements")),
+        seller=(payload.get("seller") or "").strip() or None,
+        max_age_days=float(payload.get("maxAgeDays") or MAX_LISTING_AGE_DAYS),
+        max_price=float(max_price) if max_price is not None else None,
+        min_sold_count=int(min_sold_count) if min_sold_count is not None else None,
+        limit=int(payload.get("maxItems") or 40),
+        gender=payload.get("gender") or "male",
+    )
+    matches = [
+        _build_match_payload(
+            row,
+            p2p=row["values"].get("p2p"),
+            length=row["values"].get("length"),
+            waist=row["values"].get("waist"),
+            inseam=row["values"].get("inseam"),
+            rise=row["values"].get("rise"),
+            inseam_rise=row["values"].get("inseamRise"),
+            leg_opening=row["values"].get("legOpening"),
+        )
+        for row in result["matches"]
+    ]
+    return {
+        "ok": True,
+        "total": result["total"],
+        "matches": matches,
+        "indexed": len(MEASUREMENT_INDEX),
+        "elapsedMs": round((time.perf_counter() - started) * 1000, 2),
+    }
 
 
 @app.post("/api/search/cancel")
@@ -1153,21 +2581,40 @@ async def browse_following_stream(request: Request):
     if search_id:
         CANCEL_FLAGS[search_id] = False
 
-    def run_following_search():
+    if _resolve_engine(payload) == "async":
+        def async_pipeline(session, emit_event):
+            return _following_search_async(
+                session, username, max_threads,
+                target_p2p, target_length, p2p_tol, length_tol,
+                max_items_per_seller, max_links_per_seller, max_scrolls,
+                groups, gender, search_id,
+                emit_event=emit_event,
+            )
+
+        return StreamingResponse(
+            _run_async_pipeline(
+                search_id, "following-stream", async_pipeline, final_done=True, navigation_kind="following",
+                headless=headless, slowmo=slowmo,
+            ),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+
+    def run_following_search(slot=None):
         """Synchronous search generator for following accounts."""
         try:
             yield SSE_PREAMBLE
             yield _sse({"type": "hello", "searchId": search_id or None, "ts": dt.datetime.utcnow().isoformat()})
             
-            with sync_playwright() as pw:
-                browser, ctx = create_browser_context(pw, headless=headless, slowmo=slowmo)
+            with navigation_owner(search_id, "following"), _playwright_for(slot) as pw:
+                browser, ctx = _open_browser(pw, slot, headless, slowmo)
                 page = ctx.new_page()
                 
                 try:
                     # Get the following list first
                     yield _sse({"type": "progress", "phase": "getting_following", "message": f"Getting following list for @{username}", "searchId": search_id})
                     
-                    following_list = get_following_list(page, username)
+                    following_list = get_following_list(page, username, _cancel_check(search_id))
                     
                     if not following_list:
                         yield _sse({"type": "error", "message": f"Could not find any accounts that @{username} follows", "searchId": search_id})
@@ -1190,6 +2637,7 @@ async def browse_following_stream(request: Request):
                     total_matches = [0]
                     lock = threading.Lock()
                     should_cancel = _cancel_check(search_id)
+                    evaluate_listing = _listing_matcher(target_p2p, target_length, p2p_tol, length_tol)
                     
                     def search_seller_thread(seller_name: str, thread_id: int):
                         """Search a single seller in a separate thread."""
@@ -1206,59 +2654,55 @@ async def browse_following_stream(request: Request):
                                     f"following seller page for @{seller_name}",
                                     expect_product_links=True,
                                 )
-                                seller_sold_count = extract_seller_sold_count(thread_page) or 0
+                                seller_sold_count = _remember_seller_sold_count(
+                                    seller_name, extract_seller_sold_count(thread_page),
+                                ) or 0
                                 remove_sold_sections(thread_page)
                                 
+                                listing_data: Dict[str, Dict[str, Any]] = {}
                                 links = collect_listing_links(
                                     thread_page,
                                     max_scrolls=max_scrolls,
                                     max_links=max_links_per_seller,
                                     should_cancel=should_cancel,
+                                    **_grid_capture_kwargs(listing_data),
                                 )
                                 
                                 seller_matches = 0
-                                for url in links:
+                                candidates, _, _ = _screen_links(
+                                    _without_harvested_sold(links, listing_data), listing_data, search_id, newest_first=True,
+                                )
+                                for url in candidates:
                                     raise_if_cancelled(should_cancel)
-                                    item = _run_with_rate_limit_retries(
-                                        lambda current_url=url: parse_listing(thread_page, current_url, should_cancel=should_cancel),
+                                    item = _known_listing(url, listing_data, search_id) or _run_with_rate_limit_retries(
+                                        lambda current_url=url: _remember_listing(
+                                            current_url, parse_listing(thread_page, current_url, should_cancel=should_cancel),
+                                            "tops", gender,
+                                        ),
                                         should_cancel,
                                         f"listing page {url}",
                                     )
-                                    if item:
-                                        if _listing_exceeds_age_window(item):
-                                            age_days = float(item.get("ageDays"))
-                                            log_debug(
-                                                f"[following-thread] {seller_name}: Item is {age_days:.1f} days old, "
-                                                f"stopping at {MAX_LISTING_AGE_DAYS}d window"
-                                            )
-                                            break
+                                    stop, match_event = _following_verdict(
+                                        evaluate_listing, item, seller_name, seller_sold_count, search_id,
+                                    )
+                                    if stop:
+                                        break
+                                    
+                                    if match_event:
+                                        results_queue.put(match_event)
+                                        seller_matches += 1
+                                        with lock:
+                                            total_matches[0] += 1
                                         
-                                        match = _process_item(item, target_p2p, target_length, p2p_tol, length_tol)
-                                        if match:
-                                            match["soldCount"] = seller_sold_count
-                                            results_queue.put({
-                                                "type": "match",
-                                                "item": match,
-                                                "seller": seller_name,
-                                                "searchId": search_id
-                                            })
-                                            seller_matches += 1
-                                            with lock:
-                                                total_matches[0] += 1
-                                            
-                                            if seller_matches >= max_items_per_seller:
-                                                break
+                                        if seller_matches >= max_items_per_seller:
+                                            break
                                 
                                 with lock:
                                     processed_sellers[0] += 1
-                                    results_queue.put({
-                                        "type": "seller_done",
-                                        "seller": seller_name,
-                                        "matches": seller_matches,
-                                        "processed": processed_sellers[0],
-                                        "total": len(following_list),
-                                        "searchId": search_id
-                                    })
+                                    results_queue.put(_seller_finished_event(
+                                        "seller_done", seller_name, processed_sellers[0], len(following_list), search_id,
+                                        matches=seller_matches,
+                                    ))
                                     
                             finally:
                                 thread_page.close()
@@ -1269,19 +2713,15 @@ async def browse_following_stream(request: Request):
                             log_debug(f"[following-thread] Error searching {seller_name}: {e}")
                             with lock:
                                 processed_sellers[0] += 1
-                                results_queue.put({
-                                    "type": "seller_error",
-                                    "seller": seller_name,
-                                    "error": str(e),
-                                    "processed": processed_sellers[0],
-                                    "total": len(following_list),
-                                    "searchId": search_id
-                                })
+                                results_queue.put(_seller_finished_event(
+                                    "seller_error", seller_name, processed_sellers[0], len(following_list), search_id,
+                                    error=str(e),
+                                ))
                     
                     # Start threading
                     with ThreadPoolExecutor(max_workers=max_threads) as executor:
                         futures = {
-                            executor.submit(search_seller_thread, seller, i): seller
+                            executor.submit(contextvars.copy_context().run, search_seller_thread, seller, i): seller
                             for i, seller in enumerate(following_list)
                         }
                         
@@ -1316,8 +2756,7 @@ async def browse_following_stream(request: Request):
                                 break
                     
                 finally:
-                    ctx.close()
-                    browser.close()
+                    _close_browser(browser, ctx, slot)
                     
         except RateLimitError as e:
             log_debug(f"[following-stream] rate limited: {e}")
@@ -1338,60 +2777,65 @@ async def browse_following_stream(request: Request):
         result_queue = queue.Queue()
         error_holder = [None]
         
-        def worker():
+        def worker(slot=None):
             try:
-                for chunk in run_following_search():
+                for chunk in run_following_search(slot):
                     result_queue.put(("data", chunk))
                 result_queue.put(("done", None))
             except Exception as e:
                 error_holder[0] = e
                 result_queue.put(("error", None))
         
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
+        is_alive, cancel_worker = _start_stream_worker(worker, use_pool=headless and not slowmo)
+        finished = False
         
-        while True:
-            try:
-                if await request.is_disconnected():
-                    CANCEL_FLAGS[search_id] = True
-                    break
-            except Exception:
-                pass
-            
-            start = time.time()
+        try:
             while True:
                 try:
-                    msg_type, data = result_queue.get_nowait()
+                    if await request.is_disconnected():
+                        break
+                except Exception:
+                    pass
+                
+                start = time.time()
+                while True:
+                    try:
+                        msg_type, data = result_queue.get_nowait()
+                        break
+                    except queue.Empty:
+                        if time.time() - start > 0.1:
+                            if not is_alive():
+                                finished = True
+                                if error_holder[0]:
+                                    raise error_holder[0]
+                                try:
+                                    msg_type, data = result_queue.get_nowait()
+                                    break
+                                except queue.Empty:
+                                    return
+                            await asyncio.sleep(0.01)
+                            start = time.time()
+                        else:
+                            await asyncio.sleep(0.001)
+                
+                if msg_type == "done":
+                    finished = True
                     break
-                except queue.Empty:
-                    if time.time() - start > 0.1:
-                        if not thread.is_alive():
-                            if error_holder[0]:
-                                raise error_holder[0]
-                            try:
-                                msg_type, data = result_queue.get_nowait()
-                                break
-                            except queue.Empty:
-                                return
-                        await asyncio.sleep(0.01)
-                        start = time.time()
-                    else:
-                        await asyncio.sleep(0.001)
-            
-            if msg_type == "done":
-                break
-            elif msg_type == "error" and error_holder[0]:
-                raise error_holder[0]
-            elif msg_type == "data":
-                yield data
+                elif msg_type == "error" and error_holder[0]:
+                    finished = True
+                    raise error_holder[0]
+                elif msg_type == "data":
+                    yield data
+        finally:
+            # A disconnected or closed stream stops its crawl, started or not
+            if not finished:
+                CANCEL_FLAGS[search_id] = True
+                if cancel_worker():
+                    # The job never ran, so its own cleanup will not clear the flag
+                    CANCEL_FLAGS.pop(search_id, None)
 
     return StreamingResponse(
         async_wrapper(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache, no-transform",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-            "Access-Control-Allow-Origin": "*",
-        },
+        headers=SSE_HEADERS,
     )
@@ -0,0 +1,334 @@
+"""In-memory columnar index of parsed listing measurements.
+
+Every listing the backend parses (and every unexpired listing already in the
+listing cache at startup) gets a row of float64 columns, NaN where a value is
+missing, plus coded columns for its seller and the category and gender it was
+crawled under. Rows of listings that earn a negative verdict are marked dead.
+Changing a target or tolerance can then be answered by /api/search/instant as
+vectorized masks over the listings crawled for that category instead of a
+fresh crawl through _process_item. The masks reproduce _process_item's
+"match if present" semantics exactly. NumPy is optional: without it the
+index stays disabled.
+"""
+
+import datetime as dt
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from listing_cache import UNIVERSAL_NEGATIVE_REASONS
+from parser import parser
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+
+MEASUREMENT_INDEX_ENABLED = (
+    np is not None
+    and (os.environ.get("DEBOT_MEASUREMENT_INDEX") or "on").strip().lower() not in {"0", "false", "no", "off"}
+)
+INDEX_COLUMNS = (
+    "p2p", "length", "waist", "inseam", "rise", "legOpening", "sizeWaist", "shoeSize",
+    "listedTs", "soldCount", "price",
+)
+RECORD_COLUMNS = ("p2p", "length", "waist", "inseam", "rise", "legOpening", "sizeWaist", "shoeSize")
+# Item fields stored as int32 codes into a per-field vocabulary, -1 when missing
+CODE_COLUMNS = ("seller", "category", "gender")
+# Only what _build_match_payload reads is kept per row, never the description
+PAYLOAD_FIELDS = ("url", "image", "price", "listedAt", "seller", "sizeLabel", "soldCount")
+MEASUREMENT_CATEGORIES = {"tops", "coats-jackets"}
+INDEX_INITIAL_CAPACITY = 1024
+INDEX_LOAD_BATCH = 500
+PRICE_RX = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+
+def _price_value(price: Any) -> float:
+    match = PRICE_RX.search(str(price or ""))
+    return float(match.group(0).replace(",", "")) if match else float("nan")
+
+
+def _listed_ts(listed_at: Any) -> float:
+    if not listed_at:
+        return float("nan")
+    try:
+        listed = dt.datetime.fromisoformat(str(listed_at).replace("Z", "+00:00"))
+    except ValueError:
+        return float("nan")
+    if listed.tzinfo is None:
+        listed = listed.replace(tzinfo=dt.timezone.utc)
+    return listed.timestamp()
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value) if value is not None else float("nan")
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class MeasurementIndex:
+    """Growable NumPy columns aligned to listing URLs, queried with _process_item's predicates."""
+
+    def __init__(self, capacity: int = INDEX_INITIAL_CAPACITY):
+        self.initial_capacity = max(int(capacity), 1)
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._reset_locked()
+
+    def __len__(self) -> int:
+        return self._size - self._dead
+
+    @property
+    def is_open(self) -> bool:
+        return self.enabled
+
+    def _reset_locked(self) -> None:
+        self._capacity = 0
+        self._size = 0
+        self._dead = 0
+        self._columns: Dict[str, Any] = {}
+        self._codes: Dict[str, Any] = {}
+        self._live = None
+        self._vocab: Dict[str, Dict[str, int]] = {name: {} for name in CODE_COLUMNS}
+        self._positions: Dict[str, int] = {}
+        self._rows: List[Dict[str, Any]] = []
+
+    def open(self) -> None:
+        """Allocate the columns; a no-op without NumPy."""
+        with self._lock:
+            if self.enabled or np is None:
+                return
+            self._grow_locked(self.initial_capacity)
+            self.enabled = True
+
+    def close(self) -> None:
+        with self._lock:
+            self.enabled = False
+            self._reset_locked()
+
+    def _grow_locked(self, capacity: int) -> None:
+        for name in INDEX_COLUMNS:
+            column = np.full(capacity, np.nan)
+            if name in self._columns:
+                column[: self._size] = self._columns[name][: self._size]
+            self._columns[name] = column
+        for name in CODE_COLUMNS:
+            codes = np.full(capacity, -1, dtype=np.int32)
+            if name in self._codes:
+                codes[: self._size] = self._codes[name][: self._size]
+            self._codes[name] = codes
+        live = np.zeros(capacity, dtype=bool)
+        if self._live is not None:
+            live[: self._size] = self._live[: self._size]
+        self._live = live
+        self._capacity = capacity
+
+    def add(self, key: str, item: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Insert or replace one listing's row from its item and extract_all record."""
+        if not self.enabled or not key:
+            return
+        values = {name: parser.value(record, name) for name in RECORD_COLUMNS}
+        values["listedTs"] = _listed_ts(item.get("listedAt"))
+        values["soldCount"] = item.get("soldCount")
+        values["price"] = _price_value(item.get("price"))
+        labels = {name: str(item.get(name) or "").strip().lower() for name in CODE_COLUMNS}
+        with self._lock:
+            if not self.enabled:
+                return
+            position = self._positions.get(key)
+            if position is None:
+                if self._size >= self._capacity:
+                    self._grow_locked(self._capacity * 2)
+                position = self._size
+                self._size += 1
+                self._positions[key] = position
+                self._rows.append({})
+            elif not self._live[position]:
+                self._dead -= 1
+            self._live[position] = True
+            for name in INDEX_COLUMNS:
+                self._columns[name][position] = _number(values.get(name))
+            for name, label in labels.items():
+                vocab = self._vocab[name]
+                self._codes[name][position] = vocab.setdefault(label, len(vocab)) if label else -1
+            self._rows[position] = {field: item.get(field) for field in PAYLOAD_FIELDS}
+
+    def remove(self, key: str) -> None:
+        """Mark a listing's row dead so queries skip it; a later add revives it."""
+        with self._lock:
+            position = self._positions.get(key) if self.enabled else None
+            if position is not None and self._live[position]:
+                self._live[position] = False
+                self._dead += 1
+
+    def load(self, cache, negative_cache=None) -> int:
+        """Index the unexpired listings in a ListingCache, skipping any a NegativeCache rules out.
+
+        Returns how many rows were added.
+        """
+        if not self.enabled:
+            return 0
+        loaded = 0
+        batch: List[tuple] = []
+        for entry in cache.scan(fresh_only=True):
+            batch.append(entry)
+            if len(batch) >= INDEX_LOAD_BATCH:
+                loaded += self._load_batch(batch, negative_cache)
+                batch = []
+        return loaded + self._load_batch(batch, negative_cache)
+
+    def _load_batch(self, batch: List[tuple], negative_cache) -> int:
+        ruled_out = negative_cache.reasons([key for key, _ in batch]) if negative_cache is not None and batch else {}
+        loaded = 0
+        for key, fields in batch:
+            if ruled_out.get(key) in UNIVERSAL_NEGATIVE_REASONS:
+                continue
+            record = fields.get("measurements")
+            if not isinstance(record, dict) or record.get("version") != parser.RECORD_VERSION:
+                record = parser.extract_all(fields.get("description") or "", fields.get("sizeLabel") or "")
+            self.add(key, {"url": key, **fields}, record)
+            loaded += 1
+        return loaded
+
+    @staticmethod
+    def _within(values, lower: Optional[float], upper: Optional[float]):
+        # NaN compares False, so absent values fail here; callers OR in the "not present" rows
+        mask = np.ones(values.shape, dtype=bool)
+        if lower is not None:
+            mask &= values >= float(lower)
+        if upper is not None:
+            mask &= values <= float(upper)
+        return mask
+
+    def _category_mask_locked(self, category: str, target_p2p: Optional[float], target_length: Optional[float],
+                              p2p_tol: float, length_tol: float, size_range: Optional[Dict[str, Any]],
+                              bottoms_measurements: Optional[Dict[str, Dict[str, float]]]):
+        size = self._size
+        column = {name: values[:size] for name, values in self._columns.items()}
+        if category in MEASUREMENT_CATEGORIES:
+            mask = ~np.isnan(column["p2p"]) | ~np.isnan(column["length"])
+            for name, target, tol in (("p2p", target_p2p, p2p_tol), ("length", target_length, length_tol)):
+                if target is not None:
+                    mask &= np.isnan(column[name]) | (np.abs(column[name] - float(target)) <= float(tol))
+            return mask
+        if category == "accessories":
+            return np.ones(size, dtype=bool)
+        if category == "bottoms" and bottoms_measurements:
+            waist = np.where(np.isnan(column["waist"]), column["sizeWaist"], column["waist"])
+            values = {
+                "waist": waist,
+                "inseam": column["inseam"],
+                "rise": column["rise"],
+                "legOpening": column["legOpening"],
+                "inseamRise": column["inseam"] + column["rise"],
+            }
+            mask = np.ones(size, dtype=bool)
+            matched_any = np.zeros(size, dtype=bool)
+            for key, bounds in bottoms_measurements.items():
+                current = values.get(key)
+                if current is None:
+                    continue
+                present = ~np.isnan(current)
+                matched_any |= present
+                mask &= ~present | self._within(current, bounds.get("min"), bounds.get("max"))
+            return mask & matched_any
+        if category in {"bottoms", "footwear"}:
+            current = column["sizeWaist" if category == "bottoms" else "shoeSize"]
+            lower = size_range.get("min") if size_range else None
+            upper = size_range.get("max") if size_range else None
+            return ~np.isnan(current) & self._within(current, lower, upper)
+        return np.zeros(size, dtype=bool)
+
+    def _code_mask_locked(self, name: str, label: str):
+        # A label never indexed gets code -2, which no row has
+        code = self._vocab[name].get(label.strip().lower(), -2)
+        return self._codes[name][: self._size] == code
+
+    def query(self, category: str = "tops", target_p2p: Optional[float] = None,
+              target_length: Optional[float] = None, p2p_tol: float = 0.0, length_tol: float = 0.0,
+              size_range: Optional[Dict[str, Any]] = None,
+              bottoms_measurements: Optional[Dict[str, Dict[str, float]]] = None,
+              seller: Optional[str] = None, max_age_days: Optional[float] = None,
+              max_price: Optional[float] = None, min_sold_count: Optional[int] = None,
+              limit: Optional[int] = None, gender: Optional[str] = None) -> Dict[str, Any]:
+        """Return {"total", "matches"} for the listings _process_item would accept, newest first.
+
+        Only listings crawled under ``category`` (and ``gender``, when given) are
+        considered, as the streaming search only ever sees those. Each match
+        carries the stored payload fields, a fresh ageDays and the measurement
+        ``values`` _process_item would have reported.
+        """
+        if not self.enabled:
+            return {"total": 0, "matches": []}
+        with self._lock:
+            if not self.enabled:
+                return {"total": 0, "matches": []}
+            size = self._size
+            mask = self._category_mask_locked(
+                category, target_p2p, target_length, p2p_tol, length_tol, size_range, bottoms_measurements,
+            )
+            mask &= self._live[:size] & self._code_mask_locked("category", category)
+            listed = self._columns["listedTs"][:size]
+            if gender:
+                mask &= self._code_mask_locked("gender", gender)
+            if seller:
+                mask &= self._code_mask_locked("seller", seller)
+            # Unknown ages, prices and sold counts pass, as in the streaming search
+            if max_age_days is not None:
+                age_days = (time.time() - listed) / 86400.0
+                mask &= np.isnan(age_days) | (age_days <= float(max_age_days))
+            if max_price is not None:
+                price = self._columns["price"][:size]
+                mask &= np.isnan(price) | (price <= float(max_price))
+            if min_sold_count is not None:
+                sold = self._columns["soldCount"][:size]
+                mask &= np.isnan(sold) | (sold >= float(min_sold_count))
+
+            positions = np.flatnonzero(mask)
+            order = np.argsort(-np.nan_to_num(listed[positions], nan=-np.inf), kind="stable")
+            positions = positions[order[:limit] if limit is not None else order]
+            with_values = category in MEASUREMENT_CATEGORIES or (category == "bottoms" and bool(bottoms_measurements))
+            matches = [self._match_locked(int(position), category, with_values) for position in positions]
+        return {"total": int(mask.sum()), "matches": matches}
+
+    def _match_locked(self, position: int, category: str, with_values: bool) -> Dict[str, Any]:
+        def value(name: str) -> Optional[float]:
+            current = self._columns[name][position]
+            return None if np.isnan(current) else float(current)
+
+        row = dict(self._rows[position])
+        listed = value("listedTs")
+        row["ageDays"] = max((time.time() - listed) / 86400.0, 0.0) if listed is not None else None
+        row["values"] = {}
+        if with_values and category in MEASUREMENT_CATEGORIES:
+            row["values"] = {"p2p": value("p2p"), "length": value("length")}
+        elif with_values:
+            waist = value("waist")
+            inseam, rise = value("inseam"), value("rise")
+            row["values"] = {
+                "waist": waist if waist is not None else value("sizeWaist"),
+                "inseam": inseam,
+                "rise": rise,
+                "inseamRise": inseam + rise if inseam is not None and rise is not None else None,
+                "legOpening": value("legOpening"),
+            }
+        return row
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            column_bytes = sum(column.nbytes for column in self._columns.values())
+            return {
+                "enabled": self.enabled,
+                "listings": self._size - self._dead,
+                "sellers": len(self._vocab["seller"]),
+                "bytes": column_bytes + sum(codes.nbytes for codes in self._codes.values()) + (
+                    self._live.nbytes if self._live is not None else 0
+                ),
+            }
+
+
+MEASUREMENT_INDEX = MeasurementIndex()
@@ -0,0 +1,518 @@
+"""Process-wide pacing for Depop navigations.
+
+Every navigation start (sync and async engines) is spaced by one shared
+interval. The interval adapts AIMD-style: it shrinks by a fixed step after a
+run of clean navigations and is multiplied back up whenever Depop rate limits
+us. DEBOT_MIN_NAV_INTERVAL_SECONDS stays the hard minimum spacing (the floor),
+so the pacer only ever slows down from it and recovers back to it.
+
+Slots are handed out by a NavigationScheduler that keeps one queue per search
+and picks the next search by smooth weighted round-robin, so an interactive
+seller lookup is not starved by a long browse or following crawl. A shared
+CircuitBreaker stops every search at once while Depop is rate limiting and lets
+a single probe navigation through before everyone resumes. PacingStateStore
+keeps the interval, cooldown and recent 429s in a small JSON file so restarts
+resume where the last process left off.
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+def _read_float_env(name: str, default: float) -> float:
+    """Read a non-negative float environment value with a safe fallback."""
+    try:
+        value = float(os.environ.get(name, default))
+        return value if value >= 0 else default
+    except Exception:
+        return default
+
+
+def _read_int_env(name: str, default: int) -> int:
+    """Read a positive integer environment value with a safe fallback."""
+    try:
+        value = int(os.environ.get(name, default))
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+MIN_NAV_INTERVAL_SECONDS = _read_float_env("DEBOT_MIN_NAV_INTERVAL_SECONDS", 3.0)
+NAV_INTERVAL_CEILING_SECONDS = _read_float_env(
+    "DEBOT_NAV_INTERVAL_CEILING_SECONDS", max(15.0, MIN_NAV_INTERVAL_SECONDS)
+)
+NAV_INTERVAL_DECREASE_SECONDS = _read_float_env("DEBOT_NAV_INTERVAL_DECREASE_SECONDS", 0.25)
+NAV_INTERVAL_BACKOFF_FACTOR = max(_read_float_env("DEBOT_NAV_INTERVAL_BACKOFF_FACTOR", 2.0), 1.0)
+NAV_CLEAN_RUN_LENGTH = _read_int_env("DEBOT_NAV_CLEAN_RUN_LENGTH", 20)
+BREAKER_PROBE_TIMEOUT_SECONDS = _read_float_env("DEBOT_BREAKER_PROBE_TIMEOUT_SECONDS", 45.0)
+PACING_STATE_PATH = os.environ.get("DEBOT_STATE_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".debot_state.json"
+)
+# Routine writes (interval decreases) are coalesced; rate limits are written immediately
+PACING_STATE_MIN_WRITE_INTERVAL_SECONDS = 10.0
+RATE_LIMIT_HISTORY_LIMIT = 50
+
+
+class AdaptivePacer:
+    """AIMD navigation interval: additive decrease after clean runs, multiplicative increase on rate limits."""
+
+    def __init__(
+        self,
+        initial: float = MIN_NAV_INTERVAL_SECONDS,
+        floor: float = MIN_NAV_INTERVAL_SECONDS,
+        ceiling: float = NAV_INTERVAL_CEILING_SECONDS,
+        decrease: float = NAV_INTERVAL_DECREASE_SECONDS,
+        backoff: float = NAV_INTERVAL_BACKOFF_FACTOR,
+        clean_run: int = NAV_CLEAN_RUN_LENGTH,
+    ):
+        self.floor = min(floor, ceiling)
+        self.ceiling = ceiling
+        self.decrease = decrease
+        self.backoff = backoff
+        self.clean_run = max(clean_run, 1)
+        self._lock = threading.Lock()
+        self._interval = self._clamp(initial)
+        self._clean_streak = 0
+        self._next_start_at = 0.0
+        self._last_rate_limit_at: Optional[float] = None
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.floor), self.ceiling)
+
+    def interval(self) -> float:
+        """Return the current spacing between navigation starts, in seconds."""
+        return self._interval
+
+    def ready_in(self) -> float:
+        """Return how long until the next navigation may start."""
+        with self._lock:
+            return max(self._next_start_at - time.monotonic(), 0.0)
+
+    def reserve(self) -> float:
+        """Reserve the next navigation start slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start_at)
+            self._next_start_at = start_at + self._interval
+            return start_at - now
+
+    def set_interval(self, value: float) -> None:
+        """Adopt an interval (e.g. restored state), clamped to the floor and ceiling."""
+        with self._lock:
+            self._interval = self._clamp(value)
+            self._clean_streak = 0
+
+    def record_success(self) -> bool:
+        """Count a clean navigation; return whether a full clean run lowered the interval."""
+        with self._lock:
+            self._clean_streak += 1
+            if self._clean_streak < self.clean_run:
+                return False
+            self._clean_streak = 0
+            previous = self._interval
+            self._interval = self._clamp(self._interval - self.decrease)
+            return self._interval != previous
+
+    def record_rate_limit(self, retry_after_seconds: Optional[float] = None) -> None:
+        """Back off after a rate limit, holding the next start for a Retry-After hint (capped at the ceiling)."""
+        with self._lock:
+            self._clean_streak = 0
+            self._last_rate_limit_at = time.time()
+            self._interval = self._clamp(self._interval * self.backoff)
+            now = time.monotonic()
+            hold = min(max(float(retry_after_seconds or 0), 0.0), self.ceiling)
+            self._next_start_at = max(self._next_start_at, now + max(hold, self._interval))
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize the pacer for progress events and /api/stats."""
+        interval = self._interval
+        return {
+            "intervalSeconds": round(interval, 3),
+            "navigationsPerMinute": round(60.0 / interval, 1) if interval > 0 else None,
+            "floorSeconds": self.floor,
+            "ceilingSeconds": self.ceiling,
+            "cleanStreak": self._clean_streak,
+            "lastRateLimitAt": self._last_rate_limit_at,
+        }
+
+
+class CircuitBreaker:
+    """Process-wide rate-limit breaker: open pauses every search, half-open admits one probe."""
+
+    def __init__(self, probe_timeout: float = BREAKER_PROBE_TIMEOUT_SECONDS):
+        self.probe_timeout = probe_timeout
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._open_until = 0.0
+        self._probe_started_at = 0.0
+        self._retry_available_at: Optional[float] = None
+        self._listeners: Dict[str, Callable[..., None]] = {}
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def trip(self, cooldown_seconds: float) -> int:
+        """Open the breaker for at least cooldown_seconds; return the shared seconds until retry."""
+        with self._lock:
+            now = time.monotonic()
+            self._open_until = max(self._open_until, now + max(float(cooldown_seconds or 0), 0.0))
+            self._state = "open"
+            self._retry_available_at = time.time() + (self._open_until - now)
+            self.trips += 1
+            return int(round(self._open_until - now))
+
+    def restore(self, retry_available_at: float) -> None:
+        """Reopen the breaker until a wall-clock retry time saved by a previous process."""
+        remaining = float(retry_available_at) - time.time()
+        if remaining <= 0:
+            return
+        with self._lock:
+            self._open_until = max(self._open_until, time.monotonic() + remaining)
+            self._state = "open"
+            self._retry_available_at = float(retry_available_at)
+
+    @property
+    def retry_available_at(self) -> Optional[float]:
+        return self._retry_available_at
+
+    def ready_in(self) -> float:
+        """Return how long a navigation must wait before the breaker admits it."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == "open":
+                return max(self._open_until - now, 0.0)
+            if self._state == "half_open":
+                return max(self._probe_started_at + self.probe_timeout - now, 0.0)
+            return 0.0
+
+    def admit(self) -> None:
+        """Note that a navigation was let through; after a cooldown it becomes the probe."""
+        with self._lock:
+            if self._state in ("open", "half_open"):
+                self._state = "half_open"
+                self._probe_started_at = time.monotonic()
+
+    def record_success(self) -> bool:
+        """Close the breaker after a clean navigation; return whether it was half-open."""
+        with self._lock:
+            if self._state != "half_open":
+                return False
+            self._state = "closed"
+            self._retry_available_at = None
+            return True
+
+    def subscribe(self, search_id: Optional[str], callback: Callable[..., None]) -> None:
+        """Register a search's rate-limit notifier so trips by other searches reach it."""
+        if search_id:
+            with self._lock:
+                self._listeners[str(search_id)] = callback
+
+    def unsubscribe(self, search_id: Optional[str]) -> None:
+        with self._lock:
+            self._listeners.pop(str(search_id or ""), None)
+
+    def listeners(self) -> List[Tuple[str, Callable[..., None]]]:
+        with self._lock:
+            return list(self._listeners.items())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self._state,
+            "trips": self.trips,
+            "retryAvailableAt": self._retry_available_at,
+        }
+
+
+# Higher weights get proportionally more navigation slots while searches compete
+NAVIGATION_WEIGHTS: Dict[str, int] = {"seller": 4, "browse": 2, "following": 1}
+DEFAULT_NAVIGATION_WEIGHT = 2
+NAVIGATION_WAIT_STATS_LIMIT = 64
+NAVIGATION_CANCEL_POLL_SECONDS = 0.25
+# Async waiters poll instead of parking an executor thread on the condition
+NAVIGATION_ASYNC_POLL_SECONDS = 0.05
+_NAVIGATION_OWNER: contextvars.ContextVar[Tuple[str, str]] = contextvars.ContextVar(
+    "navigation_owner", default=("", "default")
+)
+
+
+@contextmanager
+def navigation_owner(search_id: Optional[str], kind: str):
+    """Attribute navigations started in this context to one search and its priority kind."""
+    token = _NAVIGATION_OWNER.set((str(search_id or ""), kind))
+    try:
+        yield
+    finally:
+        _NAVIGATION_OWNER.reset(token)
+
+
+def current_navigation_owner() -> Tuple[str, str]:
+    """Return the (search_id, kind) navigations in this context are billed to."""
+    return _NAVIGATION_OWNER.get()
+
+
+class _NavigationTicket:
+    __slots__ = ("owner", "granted")
+
+    def __init__(self, owner: str):
+        self.owner = owner
+        self.granted = False
+
+
+class NavigationScheduler:
+    """Hand out paced navigation slots across searches by smooth weighted round-robin."""
+
+    def __init__(
+        self,
+        pacer: AdaptivePacer,
+        breaker: Optional[CircuitBreaker] = None,
+        weights: Optional[Dict[str, int]] = None,
+    ):
+        self.pacer = pacer
+        self.breaker = breaker or CircuitBreaker()
+        self.weights = dict(NAVIGATION_WEIGHTS if weights is None else weights)
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[_NavigationTicket]] = {}
+        self._kinds: Dict[str, str] = {}
+        self._credits: Dict[str, int] = {}
+        self._wait_stats: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _weight(self, owner: str) -> int:
+        return max(int(self.weights.get(self._kinds.get(owner, ""), DEFAULT_NAVIGATION_WEIGHT)), 1)
+
+    def _enqueue(self, owner: str, kind: str) -> _NavigationTicket:
+        ticket = _NavigationTicket(owner)
+        self._kinds[owner] = kind
+        self._queues.setdefault(owner, deque()).append(ticket)
+        return ticket
+
+    def _grant_next(self) -> None:
+        """Grant the head ticket of the owner with the most accumulated credit."""
+        total = 0
+        winner = None
+        for owner in self._queues:
+            weight = self._weight(owner)
+            total += weight
+            self._credits[owner] = self._credits.get(owner, 0) + weight
+            if winner is None or self._credits[owner] > self._credits[winner]:
+                winner = owner
+        if winner is None:
+            return
+
+        self._credits[winner] -= total
+        queue = self._queues[winner]
+        queue.popleft().granted = True
+        if not queue:
+            self._drop_owner(winner)
+        self.breaker.admit()
+        self.pacer.reserve()
+        self._cond.notify_all()
+
+    def _drop_owner(self, owner: str) -> None:
+        self._queues.pop(owner, None)
+        self._credits.pop(owner, None)
+        self._kinds.pop(owner, None)
+
+    def _discard(self, ticket: _NavigationTicket) -> None:
+        queue = self._queues.get(ticket.owner)
+        if queue is None:
+            return
+        try:
+            queue.remove(ticket)
+        except ValueError:
+            return
+        if not queue:
+            self._drop_owner(ticket.owner)
+        self._cond.notify_all()
+
+    def _record_wait(self, owner: str, kind: str, waited: float) -> None:
+        with self._cond:
+            stats = self._wait_stats.pop(owner, None) or {
+                "kind": kind, "navigations": 0, "totalWaitSeconds": 0.0, "maxWaitSeconds": 0.0,
+            }
+            stats["navigations"] += 1
+            stats["totalWaitSeconds"] = round(stats["totalWaitSeconds"] + waited, 3)
+            stats["maxWaitSeconds"] = round(max(stats["maxWaitSeconds"], waited), 3)
+            stats["lastWaitSeconds"] = round(waited, 3)
+            self._wait_stats[owner] = stats
+            while len(self._wait_stats) > NAVIGATION_WAIT_STATS_LIMIT:
+                self._wait_stats.popitem(last=False)
+
+    def _step_locked(self, ticket: _NavigationTicket, should_cancel: Optional[Callable[[], bool]]) -> Optional[float]:
+        """Advance one waiting ticket: 0 once granted, None if cancelled, else seconds until the next slot."""
+        while not ticket.granted:
+            if should_cancel is not None and should_cancel():
+                self._discard(ticket)
+                return None
+            wait = max(self.pacer.ready_in(), self.breaker.ready_in())
+            if wait > 0:
+                return wait
+            self._grant_next()
+        return 0.0
+
+    def acquire(self, should_cancel: Optional[Callable[[], bool]] = None) -> Optional[float]:
+        """Block until this context's search owns the next slot; return seconds waited, or None if cancelled."""
+        owner, kind = current_navigation_owner()
+        enqueued_at = time.monotonic()
+        with self._cond:
+            ticket = self._enqueue(owner, kind)
+            try:
+                while True:
+                    wait = self._step_locked(ticket, should_cancel)
+                    if wait is None:
+                        return None
+                    if wait <= 0:
+                        break
+                    if should_cancel is not None:
+                        wait = min(wait, NAVIGATION_CANCEL_POLL_SECONDS)
+                    self._cond.wait(wait)
+            except BaseException:
+                if not ticket.granted:
+                    self._discard(ticket)
+                raise
+
+        waited = time.monotonic() - enqueued_at
+        self._record_wait(owner, kind, waited)
+        return waited
+
+    async def acquire_async(self, should_cancel: Optional[Callable[[], bool]] = None) -> Optional[float]:
+        """Async acquire that polls on the event loop, so task cancellation stops the wait at once."""
+        owner, kind = current_navigation_owner()
+        enqueued_at = time.monotonic()
+        with self._cond:
+            ticket = self._enqueue(owner, kind)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._step_locked(ticket, should_cancel)
+                if wait is None:
+                    return None
+                if wait <= 0:
+                    break
+                await asyncio.sleep(min(wait, NAVIGATION_ASYNC_POLL_SECONDS))
+        except BaseException:
+            with self._cond:
+                if not ticket.granted:
+                    self._discard(ticket)
+            raise
+
+        waited = time.monotonic() - enqueued_at
+        self._record_wait(owner, kind, waited)
+        return waited
+
+    def wake(self) -> None:
+        """Re-check waiting navigations, e.g. after the breaker closes."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait_stats(self, search_id: Optional[str] = None) -> Any:
+        """Return wait statistics for one search, or for every recent search."""
+        with self._cond:
+            if search_id is not None:
+                stats = self._wait_stats.get(str(search_id))
+                return dict(stats) if stats else None
+            return {
+                "waiting": {owner: len(queue) for owner, queue in self._queues.items()},
+                "searches": {owner: dict(stats) for owner, stats in self._wait_stats.items()},
+            }
+
+
+class PacingStateStore:
+    """Atomic JSON file holding the pacer interval, breaker cooldown and recent 429 history."""
+
+    def __init__(
+        self,
+        path: str,
+        pacer: AdaptivePacer,
+        breaker: CircuitBreaker,
+        min_write_interval: float = PACING_STATE_MIN_WRITE_INTERVAL_SECONDS,
+    ):
+        self.path = path
+        self.pacer = pacer
+        self.breaker = breaker
+        self.min_write_interval = min_write_interval
+        self.enabled = False
+        self.extras: Dict[str, Any] = {}
+        self.rate_limit_history: Deque[float] = deque(maxlen=RATE_LIMIT_HISTORY_LIMIT)
+        self._lock = threading.Lock()
+        self._last_write_at = 0.0
+        self._dirty = False
+
+    def load(self) -> Dict[str, Any]:
+        """Restore saved state into the pacer and breaker and enable write-through."""
+        self.enabled = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        if isinstance(data.get("intervalSeconds"), (int, float)):
+            self.pacer.set_interval(float(data["intervalSeconds"]))
+        if isinstance(data.get("cooldownUntil"), (int, float)):
+            self.breaker.restore(float(data["cooldownUntil"]))
+        history = data.get("rateLimitHistory")
+        if isinstance(history, list):
+            self.rate_limit_history.extend(float(ts) for ts in history if isinstance(ts, (int, float)))
+        self.extras.update(data.get("extras") or {})
+        return data
+
+    def record_rate_limit(self) -> None:
+        """Append a 429 to the history and write the new cooldown out immediately."""
+        self.rate_limit_history.append(time.time())
+        self.save(force=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "savedAt": time.time(),
+            "intervalSeconds": self.pacer.interval(),
+            "cooldownUntil": self.breaker.retry_available_at,
+            "rateLimitHistory": list(self.rate_limit_history),
+            "extras": dict(self.extras),
+        }
+
+    def save(self, force: bool = False) -> bool:
+        """Write the state atomically; unforced writes are coalesced to one per interval."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_write_at < self.min_write_interval:
+                self._dirty = True
+                return False
+            directory = os.path.dirname(os.path.abspath(self.path))
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(prefix=".debot_state.", suffix=".tmp", dir=directory)
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(self.snapshot(), handle)
+                os.replace(temp_path, self.path)
+            except OSError:
+                if temp_path and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                return False
+            self._last_write_at = now
+            self._dirty = False
+            return True
+
+    def flush(self) -> bool:
+        """Write any coalesced changes, e.g. on shutdown."""
+        return self.save(force=True) if self._dirty else False
+
+
+# Shared by every navigation in the process
+NAVIGATION_PACER = AdaptivePacer()
+NAVIGATION_BREAKER = CircuitBreaker()
+NAVIGATION_SCHEDULER = NavigationScheduler(NAVIGATION_PACER, NAVIGATION_BREAKER)
+PACING_STATE = PacingStateStore(PACING_STATE_PATH, NAVIGATION_PACER, NAVIGATION_BREAKER)
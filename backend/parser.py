@@ -1,8 +1,88 @@
 """Measurement parsing utilities for extracting listing measurements."""
 
+import os
+import multiprocessing
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
-from typing import Optional, Tuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class LabelCandidate(NamedTuple):
+    """A value found next to a measurement label on one line."""
+
+    family: str
+    label: str
+    order: str  # "after" when the value follows the label, "before" when it precedes it
+    val: str
+    unit: str
+    start: int
+    end: int
+
+
+class LabelMatcher:
+    """Finds the labeled values of several label families in a single scan of a line.
+
+    One alternation locates every label occurrence; anchored value patterns then read
+    the number right after (or right before) each label. Resolution keeps the old
+    per-family semantics: the leftmost value after a label wins, else the leftmost
+    value before one.
+    """
+
+    def __init__(self, families: Dict[str, str], num: str, unit: str, gap: int):
+        self.families = tuple(families)
+        self.label_rx = re.compile(
+            "|".join(rf"\b(?P<{family}>{pattern})\b" for family, pattern in families.items()),
+            re.I,
+        )
+        self.value_after_rx = re.compile(rf'[^0-9\n]{{0,{gap}}}{num}{unit}', re.I)
+        self.value_before_rx = re.compile(rf'{num}{unit}[^a-z0-9\n]{{0,{gap}}}$', re.I)
+        # How far before a label a preceding value (number, unit and gap) can start
+        self.lookback = gap + 32
+
+    def candidates(self, line: str) -> Dict[str, List[LabelCandidate]]:
+        """Return every label family's candidates on line, in label order."""
+        table: Dict[str, List[LabelCandidate]] = {}
+        pos = 0
+        while True:
+            hit = self.label_rx.search(line, pos)
+            if hit is None:
+                return table
+            family = hit.lastgroup
+            found = table.setdefault(family, [])
+            after = self.value_after_rx.match(line, hit.end())
+            if after:
+                found.append(LabelCandidate(
+                    family, hit.group(), "after", after.group("val"), after.group("unit") or "", hit.start(), after.end(),
+                ))
+            before = self.value_before_rx.search(line, max(hit.start() - self.lookback, 0), hit.start())
+            if before:
+                found.append(LabelCandidate(
+                    family, hit.group(), "before", before.group("val"), before.group("unit") or "", before.start(), hit.end(),
+                ))
+            # Step one character so labels overlapping this one (e.g. "chest" in "across chest") are seen too
+            pos = hit.start() + 1
+
+    def resolve(self, line: str, convert: Callable[[str, str], float]) -> Dict[str, Tuple[float, LabelCandidate]]:
+        """Resolve each family on line to one value and the candidate it came from, preferring a value after its label."""
+        resolved: Dict[str, Tuple[float, LabelCandidate]] = {}
+        for family, found in self.candidates(line).items():
+            for order in ("after", "before"):
+                candidate = next((c for c in found if c.order == order), None)
+                if candidate is None:
+                    continue
+                try:
+                    resolved[family] = (convert(candidate.val, candidate.unit), candidate)
+                    break
+                except Exception:
+                    continue
+        return resolved
+
+    def values(self, line: str, convert: Callable[[str, str], float]) -> Dict[str, float]:
+        """Resolve each family on line to one value."""
+        return {family: value for family, (value, _) in self.resolve(line, convert).items()}
 
 
 class MeasurementParser:
@@ -22,6 +102,34 @@ class MeasurementParser:
     RISE_LABELS = r'(?:front\s*rise|rise)'
     LEG_OPENING_LABELS = r'(?:leg\s*opening|bottom\s*hem|bottom\s*opening|hem\s*opening|ankle\s*opening|leg\s*hem|leg)'
     
+    # A bare shoulder label must not claim "shoulder to cuff", which is a sleeve
+    SHOULDER_LABELS = r'(?:shoulder\s*to\s*shoulder|shoulder\s*width|across\s*shoulders?|shoulders?(?!\s*to\s*cuff))'
+    SLEEVE_LABELS = (
+        r'(?:sleeve\s*length|sleeves?|arm\s*length|shoulder\s*to\s*cuff|pit\s*to\s*cuff|'
+        r'underarm\s*sleeve)'
+    )
+    # Earlier families win a label start shared with later ones ("shoulder to hem" is a length)
+    LABEL_FAMILIES = {
+        "p2p": P2P_LABELS,
+        "length": LENGTH_LABELS,
+        "waist": WAIST_LABELS,
+        "inseam": INSEAM_LABELS,
+        "rise": RISE_LABELS,
+        "legOpening": LEG_OPENING_LABELS,
+        "shoulder": SHOULDER_LABELS,
+        "sleeve": SLEEVE_LABELS,
+    }
+    LABEL_MATCHER = LabelMatcher(LABEL_FAMILIES, NUM, UNIT, LINE_LABEL_GAP)
+    MEASUREMENT_KEYS = tuple(LABEL_FAMILIES)
+    TOPS_KEYS = ("p2p", "length")
+    BOTTOMS_KEYS = ("waist", "inseam", "rise", "legOpening")
+    # Matchers over the first n label families, built on demand for partial extractions
+    _PREFIX_MATCHERS: Dict[int, LabelMatcher] = {len(LABEL_FAMILIES): LABEL_MATCHER}
+    # Confidence by how a value was found; bottoms pairs scale with the words around them
+    SOURCE_CONFIDENCE = {"label": 0.9, "label_before": 0.8, "pair": 0.6, "size_label": 0.5}
+    BOTTOMS_PAIR_CONFIDENCE = {3: 0.7, 2: 0.5, 1: 0.3}
+    RECORD_VERSION = 1
+
     RE_P2P = re.compile(rf'\b{P2P_LABELS}\b[^0-9]{{0,10}}{NUM}{UNIT}', re.I)
     RE_LENGTH = re.compile(rf'\b{LENGTH_LABELS}\b[^0-9]{{0,10}}{NUM}{UNIT}', re.I)
     RE_WAIST = re.compile(rf'\b{WAIST_LABELS}\b[^0-9]{{0,10}}{NUM}{UNIT}', re.I)
@@ -51,6 +159,14 @@ class MeasurementParser:
     )
     RE_BOTTOMS_SIZE_HINT = re.compile(r'\bsize[:\s]+(?P<waist>\d+(?:\.\d+)?)\b', re.I)
     RE_BOTTOMS_FITS_WAIST = re.compile(r'\bfits\s+a\s+(?P<waist>\d+(?:\.\d+)?)\s*waist\b', re.I)
+    RE_SIZE_LABEL_WAIST = (
+        re.compile(r'\bw\s*(\d{2})(?:\.\d+)?\b', re.I),
+        re.compile(r'\b(\d{2})(?:\.\d+)?\s*(?:\"|in)?\b', re.I),
+    )
+    RE_SIZE_LABEL_SHOE = (
+        re.compile(r'\bUS\s*(\d+(?:\.\d+)?)\b', re.I),
+        re.compile(r'\b(\d+(?:\.\d+)?)\b'),
+    )
 
     def to_inches(self, num_str: str, unit_str: str = "") -> float:
         """Convert a measurement string to inches."""
@@ -68,22 +184,6 @@ class MeasurementParser:
             return value / 2.54
         return value
 
-    def _extract_labeled_value_from_line(self, line: str, label_pattern: str) -> Optional[float]:
-        """Extract a labeled measurement from a single line, supporting either label order."""
-        patterns = (
-            re.compile(rf'\b{label_pattern}\b[^0-9\n]{{0,{self.LINE_LABEL_GAP}}}{self.NUM}{self.UNIT}', re.I),
-            re.compile(rf'{self.NUM}{self.UNIT}[^a-z0-9\n]{{0,{self.LINE_LABEL_GAP}}}\b{label_pattern}\b', re.I),
-        )
-        for pattern in patterns:
-            match = pattern.search(line)
-            if not match:
-                continue
-            try:
-                return self.to_inches(match.group("val"), match.group("unit") or "")
-            except Exception:
-                continue
-        return None
-
     def _extract_pair_from_line(
         self,
         line: str,
@@ -146,121 +246,192 @@ class MeasurementParser:
         segments = [segment.strip(" ()[]") for segment in re.split(r"[,;&|]+", line) if segment.strip()]
         return segments or [line]
 
-    def extract_tops(self, text: str) -> Tuple[Optional[float], Optional[float]]:
-        """Extract P2P and length measurements from text."""
-        t = (text or "").lower().replace("\u201d", '"').replace("\u2033", '"')
+    def _normalize_text(self, text: str) -> str:
+        return (text or "").lower().replace("\u201d", '"').replace("\u2033", '"')
 
-        p2p = None
-        length = None
+    def _first_size_label_number(self, size_label: str, patterns: Tuple[re.Pattern, ...]) -> Optional[float]:
+        text = (size_label or "").strip()
+        if not text:
+            return None
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                try:
+                    return float(match.group(1))
+                except Exception:
+                    return None
+        return None
 
-        for raw_line in t.splitlines():
+    def size_label_waist(self, size_label: str) -> Optional[float]:
+        """Extract a numeric waist size from a Depop bottoms size label."""
+        return self._first_size_label_number(size_label, self.RE_SIZE_LABEL_WAIST)
+
+    def size_label_shoe(self, size_label: str) -> Optional[float]:
+        """Extract a numeric US shoe size from a Depop footwear size label."""
+        return self._first_size_label_number(size_label, self.RE_SIZE_LABEL_SHOE)
+
+    def _label_matcher(self, keys: Iterable[str]) -> LabelMatcher:
+        """Return a matcher that finds exactly what the full one finds for keys.
+
+        It keeps every family up to the last requested one, since an earlier
+        family can claim a label start that a later one would also match.
+        """
+        depth = max((self.MEASUREMENT_KEYS.index(key) + 1 for key in keys), default=0)
+        matcher = self._PREFIX_MATCHERS.get(depth)
+        if matcher is None:
+            families = dict(list(self.LABEL_FAMILIES.items())[:depth])
+            matcher = LabelMatcher(families, self.NUM, self.UNIT, self.LINE_LABEL_GAP)
+            self._PREFIX_MATCHERS[depth] = matcher
+        return matcher
+
+    def extract_all(self, text: str, size_label: str = "", families: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Extract every supported measurement in one pass over the description.
+
+        Each measurement is None or a dict with its value in inches, the source it
+        came from ("label", "label_before", "pair", "wl_pair"), a confidence and the
+        text it was read from. ``sizeWaist`` and ``shoeSize`` come from the size label.
+
+        ``families`` limits the work to those keys and leaves the others None;
+        such partial records are for immediate use, never for storing.
+        """
+        wanted = set(self.MEASUREMENT_KEYS) | {"sizeWaist", "shoeSize"} if families is None else set(families)
+        label_keys = [key for key in self.MEASUREMENT_KEYS if key in wanted]
+        matcher = self._label_matcher(label_keys) if label_keys else None
+        wants_tops_pair = any(key in wanted for key in self.TOPS_KEYS)
+        wants_bottoms_pair = "waist" in wanted or "inseam" in wanted
+        # First-found keys never change once set, so a scan that only needs those can stop early
+        can_stop_early = not any(key in wanted for key in self.BOTTOMS_KEYS)
+        t = self._normalize_text(text)
+        found: Dict[str, Optional[Dict[str, Any]]] = {key: None for key in self.MEASUREMENT_KEYS}
+        bottoms_priorities = {key: -1 for key in self.BOTTOMS_KEYS}
+
+        def entry(value: float, source: str, snippet: str, confidence: Optional[float] = None) -> Dict[str, Any]:
+            return {
+                "value": value,
+                "source": source,
+                "confidence": self.SOURCE_CONFIDENCE[source] if confidence is None else confidence,
+                "text": snippet,
+            }
+
+        def assign_first(key: str, value: Dict[str, Any]) -> None:
+            if found[key] is None:
+                found[key] = value
+
+        def assign_bottoms(key: str, value: Dict[str, Any], priority: int) -> None:
+            # Later values of equal priority win, as extract_bottoms always did
+            if priority >= bottoms_priorities[key]:
+                found[key] = value
+                bottoms_priorities[key] = priority
+
+        def pair_priority(segment: str) -> int:
+            if any(token in segment for token in ("measurement", "measured", "waist", "inseam")):
+                return 3
+            if any(token in segment for token in ("tagged", "size", "fits")):
+                return 1
+            return 2
+
+        for raw_line in t.splitlines() if matcher is not None else ():
             line = raw_line.strip()
             if not line:
                 continue
+            if can_stop_early and all(found[key] is not None for key in label_keys):
+                break
 
             for segment in self._split_measurement_segments(line):
-                if p2p is None:
-                    p2p = self._extract_labeled_value_from_line(segment, self.P2P_LABELS)
-                if length is None:
-                    length = self._extract_labeled_value_from_line(segment, self.LENGTH_LABELS)
-
-                if p2p is None or length is None:
-                    pair = self._extract_pair_from_line(
-                        segment,
-                        self.RE_PAIR_X,
-                        skip_if_contains=("tagged",),
-                    )
+                for key, (value, candidate) in matcher.resolve(segment, self.to_inches).items():
+                    if key not in wanted:
+                        continue
+                    source = "label" if candidate.order == "after" else "label_before"
+                    labeled = entry(value, source, segment[candidate.start:candidate.end])
+                    if key in bottoms_priorities:
+                        assign_bottoms(key, labeled, 3)
+                    else:
+                        assign_first(key, labeled)
+
+                if wants_tops_pair and (found["p2p"] is None or found["length"] is None):
+                    pair = self._extract_pair_from_line(segment, self.RE_PAIR_X, skip_if_contains=("tagged",))
                     if pair:
-                        pair_p2p, pair_length = pair
-                        if pair_length < pair_p2p:
-                            pair_p2p, pair_length = pair_length, pair_p2p
-                        if p2p is None:
-                            p2p = pair_p2p
-                        if length is None:
-                            length = pair_length
-
-                if p2p is not None and length is not None:
-                    break
-
-            if p2p is not None and length is not None:
-                break
-
-        return p2p, length
-
-    def extract_bottoms(self, text: str) -> dict[str, Optional[float]]:
-        """Extract waist, inseam, rise, and leg opening from text."""
-        t = (text or "").lower().replace("\u201d", '"').replace("\u2033", '"')
-
-        measurements = {
-            "waist": None,
-            "inseam": None,
-            "rise": None,
-            "legOpening": None,
-        }
-        priorities = {key: -1 for key in measurements}
-        label_map = {
-            "waist": self.WAIST_LABELS,
-            "inseam": self.INSEAM_LABELS,
-            "rise": self.RISE_LABELS,
-            "legOpening": self.LEG_OPENING_LABELS,
+                        pair_p2p, pair_length = sorted(pair)
+                        assign_first("p2p", entry(pair_p2p, "pair", segment))
+                        assign_first("length", entry(pair_length, "pair", segment))
+
+                for source, pair_regex in (("pair", self.RE_BOTTOMS_PAIR), ("wl_pair", self.RE_BOTTOMS_WL_PAIR)):
+                    if not wants_bottoms_pair:
+                        break
+                    pair = self._extract_pair_from_line(segment, pair_regex)
+                    if pair:
+                        priority = pair_priority(segment)
+                        confidence = self.BOTTOMS_PAIR_CONFIDENCE[priority]
+                        assign_bottoms("waist", entry(pair[0], source, segment, confidence), priority)
+                        assign_bottoms("inseam", entry(pair[1], source, segment, confidence), priority)
+
+        waist = found["waist"]
+        if waist is not None:
+            full_waist = self._normalize_bottoms_waist(waist["value"], t)
+            if full_waist != waist["value"]:
+                found["waist"] = {**waist, "value": full_waist, "flatDoubled": True}
+
+        for key in self.MEASUREMENT_KEYS:
+            if key not in wanted:
+                found[key] = None
+        size_waist = self.size_label_waist(size_label) if "sizeWaist" in wanted else None
+        shoe_size = self.size_label_shoe(size_label) if "shoeSize" in wanted else None
+        return {
+            "version": self.RECORD_VERSION,
+            **found,
+            "sizeWaist": entry(size_waist, "size_label", size_label) if size_waist is not None else None,
+            "shoeSize": entry(shoe_size, "size_label", size_label) if shoe_size is not None else None,
         }
 
-        def assign_value(key: str, value: Optional[float], priority: int) -> None:
-            if value is None:
-                return
-            if priority >= priorities[key]:
-                measurements[key] = value
-                priorities[key] = priority
+    @staticmethod
+    def value(record: Dict[str, Any], key: str) -> Optional[float]:
+        """Return a measurement value from an extract_all record."""
+        measurement = record.get(key)
+        return measurement["value"] if measurement else None
 
-        def pair_priority(line: str) -> int:
-            lowered = line.lower()
-            if any(token in lowered for token in ("measurement", "measured", "waist", "inseam")):
-                return 3
-            if any(token in lowered for token in ("tagged", "size", "fits")):
-                return 1
-            return 2
-
-        for line in t.splitlines():
-            normalized_line = line.strip()
-            if not normalized_line:
-                continue
+    def extract_many(
+        self,
+        items: Iterable[Any],
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield extract_all records for descriptions (or (description, size_label) pairs) in input order.
+
+        Chunks fan out over a process pool with at most two in flight per
+        worker, so long inputs stream without being materialized; workers=1
+        parses inline.
+        """
+        pairs = ((item, "") if isinstance(item, str) else (item[0] or "", item[1] or "") for item in items)
+        chunks = iter(lambda: list(islice(pairs, max(int(chunksize), 1))), [])
+        workers = max(int(workers or os.cpu_count() or 1), 1)
+        if workers == 1:
+            for chunk in chunks:
+                yield from _extract_all_chunk(chunk)
+            return
+
+        # spawn: forking a threaded parent (the app's cache flushers, Playwright) can deadlock the children
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pending = deque()
+            try:
+                for chunk in chunks:
+                    pending.append(pool.submit(_extract_all_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
-            for segment in self._split_measurement_segments(normalized_line):
-                for key, label_pattern in label_map.items():
-                    value = self._extract_labeled_value_from_line(segment, label_pattern)
-                    assign_value(key, value, 3)
-
-                pair = self._extract_pair_from_line(
-                    segment,
-                    self.RE_BOTTOMS_PAIR,
-                    skip_if_contains=(),
-                )
-                if pair:
-                    waist_value, inseam_value = pair
-                    priority = pair_priority(segment)
-                    assign_value("waist", waist_value, priority)
-                    assign_value("inseam", inseam_value, priority)
-
-                wl_pair = self._extract_pair_from_line(
-                    segment,
-                    self.RE_BOTTOMS_WL_PAIR,
-                    skip_if_contains=(),
-                )
-                if wl_pair:
-                    waist_value, inseam_value = wl_pair
-                    priority = pair_priority(segment)
-                    assign_value("waist", waist_value, priority)
-                    assign_value("inseam", inseam_value, priority)
-
-        waist_value = measurements["waist"]
-        waist_value = self._normalize_bottoms_waist(waist_value, t)
+    def extract_tops(self, text: str) -> Tuple[Optional[float], Optional[float]]:
+        """Extract P2P and length measurements from text."""
+        record = self.extract_all(text, families=self.TOPS_KEYS)
+        return self.value(record, "p2p"), self.value(record, "length")
 
-        return {
-            "waist": waist_value,
-            "inseam": measurements["inseam"],
-            "rise": measurements["rise"],
-            "legOpening": measurements["legOpening"],
-        }
+    def extract_bottoms(self, text: str) -> dict[str, Optional[float]]:
+        """Extract waist, inseam, rise, and leg opening from text."""
+        record = self.extract_all(text, families=self.BOTTOMS_KEYS)
+        return {key: self.value(record, key) for key in self.BOTTOMS_KEYS}
 
     def within(self, val: Optional[float], target: Optional[float], tol: float) -> bool:
         """Check if a value is within tolerance of target."""
@@ -273,3 +444,8 @@ class MeasurementParser:
 
 # Singleton instance
 parser = MeasurementParser()
+
+
+def _extract_all_chunk(chunk: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Process-pool worker for extract_many."""
+    return [parser.extract_all(text, size_label) for text, size_label in chunk]
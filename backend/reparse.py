@@ -0,0 +1,66 @@
+"""Re-parse every stored listing description and write the measurement records back.
+
+Run from backend/ after a parser change so cached listings carry fresh
+extract_all records without being scraped again:
+
+    python reparse.py [--db PATH] [--workers N] [--chunksize N] [--batch N]
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+
+from listing_cache import LISTING_CACHE_PATH, ListingCache
+from parser import parser
+
+
+def reparse_listings(
+    cache: ListingCache,
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    batch: int = 1000,
+) -> int:
+    """Re-run extract_all over every cached description; return how many records were written."""
+    urls: deque = deque()
+
+    def descriptions() -> Iterator[Tuple[str, str]]:
+        for url, fields in cache.scan():
+            if fields.get("description") is None:
+                continue
+            urls.append(url)
+            yield fields.get("description") or "", fields.get("sizeLabel") or ""
+
+    written = 0
+    for record in parser.extract_many(descriptions(), workers=workers, chunksize=chunksize):
+        cache.put(urls.popleft(), {"measurements": record})
+        written += 1
+        if written % batch == 0:
+            cache.flush()
+    cache.flush()
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args_parser.add_argument("--db", default=LISTING_CACHE_PATH, help="listing cache database")
+    args_parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    args_parser.add_argument("--chunksize", type=int, default=256, help="descriptions per worker task")
+    args_parser.add_argument("--batch", type=int, default=1000, help="records per write transaction")
+    args = args_parser.parse_args(argv)
+
+    # The background flusher is not needed: writes go out in explicit batches
+    cache = ListingCache(args.db, flush_interval=3600, batch_size=max(args.batch, 1) * 2)
+    cache.open()
+    started = time.perf_counter()
+    try:
+        written = reparse_listings(cache, args.workers, args.chunksize, max(args.batch, 1))
+    finally:
+        cache.close()
+    print(f"re-parsed {written} listings in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
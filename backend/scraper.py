@@ -3,15 +3,21 @@
 import re
 import time
 import json
+import html as html_lib
 import os
 import threading
+import weakref
 import datetime as dt
 from email.utils import parsedate_to_datetime
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Set
 from urllib.parse import urljoin, urlparse, urlencode
 
 from playwright.sync_api import sync_playwright, Page, BrowserContext
 
+from asset_cache import STATIC_ASSETS, cached_asset_headers, is_cacheable_asset
+from pacing import NAVIGATION_BREAKER, NAVIGATION_PACER, NAVIGATION_SCHEDULER, PACING_STATE
+from singleflight import SingleFlight, normalize_flight_url
+
 # Constants
 PRICE_RX = re.compile(r"([$£€]\s?\d[\d,]*(?:\.\d{2})?)")
 RELTIME_RX = re.compile(r"\b(\d+)\s*(minute|hour|day|week|month)s?\s*ago\b", re.I)
@@ -22,7 +28,22 @@ CREATED_AT_RX = re.compile(
     re.I,
 )
 SOLD_COUNT_RX = re.compile(r"(\d[\d,]*)\s*sold\b", re.I)
+JSON_LD_SCRIPT_RX = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.I | re.S,
+)
+TIME_DATETIME_RX = re.compile(r"<time[^>]*\bdatetime=[\"']([^\"']+)[\"'][^>]*>(.*?)</time>", re.I | re.S)
+SHOP_LINK_HREF_RX = re.compile(r"<a[^>]*aria-label=[\"'][^\"']*'s shop[\"'][^>]*href=[\"']([^\"']+)[\"']", re.I)
+LISTED_BY_RX = re.compile(r"item listed by ([A-Za-z0-9._-]+)", re.I)
+NON_CONTENT_BLOCK_RX = re.compile(r"<(script|style|noscript|template)\b[^>]*>.*?</\1>", re.I | re.S)
+BLOCK_BREAK_RX = re.compile(r"<(?:br|/p|/div|/li|/h[1-6]|/section|/article|/tr|/dt|/dd|/button|/span)\b[^>]*>", re.I)
+HTML_TAG_RX = re.compile(r"<[^>]+>")
 BROWSE_URL = "https://www.depop.com/ca/category/mens/tops/?sort=newlyListed"
+TILE_SIZE_BADGE_RX = re.compile(
+    r"^(?:xxxs|xxs|xs|s|m|l|xl|xxl|xxxl|one size|"
+    r"(?:us|uk|eu|w)\s*\d+(?:\.\d+)?(?:\s*/\s*l\s*\d+)?)$",
+    re.I,
+)
 SIZE_LINE_RX = re.compile(r"^\s*size(?:\s*[:\-])?\s+(.+?)\s*$", re.I)
 CURRENCY_SYMBOLS = {
     "USD": "US$",
@@ -35,6 +56,8 @@ SCROLL_STEP_RATIO = 0.7
 MAX_STALLED_SCROLL_STEPS = 3
 EARLY_SCROLL_STALL_BUFFER = 2
 EARLY_SCROLL_LINK_THRESHOLD = 24
+# Known links a newest-first grid must show before a delta crawl stops scrolling (tolerates one bumped listing)
+KNOWN_LINKS_BEFORE_STOP = 2
 BROWSE_END_SCROLL_WAIT_MS = 2500
 LOGIN_MODAL_MAX_ATTEMPTS = 6
 LOGIN_MODAL_WAIT_MS = 250
@@ -65,6 +88,8 @@ RATE_LIMIT_CHALLENGE_SIGNALS = (
     "security check",
     "please enable cookies",
 )
+# Characters of body text check_page_for_rate_limit pulls before deciding a full scan is needed
+RATE_LIMIT_SAMPLE_CHARS = 2_000
 BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
 BLOCKED_URL_SIGNALS = (
     "google-analytics.com",
@@ -81,10 +106,263 @@ BLOCKED_URL_SIGNALS = (
     "datadoghq.com",
     "newrelic.com",
 )
+LISTING_EVIDENCE_SELECTORS = (
+    "script[type='application/ld+json']",
+    "p[aria-label='Price']",
+    "time[datetime]",
+    "a[aria-label$=\"'s shop\"]",
+    "a:has-text('Visit shop')",
+    "img[srcset], img[src]",
+)
+DESCRIPTION_SELECTORS = (
+    "p[class*='styles_textWrapper__']",
+    "[data-testid*='description'], [itemprop='description']",
+    "article, [class*='description']",
+)
+PRICE_FALLBACK_SELECTORS = ("[data-testid*='price']", "[class*='price']", "[itemprop='price']")
+SHOP_LINK_SELECTORS = (
+    "a[aria-label$=\"'s shop\"]",
+    "a:has-text('Visit shop')",
+)
+COOKIE_BUTTON_TEXTS = ("Accept", "I agree", "Agree", "OK", "Got it")
+LOGIN_MODAL_CLOSE_SELECTORS = (
+    # The X button in the modal - look for buttons near the modal content
+    "button:has-text('×')",
+    "button:has-text('✕')",
+    "button:has-text('X')",
+    # SVG close buttons
+    "button svg[class*='close']",
+    "button[class*='close']",
+    "button[aria-label='Close']",
+    "button[aria-label='close']",
+    # Look for button that's a sibling/near "Want in?" text
+    "[class*='Modal'] button:not(:has-text('Sign up')):not(:has-text('Log in'))",
+)
+LOGIN_MODAL_JS_DISMISS = """() => {
+    const modal = document.querySelector('[class*="Modal"], [role="dialog"]');
+    if (!modal) return false;
+
+    const buttons = modal.querySelectorAll('button');
+    for (const btn of buttons) {
+        const text = (btn.textContent || '').trim().toLowerCase();
+        if (text.includes('sign up') || text.includes('log in')) continue;
+        if (btn.offsetParent !== null) {
+            btn.click();
+            return true;
+        }
+    }
+    return false;
+}"""
+# One round-trip rate-limit probe: expected-selector presence plus a bounded body-text sample.
+# Playwright-only ":has-text('...')" selectors are emulated with a textContent match.
+RATE_LIMIT_PROBE_JS = r"""({selectors, sampleChars}) => {
+    const present = (selector) => {
+        const hasText = selector.match(/^(.*):has-text\('(.*)'\)$/);
+        try {
+            if (hasText) {
+                const needle = hasText[2].toLowerCase();
+                return Array.from(document.querySelectorAll(hasText[1] || "*"))
+                    .some((el) => (el.textContent || "").toLowerCase().includes(needle));
+            }
+            return Boolean(document.querySelector(selector));
+        } catch (e) {
+            return false;
+        }
+    };
+    const text = document.body ? (document.body.innerText || "") : "";
+    return {
+        title: document.title || "",
+        sample: text.slice(0, sampleChars),
+        truncated: text.length > sampleChars,
+        hasExpected: selectors.length === 0 || selectors.some(present),
+    };
+}"""
+# Context init script: a MutationObserver that accepts the cookie banner and closes the
+# "Want in?" login modal as soon as either mounts, reporting each suppression to Python.
+OVERLAY_GUARD_BINDING = "__debotOverlaySuppressed"
+OVERLAY_GUARD_JS = r"""(() => {
+    if (window.__debotOverlayGuard) return;
+    window.__debotOverlayGuard = true;
+    const COOKIE_TEXTS = __COOKIE_TEXTS__;
+    const report = (kind) => {
+        try {
+            const binding = window["__BINDING__"];
+            if (typeof binding === "function") binding(kind);
+        } catch (e) {}
+    };
+    const handleCookieBanner = () => {
+        for (const btn of document.querySelectorAll("button")) {
+            if (btn.dataset.debotSuppressed) continue;
+            const text = (btn.textContent || "").trim().toLowerCase();
+            if (!COOKIE_TEXTS.includes(text)) continue;
+            const banner = btn.closest(
+                '[id*="cookie" i], [class*="cookie" i], [id*="consent" i], [class*="consent" i], [role="dialog"]'
+            );
+            if (!banner) continue;
+            btn.dataset.debotSuppressed = "1";
+            btn.click();
+            report("cookie");
+            return;
+        }
+    };
+    const handleLoginModal = () => {
+        for (const modal of document.querySelectorAll('[class*="Modal"], [role="dialog"]')) {
+            if (modal.dataset.debotSuppressed) continue;
+            const text = (modal.textContent || "").toLowerCase();
+            if (!text.includes("want in")) continue;
+            modal.dataset.debotSuppressed = "1";
+            const close = Array.from(modal.querySelectorAll("button")).find((btn) => {
+                const label = (btn.textContent || "").trim().toLowerCase();
+                return !label.includes("sign up") && !label.includes("log in");
+            });
+            if (close) {
+                close.click();
+            } else {
+                modal.style.setProperty("display", "none", "important");
+                document.body && document.body.style.removeProperty("overflow");
+            }
+            report("login");
+        }
+    };
+    let scheduled = false;
+    const scan = () => {
+        scheduled = false;
+        handleCookieBanner();
+        handleLoginModal();
+    };
+    const observer = new MutationObserver(() => {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(scan, 50);
+        }
+    });
+    const start = () => {
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+        scan();
+    };
+    if (document.documentElement) {
+        start();
+    } else {
+        document.addEventListener("DOMContentLoaded", start, {once: true});
+    }
+})();""".replace("__COOKIE_TEXTS__", json.dumps([text.lower() for text in COOKIE_BUTTON_TEXTS])).replace(
+    "__BINDING__", OVERLAY_GUARD_BINDING
+)
+MARK_SOLD_SECTIONS_JS = """() => {
+    const headings = Array.from(document.querySelectorAll("h1, h2, h3, h4, h5, h6, p, span, div"));
+    for (const heading of headings) {
+        if ((heading.textContent || "").trim().toLowerCase() === "sold items") {
+            const root =
+                heading.closest("section, article, ul, ol") ||
+                heading.parentElement;
+            if (root) {
+                root.setAttribute("data-debot-sold-root", "true");
+            }
+        }
+    }
+}"""
+LISTING_LINK_SELECTOR = 'a[href^="/products/"]'
+LISTING_LINK_HREFS_JS = """
+    els => els
+        .filter(e => {
+            if (e.closest('[data-debot-sold-root="true"]')) {
+                return false;
+            }
+            const listItem = e.closest('li');
+            if (listItem) {
+                const text = (listItem.textContent || '').toLowerCase();
+                if (text.includes('sold out')) return false;
+            }
+            return true;
+        })
+        .map(e => e.getAttribute('href'))
+"""
+# Same filtering as LISTING_LINK_HREFS_JS, plus the grid card's visible text.
+LISTING_TILE_META_JS = """
+    els => els
+        .filter(e => {
+            if (e.closest('[data-debot-sold-root="true"]')) {
+                return false;
+            }
+            const listItem = e.closest('li');
+            if (listItem) {
+                const text = (listItem.textContent || '').toLowerCase();
+                if (text.includes('sold out')) return false;
+            }
+            return true;
+        })
+        .map(e => {
+            const card = e.closest('li') || e.parentElement || e;
+            return {href: e.getAttribute('href'), text: card.innerText || card.textContent || ''};
+        })
+"""
+SELLER_HREFS_JS = """els => els
+    .map(el => el.getAttribute('href'))
+    .filter(Boolean)
+    .filter(href => href.includes('productId=') || /^\\/[A-Za-z0-9._-]+\\/?$/.test(href))
+"""
+# Collects every field parse_listing needs in a single page.evaluate round-trip.
+LISTING_SNAPSHOT_JS = r"""() => {
+    const DESCRIPTION_SELECTORS = __DESCRIPTION_SELECTORS__;
+    const PRICE_SELECTORS = __PRICE_SELECTORS__;
+    const pick = (selector) => {
+        try { return document.querySelector(selector); } catch (e) { return null; }
+    };
+    const textOf = (el) => ((el && (el.innerText || el.textContent)) || '').trim();
+    const firstText = (selectors) => {
+        for (const selector of selectors) {
+            const text = textOf(pick(selector));
+            if (text) return text;
+        }
+        return '';
+    };
+    const shop =
+        pick(`a[aria-label$="'s shop"]`) ||
+        Array.from(document.querySelectorAll('a')).find(a => /visit shop/i.test(a.textContent || '')) ||
+        null;
+    const img = pick('img[srcset], img[src]');
+    const itemImg = pick('img.styles_imageItem__UWJs6');
+    const time = pick('time[datetime]');
+    const jsonLd = Array.from(document.querySelectorAll("script[type='application/ld+json']"));
+    const price = pick("p[aria-label='Price']");
+    const html = document.documentElement ? document.documentElement.outerHTML : '';
+    const createdAt = html.match(/(?:\\"|")(?:created_at|createdAt|datePublished|dateCreated|published_at|publishedAt)(?:\\"|")\s*:\s*(?:\\"|")([^"\\]+)(?:\\"|")/i);
+    const listedBy = html.match(/item listed by ([A-Za-z0-9._-]+)/i);
+    return {
+        title: document.title || '',
+        bodyText: document.body ? (document.body.innerText || '') : '',
+        jsonLd: jsonLd.map(el => el.textContent || ''),
+        description: firstText(DESCRIPTION_SELECTORS),
+        price: firstText(PRICE_SELECTORS),
+        imageItemSrc: itemImg ? itemImg.getAttribute('src') : null,
+        imageSrcset: img ? img.getAttribute('srcset') : null,
+        imageSrc: img ? img.getAttribute('src') : null,
+        shopText: textOf(shop),
+        shopHref: shop ? shop.getAttribute('href') : null,
+        sellerHrefs: Array.from(document.querySelectorAll('a[href]'))
+            .map(el => el.getAttribute('href'))
+            .filter(Boolean)
+            .filter(href => href.includes('productId=') || /^\/[A-Za-z0-9._-]+\/?$/.test(href)),
+        timeDatetime: time ? time.getAttribute('datetime') : null,
+        timeText: textOf(time),
+        createdAt: createdAt ? createdAt[1] : null,
+        listedBy: listedBy ? listedBy[1] : null,
+        hasListingEvidence: Boolean(jsonLd.length || price || time || shop || img),
+    };
+}""".replace(
+    "__DESCRIPTION_SELECTORS__", json.dumps(list(DESCRIPTION_SELECTORS))
+).replace(
+    "__PRICE_SELECTORS__", json.dumps(["p[aria-label='Price']", *PRICE_FALLBACK_SELECTORS])
+)
+BROWSER_CONTEXT_OPTIONS = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0",
+    "viewport": {"width": 1280, "height": 900},
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+}
 CancelCheck = Optional[Callable[[], bool]]
 _PENDING_LOG_COUNTS: Dict[str, int] = {"login_modal_escape": 0}
-_NAVIGATION_LOCK = threading.Lock()
-_LAST_NAVIGATION_STARTED_AT = 0.0
+_NAVIGATION_COUNTER = threading.local()
 
 
 def _read_float_env(name: str, default: float) -> float:
@@ -96,7 +374,20 @@ def _read_float_env(name: str, default: float) -> float:
         return default
 
 
-MIN_NAV_INTERVAL_SECONDS = _read_float_env("DEBOT_MIN_NAV_INTERVAL_SECONDS", 3.0)
+# "script" reads a listing with one page.evaluate; "fields" uses per-field locator calls.
+LISTING_EXTRACTION_MODE = (os.environ.get("DEBOT_LISTING_EXTRACTION") or "script").strip().lower()
+# "http" fetches listing HTML without a browser first; "browser" always uses Playwright.
+LISTING_FETCH_MODE = (os.environ.get("DEBOT_LISTING_FETCH") or "browser").strip().lower()
+HTTP_FETCH_TIMEOUT_SECONDS = _read_float_env("DEBOT_HTTP_FETCH_TIMEOUT_SECONDS", 15.0)
+HTTP_FETCH_MAX_CONNECTIONS = 8
+HTTP_FETCH_STATS: Dict[str, int] = {"fetched": 0, "escalated": 0}
+# Cookie banners / login modals suppressed by the init-script guard, by kind.
+OVERLAY_SUPPRESSIONS: Dict[str, int] = {"cookie": 0, "login": 0}
+_OVERLAY_GUARDED_CONTEXTS: "weakref.WeakSet" = weakref.WeakSet()
+# Decode the grid's product-list XHR responses into partial listing records while scrolling.
+LISTING_XHR_HARVEST = (os.environ.get("DEBOT_LISTING_XHR_HARVEST") or "").strip().lower() in {"1", "true", "yes", "on"}
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
 
 
 class SearchCancelled(Exception):
@@ -118,6 +409,11 @@ class RateLimitError(Exception):
         self.code = "rate_limited"
 
 
+# Concurrent searches opening the same listing or seller profile share one navigation
+LISTING_FLIGHTS = SingleFlight("listing", retry_on=(SearchCancelled,))
+SELLER_PROFILE_FLIGHTS = SingleFlight("seller-profile", retry_on=(SearchCancelled,))
+
+
 def flush_debug_logs() -> None:
     """Flush any buffered log summaries."""
     escape_count = _PENDING_LOG_COUNTS.get("login_modal_escape", 0)
@@ -158,21 +454,48 @@ def sleep_with_cancel(
     raise_if_cancelled(should_cancel)
 
 
-def guarded_goto(page: Page, url: str, *, wait_until: str = "domcontentloaded", timeout: int = 60_000):
-    """Serialize Playwright navigations and space their start times."""
-    global _LAST_NAVIGATION_STARTED_AT
+def acquire_navigation_slot(should_cancel: CancelCheck = None) -> float:
+    """Wait for this search's turn at the next paced navigation slot and return the seconds waited."""
+    waited = NAVIGATION_SCHEDULER.acquire(should_cancel)
+    if waited is None:
+        raise_if_cancelled(should_cancel)
+    return waited or 0.0
+
 
-    with _NAVIGATION_LOCK:
-        interval = max(float(MIN_NAV_INTERVAL_SECONDS or 0), 0.0)
-        now = time.monotonic()
-        delay = interval - (now - _LAST_NAVIGATION_STARTED_AT)
-        if delay > 0:
-            time.sleep(delay)
-        _LAST_NAVIGATION_STARTED_AT = time.monotonic()
+def record_navigation_success() -> None:
+    """Count a clean navigation toward the pacer and close a half-open breaker.
 
+    Block pages can arrive with status 200, so callers invoke this only after
+    check_page_for_rate_limit (or its snapshot/HTML equivalent) found nothing;
+    rate limits are recorded where RateLimitError is handled.
+    """
+    if NAVIGATION_PACER.record_success():
+        PACING_STATE.save()
+    if NAVIGATION_BREAKER.record_success():
+        log_debug("[pacing] Probe navigation succeeded; resuming all searches")
+        PACING_STATE.save(force=True)
+        NAVIGATION_SCHEDULER.wake()
+
+
+def guarded_goto(
+    page: Page,
+    url: str,
+    *,
+    wait_until: str = "domcontentloaded",
+    timeout: int = 60_000,
+    should_cancel: CancelCheck = None,
+):
+    """Serialize Playwright navigations and space their start times; a cancelled search leaves the queue."""
+    acquire_navigation_slot(should_cancel)
+    _NAVIGATION_COUNTER.value = navigation_count() + 1
     return page.goto(url, wait_until=wait_until, timeout=timeout)
 
 
+def navigation_count() -> int:
+    """Return how many guarded navigations the current thread has started."""
+    return getattr(_NAVIGATION_COUNTER, "value", 0)
+
+
 def should_block_request(request: Any) -> bool:
     """Return whether a Playwright request should be aborted to keep pages light."""
     try:
@@ -190,13 +513,31 @@ def should_block_request(request: Any) -> bool:
     return any(signal in url for signal in BLOCKED_URL_SIGNALS)
 
 
+def serve_static_asset(route) -> None:
+    """Fulfil a hashed script or stylesheet from the asset cache, fetching and storing it on a miss."""
+    url = route.request.url
+    cached = STATIC_ASSETS.lookup(url)
+    if cached is not None:
+        body, content_type = cached
+        route.fulfill(status=200, body=body, headers=cached_asset_headers(content_type))
+        return
+    response = route.fetch()
+    body = response.body()
+    if response.ok:
+        STATIC_ASSETS.store(url, body, response.headers.get("content-type", ""))
+    route.fulfill(response=response, body=body)
+
+
 def install_resource_blocking(ctx: BrowserContext) -> None:
-    """Install a best-effort route that blocks heavy assets and trackers."""
+    """Install a best-effort route that blocks heavy assets and trackers and serves cached static bundles."""
     def handle_route(route):
         try:
             if should_block_request(route.request):
                 route.abort()
                 return
+            if STATIC_ASSETS.is_open and is_cacheable_asset(route.request):
+                serve_static_asset(route)
+                return
             route.continue_()
         except Exception:
             try:
@@ -207,6 +548,32 @@ def install_resource_blocking(ctx: BrowserContext) -> None:
     ctx.route("**/*", handle_route)
 
 
+def record_overlay_suppression(kind: Any) -> None:
+    """Count an overlay suppressed by OVERLAY_GUARD_JS."""
+    key = str(kind or "")
+    OVERLAY_SUPPRESSIONS[key] = OVERLAY_SUPPRESSIONS.get(key, 0) + 1
+
+
+def install_overlay_guard(ctx: BrowserContext) -> None:
+    """Suppress cookie banners and login modals in every page of ctx as they mount."""
+    ctx.expose_function(OVERLAY_GUARD_BINDING, record_overlay_suppression)
+    ctx.add_init_script(script=OVERLAY_GUARD_JS)
+    _OVERLAY_GUARDED_CONTEXTS.add(ctx)
+
+
+def mark_overlay_guarded(ctx) -> None:
+    """Remember that ctx already runs OVERLAY_GUARD_JS (used by the async engine)."""
+    _OVERLAY_GUARDED_CONTEXTS.add(ctx)
+
+
+def has_overlay_guard(page) -> bool:
+    """Return whether page's context handles overlays itself, so per-page polling can be skipped."""
+    try:
+        return page.context in _OVERLAY_GUARDED_CONTEXTS
+    except Exception:
+        return False
+
+
 def extract_rate_limit_message(
     text: str,
     status: Optional[int] = None,
@@ -285,6 +652,38 @@ def _page_has_selector(page: Page, selector: str) -> bool:
         return False
 
 
+def rate_limit_expected_selectors(expect_product_links: bool = False, expect_listing: bool = False) -> List[str]:
+    """Selectors whose absence marks the page's expected content as missing."""
+    if expect_product_links:
+        return [LISTING_LINK_SELECTOR]
+    if expect_listing:
+        return list(LISTING_EVIDENCE_SELECTORS)
+    return []
+
+
+def rate_limit_needs_full_scan(
+    probe: Dict[str, Any],
+    response_status: Optional[int] = None,
+    retry_after_seconds: Optional[int] = None,
+) -> bool:
+    """Return whether a cheap signal fired and the text sample did not cover the whole body."""
+    cheap_signal = (
+        not probe.get("hasExpected")
+        or (response_status or 0) >= 400
+        or retry_after_seconds is not None
+    )
+    return bool(cheap_signal and probe.get("truncated"))
+
+
+def _raise_rate_limit(message: Optional[str], response_status: Optional[int], retry_after_seconds: Optional[int]) -> None:
+    if message:
+        raise RateLimitError(
+            message,
+            status=response_status,
+            retry_after_seconds=retry_after_seconds,
+        )
+
+
 def check_page_for_rate_limit(
     page: Page,
     response_status: Optional[int] = None,
@@ -292,7 +691,51 @@ def check_page_for_rate_limit(
     expect_listing: bool = False,
     retry_after_seconds: Optional[int] = None,
 ) -> None:
-    """Inspect the current page and raise when it looks rate limited."""
+    """Inspect the current page and raise when it looks rate limited.
+
+    Checks run cheapest first: the response status, then one evaluate returning
+    expected-selector presence and a bounded text sample, and a full body-text
+    read only when one of those signals fired.
+    """
+    _raise_rate_limit(extract_rate_limit_message("", status=response_status), response_status, retry_after_seconds)
+
+    selectors = rate_limit_expected_selectors(expect_product_links, expect_listing)
+    try:
+        probe = page.evaluate(RATE_LIMIT_PROBE_JS, {"selectors": selectors, "sampleChars": RATE_LIMIT_SAMPLE_CHARS})
+    except Exception:
+        probe = None
+    if not isinstance(probe, dict):
+        _check_page_for_rate_limit_full(
+            page,
+            response_status=response_status,
+            expect_product_links=expect_product_links,
+            expect_listing=expect_listing,
+            retry_after_seconds=retry_after_seconds,
+        )
+        return
+
+    text = "\n".join([probe.get("title") or "", probe.get("sample") or ""])
+    if rate_limit_needs_full_scan(probe, response_status, retry_after_seconds):
+        try:
+            text = "\n".join([probe.get("title") or "", page.inner_text("body", timeout=1_000) or ""])
+        except Exception:
+            pass
+
+    _raise_rate_limit(
+        extract_rate_limit_message(text, status=response_status, expected_content_missing=not probe.get("hasExpected")),
+        response_status,
+        retry_after_seconds,
+    )
+
+
+def _check_page_for_rate_limit_full(
+    page: Page,
+    response_status: Optional[int] = None,
+    expect_product_links: bool = False,
+    expect_listing: bool = False,
+    retry_after_seconds: Optional[int] = None,
+) -> None:
+    """Fallback rate-limit check that reads the full title and body text."""
     text_parts: List[str] = []
 
     try:
@@ -307,18 +750,11 @@ def check_page_for_rate_limit(
 
     expected_content_missing = False
     if expect_product_links:
-        expected_content_missing = not _page_has_selector(page, 'a[href^="/products/"]')
+        expected_content_missing = not _page_has_selector(page, LISTING_LINK_SELECTOR)
     elif expect_listing:
         expected_content_missing = not any(
             _page_has_selector(page, selector)
-            for selector in (
-                "script[type='application/ld+json']",
-                "p[aria-label='Price']",
-                "time[datetime]",
-                "a[aria-label$=\"'s shop\"]",
-                "a:has-text('Visit shop')",
-                "img[srcset], img[src]",
-            )
+            for selector in LISTING_EVIDENCE_SELECTORS
         )
 
     message = extract_rate_limit_message(
@@ -445,13 +881,8 @@ def extract_seller_sold_count_from_text(text: str) -> Optional[int]:
         return None
 
 
-def _pick_product_json_ld(page: Page) -> Optional[Dict[str, Any]]:
-    """Return the product JSON-LD payload when available."""
-    try:
-        texts = page.locator("script[type='application/ld+json']").all_inner_texts()
-    except Exception:
-        texts = []
-
+def pick_product_json_ld_from_texts(texts: List[str]) -> Optional[Dict[str, Any]]:
+    """Return the Product entry from raw JSON-LD script bodies."""
     for text in texts:
         try:
             payload = json.loads(text)
@@ -506,6 +937,14 @@ def extract_size_label_from_text(text: str) -> Optional[str]:
     return None
 
 
+def largest_srcset_url(srcset: Optional[str]) -> Optional[str]:
+    """Return the last (largest) candidate URL from an img srcset attribute."""
+    parts = [p.strip() for p in (srcset or "").split(",") if p.strip()]
+    if not parts:
+        return None
+    return parts[-1].split()[0]
+
+
 def _format_price_from_offer(offers: Any) -> str:
     """Format a JSON-LD offer block to match the UI's display needs."""
     offer = offers[0] if isinstance(offers, list) and offers else offers
@@ -526,53 +965,6 @@ def _format_price_from_offer(offers: Any) -> str:
     return f"{symbol}{price}".strip()
 
 
-def _extract_seller_name(page: Page, html: str) -> str:
-    """Extract the seller username from stable shop-link selectors."""
-    selectors = [
-        "a[aria-label$=\"'s shop\"]",
-        "a:has-text('Visit shop')",
-    ]
-
-    for selector in selectors:
-        try:
-            loc = page.locator(selector).first
-            if loc.count():
-                text = (loc.inner_text(timeout=500) or "").strip().lstrip("@")
-                if text and text.lower() != "visit shop":
-                    return text
-
-                href = loc.get_attribute("href")
-                username = extract_seller_username_from_href(href)
-                if username:
-                    return username
-        except Exception:
-            continue
-
-    hrefs: List[Optional[str]] = []
-    try:
-        hrefs = page.eval_on_selector_all(
-            "a[href]",
-            """els => els
-                .map(el => el.getAttribute('href'))
-                .filter(Boolean)
-                .filter(href => href.includes('productId=') || /^\\/[A-Za-z0-9._-]+\\/?$/.test(href))
-            """,
-        )
-    except Exception:
-        pass
-
-    for href in hrefs:
-        username = extract_seller_username_from_href(href)
-        if username:
-            return username
-
-    m = re.search(r"item listed by ([A-Za-z0-9._-]+)", html or "", re.I)
-    if m:
-        return m.group(1)
-
-    return ""
-
-
 def extract_seller_sold_count(page: Page) -> Optional[int]:
     """Extract the seller's sold count from a seller page."""
     try:
@@ -596,7 +988,7 @@ def extract_seller_sold_count(page: Page) -> Optional[int]:
 
 def accept_cookies(page: Page) -> None:
     """Dismiss cookie consent dialogs."""
-    for text in ["Accept", "I agree", "Agree", "OK", "Got it"]:
+    for text in COOKIE_BUTTON_TEXTS:
         try:
             page.locator(f"button:has-text('{text}')").first.click(timeout=1500)
             return
@@ -608,23 +1000,9 @@ def dismiss_login_modal(page: Page) -> None:
     """Dismiss login/signup modal popup if it appears ('Want in?' modal)."""
     try:
         # Try briefly in case the modal appears, but don't stall every page load.
-        close_selectors = [
-            # The X button in the modal - look for buttons near the modal content
-            "button:has-text('×')",
-            "button:has-text('✕')",
-            "button:has-text('X')",
-            # SVG close buttons
-            "button svg[class*='close']",
-            "button[class*='close']",
-            "button[aria-label='Close']",
-            "button[aria-label='close']",
-            # Look for button that's a sibling/near "Want in?" text
-            "[class*='Modal'] button:not(:has-text('Sign up')):not(:has-text('Log in'))",
-        ]
-        
         for _ in range(LOGIN_MODAL_MAX_ATTEMPTS):
             # Check each selector
-            for selector in close_selectors:
+            for selector in LOGIN_MODAL_CLOSE_SELECTORS:
                 try:
                     close_btn = page.locator(selector).first
                     if close_btn.count() and close_btn.is_visible(timeout=300):
@@ -637,21 +1015,7 @@ def dismiss_login_modal(page: Page) -> None:
             
             # Try JavaScript approach
             try:
-                clicked = page.evaluate("""() => {
-                    const modal = document.querySelector('[class*="Modal"], [role="dialog"]');
-                    if (!modal) return false;
-                    
-                    const buttons = modal.querySelectorAll('button');
-                    for (const btn of buttons) {
-                        const text = (btn.textContent || '').trim().toLowerCase();
-                        if (text.includes('sign up') || text.includes('log in')) continue;
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                    return false;
-                }""")
+                clicked = page.evaluate(LOGIN_MODAL_JS_DISMISS)
                 if clicked:
                     log_debug("[login-modal] Dismissed login modal via JS click")
                     page.wait_for_timeout(LOGIN_MODAL_WAIT_MS)
@@ -679,23 +1043,229 @@ def dismiss_login_modal(page: Page) -> None:
 def remove_sold_sections(page: Page) -> None:
     """Mark sold item sections so link collection can skip them safely."""
     try:
-        page.evaluate("""() => {
-            const headings = Array.from(document.querySelectorAll("h1, h2, h3, h4, h5, h6, p, span, div"));
-            for (const heading of headings) {
-                if ((heading.textContent || "").trim().toLowerCase() === "sold items") {
-                    const root =
-                        heading.closest("section, article, ul, ol") ||
-                        heading.parentElement;
-                    if (root) {
-                        root.setAttribute("data-debot-sold-root", "true");
-                    }
-                }
-            }
-        }""")
+        page.evaluate(MARK_SOLD_SECTIONS_JS)
     except Exception:
         pass
 
 
+def is_product_list_response(url: str, content_type: str) -> bool:
+    """Return whether a network response looks like Depop's product-list JSON."""
+    parsed = urlparse(url or "")
+    return (
+        "depop.com" in parsed.netloc
+        and "/api/" in parsed.path
+        and "product" in parsed.path.lower()
+        and "json" in (content_type or "").lower()
+    )
+
+
+def _iter_product_objects(payload: Any, depth: int = 0):
+    """Yield dicts in a product-list payload that look like listing records."""
+    if depth > 6:
+        return
+    if isinstance(payload, list):
+        for entry in payload:
+            yield from _iter_product_objects(entry, depth + 1)
+    elif isinstance(payload, dict):
+        if isinstance(payload.get("slug"), str) and payload.get("slug"):
+            yield payload
+            return
+        for value in payload.values():
+            if isinstance(value, (list, dict)):
+                yield from _iter_product_objects(value, depth + 1)
+
+
+def _first_present(data: Dict[str, Any], *keys: str) -> Any:
+    """Return the first non-empty value among keys."""
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _price_from_product_json(product: Dict[str, Any]) -> str:
+    """Format the price block of a product-list record."""
+    price = _first_present(product, "price", "pricing")
+    if isinstance(price, dict):
+        nested = _first_present(price, "discounted_price", "original_price", "discountedPrice", "originalPrice")
+        amount_source = nested if isinstance(nested, dict) else price
+        amount = _first_present(amount_source, "priceAmount", "price_amount", "total_price", "totalPrice", "amount")
+        currency = _first_present(price, "currencyName", "currency_name", "currency") or ""
+    else:
+        amount = price
+        currency = _first_present(product, "currencyName", "currency_name", "currency") or ""
+    if amount is None:
+        return ""
+    return _format_price_from_offer({"price": str(amount), "priceCurrency": str(currency)})
+
+
+def _size_label_from_product_json(product: Dict[str, Any]) -> Optional[str]:
+    """Join a product-list record's size names into a size label."""
+    sizes = _first_present(product, "sizes", "size")
+    if not isinstance(sizes, list):
+        sizes = [sizes] if sizes else []
+    names = []
+    for size in sizes:
+        name = _first_present(size, "name", "value") if isinstance(size, dict) else size
+        if name:
+            names.append(str(name).strip())
+    return ", ".join(names) or None
+
+
+def partial_listing_from_product_json(
+    product: Dict[str, Any],
+    origin: str = "https://www.depop.com",
+) -> Optional[Dict[str, Any]]:
+    """Turn one product-list record into a partial parse_listing-shaped item."""
+    slug = str(product.get("slug") or "").strip().strip("/")
+    if not slug:
+        return None
+
+    seller = product.get("seller")
+    seller_name = _first_present(seller, "username", "userName") if isinstance(seller, dict) else None
+    seller_name = seller_name or _first_present(product, "sellerUsername", "seller_username", "username")
+    status = str(product.get("status") or "").strip().upper()
+    created_at = _first_present(product, "dateCreated", "date_created", "createdAt", "created_at")
+    listed_at, age_days = resolve_listing_time(None, "", "", None, str(created_at) if created_at else None)
+
+    return {
+        "url": urljoin(origin, f"/products/{slug}/"),
+        "slug": slug,
+        "price": _price_from_product_json(product),
+        "sizeLabel": _size_label_from_product_json(product),
+        "sold": bool(product.get("sold") or product.get("isSold") or status == "SOLD"),
+        "seller": str(seller_name).lstrip("@") if seller_name else None,
+        "listedAt": listed_at,
+        "ageDays": age_days,
+        "updatedAt": _first_present(product, "dateUpdated", "date_updated", "updatedAt", "updated_at"),
+    }
+
+
+def harvest_product_list_payload(payload: Any, origin: str = "https://www.depop.com") -> Dict[str, Dict[str, Any]]:
+    """Decode a product-list JSON payload into partial listing records keyed by URL."""
+    records: Dict[str, Dict[str, Any]] = {}
+    for product in _iter_product_objects(payload):
+        record = partial_listing_from_product_json(product, origin)
+        if record:
+            records[record["url"]] = record
+    return records
+
+
+def tile_meta_from_text(text: str) -> Dict[str, Any]:
+    """Read the price, size badge and sold marker from a grid card's visible text."""
+    lines = [re.sub(r"\s+", " ", line).strip() for line in (text or "").splitlines()]
+    lines = [line for line in lines if line]
+    price_match = next((PRICE_RX.search(line) for line in lines if PRICE_RX.search(line)), None)
+    size_label = next((line for line in lines if TILE_SIZE_BADGE_RX.match(line)), None)
+    return {
+        "price": price_match.group(1) if price_match else "",
+        "sizeLabel": size_label,
+        "sold": any(line.lower() == "sold" for line in lines),
+    }
+
+
+def merge_listing_data(
+    listing_data: Dict[str, Dict[str, Any]],
+    records: Dict[str, Dict[str, Any]],
+    overwrite: bool = True,
+) -> None:
+    """Merge partial listing records into listing_data without overwriting known fields with blanks."""
+    for url, record in records.items():
+        existing = listing_data.setdefault(url, {})
+        for key, value in record.items():
+            if key not in existing or (overwrite and value not in (None, "")):
+                existing[key] = value
+
+
+class LinkCollector:
+    """Link and scroll bookkeeping for collect_listing_links, shared by the sync and async engines.
+
+    The engines only talk to the page: they feed what they read into the
+    collector and ask it whether to keep scrolling and by how much.
+    """
+
+    def __init__(
+        self,
+        origin: str,
+        max_scrolls: int = 2,
+        max_links: Optional[int] = None,
+        aggressive_end_scroll: bool = False,
+        listing_data: Optional[Dict[str, Dict[str, Any]]] = None,
+        known_links: Optional[Set[str]] = None,
+    ):
+        self.origin = origin
+        self.max_links = max_links
+        self.listing_data = listing_data
+        self.known_links = known_links
+        if aggressive_end_scroll:
+            self.total_steps = max(max_scrolls, 1)
+        else:
+            self.total_steps = max(max(max_scrolls, 0) * SCROLL_STEPS_PER_BATCH, 1)
+        self.seen: set = set()
+        self.ordered: List[str] = []
+        self.known_seen: List[str] = []
+        self._stalled_steps = 0
+        self._last_count = 0
+
+    def reached_known(self) -> bool:
+        return len(self.known_seen) >= KNOWN_LINKS_BEFORE_STOP
+
+    def done(self) -> bool:
+        """Return whether enough links (or enough known ones) have been seen."""
+        return bool(self.max_links and len(self.seen) >= self.max_links) or self.reached_known()
+
+    def add_payload(self, payload: Any) -> None:
+        """Merge a product-list JSON payload into listing_data."""
+        merge_listing_data(self.listing_data, harvest_product_list_payload(payload, self.origin))
+
+    def add_tiles(self, tiles: List[Dict[str, Any]]) -> None:
+        """Record grid cards read with LISTING_TILE_META_JS: their metadata, then their links."""
+        merge_listing_data(self.listing_data, {
+            urljoin(self.origin, tile["href"]): tile_meta_from_text(tile.get("text") or "")
+            for tile in tiles
+            if tile.get("href")
+        }, overwrite=False)
+        self.add_hrefs([tile.get("href") for tile in tiles])
+
+    def add_hrefs(self, hrefs: List[Optional[str]]) -> None:
+        """Record links in grid order, setting known ones aside."""
+        for href in hrefs:
+            if not href:
+                continue
+            full = urljoin(self.origin, href)
+            if full in self.seen:
+                continue
+            self.seen.add(full)
+            if self.known_links and full in self.known_links:
+                self.known_seen.append(full)
+                if self.reached_known():
+                    return
+                continue
+            self.ordered.append(full)
+            if self.max_links and len(self.seen) >= self.max_links:
+                return
+
+    def _stall_limit(self) -> int:
+        if len(self.seen) < EARLY_SCROLL_LINK_THRESHOLD:
+            return MAX_STALLED_SCROLL_STEPS + EARLY_SCROLL_STALL_BUFFER
+        return MAX_STALLED_SCROLL_STEPS
+
+    def should_stop(self, step: int) -> bool:
+        """After collecting at ``step``, return whether scrolling further is pointless."""
+        if len(self.seen) == self._last_count:
+            self._stalled_steps += 1
+        else:
+            self._stalled_steps = 0
+        self._last_count = len(self.seen)
+        return step == self.total_steps - 1 or self._stalled_steps >= self._stall_limit()
+
+    @staticmethod
+    def scroll_amount(viewport_height: Any) -> int:
+        amount = int((viewport_height or 800) * SCROLL_STEP_RATIO)
+        return amount if amount > 0 else 560
+
+
 def collect_listing_links(
     page: Page,
     max_scrolls: int = 2,
@@ -703,317 +1273,481 @@ def collect_listing_links(
     max_links: Optional[int] = None,
     should_cancel: CancelCheck = None,
     aggressive_end_scroll: bool = False,
+    listing_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    harvest_responses: bool = False,
+    read_tiles: bool = False,
+    known_links: Optional[Set[str]] = None,
 ) -> List[str]:
-    """Collect product listing links from the current page."""
-    seen: set = set()
-    ordered: List[str] = []
-    
+    """Collect product listing links from the current page.
+
+    When ``listing_data`` is given, partial listing records keyed by listing URL are
+    gathered from the product-list JSON the grid loads while scrolling
+    (``harvest_responses``) and from each grid card's visible text (``read_tiles``).
+
+    Links in ``known_links`` are left out of the result, and scrolling stops once
+    ``KNOWN_LINKS_BEFORE_STOP`` of them have appeared on a newest-first grid.
+    """
+    harvest_responses = harvest_responses and listing_data is not None
+    read_tiles = read_tiles and listing_data is not None
     u = urlparse(page.url)
-    origin = f"{u.scheme}://{u.netloc}"
-    
-    selectors = ['a[href^="/products/"]']
+    links = LinkCollector(
+        f"{u.scheme}://{u.netloc}", max_scrolls, max_links, aggressive_end_scroll, listing_data, known_links,
+    )
+    pending_responses: List[Any] = []
 
-    def stall_limit() -> int:
-        if len(seen) < EARLY_SCROLL_LINK_THRESHOLD:
-            return MAX_STALLED_SCROLL_STEPS + EARLY_SCROLL_STALL_BUFFER
-        return MAX_STALLED_SCROLL_STEPS
+    def on_response(response) -> None:
+        try:
+            if is_product_list_response(response.url, response.headers.get("content-type", "")):
+                pending_responses.append(response)
+        except Exception:
+            pass
 
-    def collect_visible_links() -> None:
-        for sel in selectors:
+    def drain_responses() -> None:
+        while pending_responses:
+            response = pending_responses.pop(0)
             try:
-                hrefs = page.eval_on_selector_all(sel, """
-                    els => els
-                        .filter(e => {
-                            if (e.closest('[data-debot-sold-root="true"]')) {
-                                return false;
-                            }
-                            const listItem = e.closest('li');
-                            if (listItem) {
-                                const text = (listItem.textContent || '').toLowerCase();
-                                if (text.includes('sold out')) return false;
-                            }
-                            return true;
-                        })
-                        .map(e => e.getAttribute('href'))
-                """)
+                payload = response.json()
             except Exception:
-                hrefs = []
-
-            for href in hrefs:
-                if not href:
-                    continue
-                full = urljoin(origin, href)
-                if full not in seen:
-                    seen.add(full)
-                    ordered.append(full)
-                    if max_links and len(seen) >= max_links:
-                        return
-
-    if aggressive_end_scroll:
-        total_batches = max(max_scrolls, 1)
-        stalled_batches = 0
-        last_count = 0
-        wait_ms = max(per_scroll_wait_ms, BROWSE_END_SCROLL_WAIT_MS)
-
-        for batch in range(total_batches):
-            raise_if_cancelled(should_cancel)
-            collect_visible_links()
-            if max_links and len(seen) >= max_links:
-                return ordered
+                continue
+            links.add_payload(payload)
 
-            if len(seen) == last_count:
-                stalled_batches += 1
+    def collect_visible_links() -> None:
+        if harvest_responses:
+            drain_responses()
+        try:
+            if read_tiles:
+                links.add_tiles(page.eval_on_selector_all(LISTING_LINK_SELECTOR, LISTING_TILE_META_JS))
             else:
-                stalled_batches = 0
-            last_count = len(seen)
-
-            if batch == total_batches - 1 or stalled_batches >= stall_limit():
-                break
+                links.add_hrefs(page.eval_on_selector_all(LISTING_LINK_SELECTOR, LISTING_LINK_HREFS_JS))
+        except Exception:
+            pass
 
-            try:
-                page.keyboard.press("End")
-            except Exception:
-                pass
-            try:
-                page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
-            except Exception:
-                pass
-            page.wait_for_timeout(wait_ms)
-    else:
-        total_steps = max(max_scrolls, 0) * SCROLL_STEPS_PER_BATCH
-        total_steps = max(total_steps, 1)
-        stalled_steps = 0
-        last_count = 0
+    if harvest_responses:
+        page.on("response", on_response)
 
-        for step in range(total_steps):
+    try:
+        for step in range(links.total_steps):
             raise_if_cancelled(should_cancel)
             collect_visible_links()
-            if max_links and len(seen) >= max_links:
-                return ordered
-
-            if len(seen) == last_count:
-                stalled_steps += 1
-            else:
-                stalled_steps = 0
-            last_count = len(seen)
-
-            if step == total_steps - 1 or stalled_steps >= stall_limit():
+            if links.done():
+                return links.ordered
+            if links.should_stop(step):
                 break
 
+            if aggressive_end_scroll:
+                try:
+                    page.keyboard.press("End")
+                except Exception:
+                    pass
+                try:
+                    page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
+                except Exception:
+                    pass
+                page.wait_for_timeout(max(per_scroll_wait_ms, BROWSE_END_SCROLL_WAIT_MS))
+                continue
+
             try:
                 viewport_height = page.evaluate(
                     "() => window.innerHeight || document.documentElement.clientHeight || 800"
                 )
             except Exception:
                 viewport_height = 800
-
-            scroll_amount = int((viewport_height or 800) * SCROLL_STEP_RATIO)
-            if scroll_amount <= 0:
-                scroll_amount = 560
-
-            page.evaluate("(amount) => window.scrollBy(0, amount)", scroll_amount)
+            page.evaluate("(amount) => window.scrollBy(0, amount)", links.scroll_amount(viewport_height))
             page.wait_for_timeout(per_scroll_wait_ms)
+    finally:
+        if harvest_responses:
+            try:
+                page.remove_listener("response", on_response)
+            except Exception:
+                pass
+            drain_responses()
 
-    if not ordered:
+    if not links.ordered:
         check_page_for_rate_limit(page, expect_product_links=True)
     
-    return ordered
+    return links.ordered
 
 
-def parse_listing(
-    page: Page,
-    url: str,
-    should_cancel: CancelCheck = None,
-) -> Optional[Dict[str, Any]]:
-    """Parse a single listing page and extract item details."""
+def capture_listing_snapshot(page: Page) -> Optional[Dict[str, Any]]:
+    """Collect a listing's raw fields with a single page.evaluate round-trip."""
     try:
-        raise_if_cancelled(should_cancel)
-        response = guarded_goto(page, url, wait_until="domcontentloaded", timeout=60_000)
-        raise_if_cancelled(should_cancel)
-        accept_cookies(page)
+        snapshot = page.evaluate(LISTING_SNAPSHOT_JS)
+    except Exception:
+        return None
+    return snapshot if isinstance(snapshot, dict) else None
+
+
+def _first_inner_text(page: Page, selectors, timeout: int) -> str:
+    """Return the first non-empty inner text among the given selectors."""
+    for selector in selectors:
         try:
-            page.wait_for_selector(LISTING_READY_SELECTOR, timeout=LISTING_READY_TIMEOUT_MS)
+            loc = page.locator(selector).first
+            if loc.count():
+                text = (loc.inner_text(timeout=timeout) or "").strip()
+                if text:
+                    return text
         except Exception:
-            pass
-        dismiss_login_modal(page)
+            continue
+    return ""
 
-        check_page_for_rate_limit(
-            page,
-            response_status=_response_status(response),
-            expect_listing=True,
-            retry_after_seconds=extract_retry_after_seconds(response),
-        )
-        product_json_ld = _pick_product_json_ld(page)
-        page_html = ""
+
+def _first_attribute(page: Page, selector: str, name: str) -> Optional[str]:
+    """Return an attribute of the first element matching selector, if any."""
+    try:
+        loc = page.locator(selector).first
+        return loc.get_attribute(name) if loc.count() else None
+    except Exception:
+        return None
+
+
+def read_listing_dom(page: Page) -> Dict[str, Any]:
+    """Read LISTING_SNAPSHOT_JS's fields one locator call at a time (DEBOT_LISTING_EXTRACTION=dom)."""
+    try:
+        json_ld_texts = page.locator("script[type='application/ld+json']").all_inner_texts()
+    except Exception:
+        json_ld_texts = []
+    try:
+        body_text = page.inner_text("body", timeout=1_500) or ""
+    except Exception:
         body_text = ""
+    try:
+        html = page.content()
+    except Exception:
+        html = ""
+    try:
+        seller_hrefs = page.eval_on_selector_all("a[href]", SELLER_HREFS_JS)
+    except Exception:
+        seller_hrefs = []
+    shop_selector = next((selector for selector in SHOP_LINK_SELECTORS if _first_attribute(page, selector, "href")), None)
+    return {
+        **listing_meta_from_html(html),
+        "bodyText": body_text,
+        "jsonLd": json_ld_texts,
+        "description": _first_inner_text(page, DESCRIPTION_SELECTORS, 1_000),
+        "price": _first_inner_text(page, ("p[aria-label='Price']", *PRICE_FALLBACK_SELECTORS), 800),
+        "imageItemSrc": _first_attribute(page, "img.styles_imageItem__UWJs6", "src"),
+        "imageSrcset": _first_attribute(page, "img[srcset], img[src]", "srcset"),
+        "imageSrc": _first_attribute(page, "img[srcset], img[src]", "src"),
+        "shopText": _first_inner_text(page, (shop_selector,), 500) if shop_selector else "",
+        "shopHref": _first_attribute(page, shop_selector, "href") if shop_selector else None,
+        "sellerHrefs": seller_hrefs,
+        "timeDatetime": _first_attribute(page, "time[datetime]", "datetime"),
+        "timeText": _first_inner_text(page, ("time[datetime]",), 400),
+    }
+
+
+def raise_for_snapshot_rate_limit(
+    snapshot: Dict[str, Any],
+    response_status: Optional[int] = None,
+    retry_after_seconds: Optional[int] = None,
+) -> None:
+    """Apply check_page_for_rate_limit's listing rules to a captured snapshot."""
+    message = extract_rate_limit_message(
+        "\n".join([snapshot.get("title") or "", snapshot.get("bodyText") or ""]),
+        status=response_status,
+        expected_content_missing=not snapshot.get("hasListingEvidence"),
+    )
+    if message:
+        raise RateLimitError(
+            message,
+            status=response_status,
+            retry_after_seconds=retry_after_seconds,
+        )
 
-        # Description
-        desc = ""
-        if isinstance(product_json_ld, dict):
-            desc = str(product_json_ld.get("description") or "").strip()
-
-        if not desc:
-            for selector in [
-                "p[class*='styles_textWrapper__']",
-                "[data-testid*='description'], [itemprop='description']",
-                "article, [class*='description']"
-            ]:
-                try:
-                    loc = page.locator(selector).first
-                    if loc.count():
-                        desc = (loc.inner_text(timeout=1_000) or "").strip()
-                        if desc:
-                            break
-                except Exception:
-                    pass
 
-        # Price
-        price_text = ""
-        if isinstance(product_json_ld, dict):
-            price_text = _format_price_from_offer(product_json_ld.get("offers"))
+def _seller_name_from_snapshot(snapshot: Dict[str, Any]) -> str:
+    """Resolve the seller username: shop link text, then shop or profile hrefs, then the "listed by" text."""
+    shop_text = (snapshot.get("shopText") or "").strip().lstrip("@")
+    if shop_text and shop_text.lower() != "visit shop":
+        return shop_text
 
-        if not price_text:
-            try:
-                ploc = page.locator("p[aria-label='Price']").first
-                if ploc.count():
-                    price_text = (ploc.inner_text(timeout=800) or "").strip()
-            except Exception:
-                pass
+    for href in [snapshot.get("shopHref"), *(snapshot.get("sellerHrefs") or [])]:
+        username = extract_seller_username_from_href(href)
+        if username:
+            return username
 
-        if not price_text:
-            for sel in ["[data-testid*='price']", "[class*='price']", "[itemprop='price']"]:
-                try:
-                    loc = page.locator(sel).first
-                    if loc.count():
-                        price_text = (loc.inner_text(timeout=800) or "").strip()
-                        if price_text:
-                            break
-                except Exception:
-                    pass
-        
-        if not price_text:
-            try:
-                all_txt = page.inner_text("body", timeout=800)
-                m = PRICE_RX.search(all_txt or "")
-                if m:
-                    price_text = m.group(1)
-            except Exception:
-                    pass
+    return snapshot.get("listedBy") or ""
+
+
+def resolve_listing_time(
+    time_datetime: Optional[str],
+    time_text: str,
+    body_text: str,
+    product_json_ld: Optional[Dict[str, Any]],
+    hydration_created_at: Optional[str],
+) -> tuple:
+    """Pick listedAt/ageDays from the time element, relative text, JSON-LD, then hydration data."""
+    listed_at_iso: Optional[str] = None
+    age_days: Optional[float] = None
+
+    if time_datetime:
+        listed_at_iso = time_datetime
+        parsed_dt = parse_iso_datetime(time_datetime)
+        if parsed_dt:
+            age_days = age_days_from(parsed_dt)
+
+    for text in (time_text, body_text):
+        if age_days is not None:
+            break
+        rel_dt = parse_relative_time(text or "")
+        if rel_dt:
+            age_days = age_days_from(rel_dt)
+            listed_at_iso = rel_dt.isoformat()
+
+    for created_at in (extract_created_at_from_json_ld(product_json_ld), hydration_created_at):
+        if listed_at_iso is not None:
+            break
+        parsed_dt = parse_iso_datetime(created_at or "")
+        if parsed_dt:
+            listed_at_iso = parsed_dt.isoformat()
+            age_days = age_days_from(parsed_dt)
+
+    return listed_at_iso, age_days
+
+
+def build_listing_from_snapshot(url: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a LISTING_SNAPSHOT_JS payload into the parse_listing item shape."""
+    product_json_ld = pick_product_json_ld_from_texts(snapshot.get("jsonLd") or [])
+    body_text = snapshot.get("bodyText") or ""
+
+    desc = ""
+    price_text = ""
+    image_url = None
+    if isinstance(product_json_ld, dict):
+        desc = str(product_json_ld.get("description") or "").strip()
+        price_text = _format_price_from_offer(product_json_ld.get("offers"))
+        images = product_json_ld.get("image")
+        if isinstance(images, list) and images:
+            image_url = images[0]
+        elif isinstance(images, str):
+            image_url = images
+
+    desc = desc or (snapshot.get("description") or "").strip()
+    price_text = price_text or (snapshot.get("price") or "").strip()
+    if not price_text:
+        m = PRICE_RX.search(body_text)
+        if m:
+            price_text = m.group(1)
+
+    image_url = (
+        image_url
+        or snapshot.get("imageItemSrc")
+        or largest_srcset_url(snapshot.get("imageSrcset"))
+        or snapshot.get("imageSrc")
+    )
 
-        # Image
-        image_url = None
-        if isinstance(product_json_ld, dict):
-            images = product_json_ld.get("image")
-            if isinstance(images, list) and images:
-                image_url = images[0]
-            elif isinstance(images, str):
-                image_url = images
+    listed_at_iso, age_days = resolve_listing_time(
+        snapshot.get("timeDatetime"),
+        snapshot.get("timeText") or "",
+        body_text,
+        product_json_ld,
+        snapshot.get("createdAt"),
+    )
 
-        if not image_url:
-            try:
-                img = page.locator("img.styles_imageItem__UWJs6").first
-                if img.count():
-                    image_url = img.get_attribute("src")
-            except Exception:
-                pass
+    return {
+        "url": url,
+        "description": desc,
+        "image": image_url,
+        "price": price_text,
+        "listedAt": listed_at_iso,
+        "ageDays": age_days,
+        "seller": _seller_name_from_snapshot(snapshot),
+        "sizeLabel": extract_size_label_from_text(body_text) or extract_size_label_from_text(desc),
+        "soldCount": None,
+    }
+
+
+def listing_item_has_evidence(item: Dict[str, Any]) -> bool:
+    """Return whether a built listing carries anything a real listing page would show."""
+    return any(item.get(field) for field in ("description", "price", "image", "seller"))
+
+
+def html_to_text(html: str) -> str:
+    """Approximate a page's visible innerText from raw HTML."""
+    text = NON_CONTENT_BLOCK_RX.sub(" ", html or "")
+    text = BLOCK_BREAK_RX.sub("\n", text)
+    text = html_lib.unescape(HTML_TAG_RX.sub(" ", text))
+    lines = [re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def listing_meta_from_html(html: str) -> Dict[str, Any]:
+    """Read the snapshot fields only found in a listing's raw HTML: hydration createdAt and "listed by"."""
+    listed_by = LISTED_BY_RX.search(html or "")
+    return {
+        "createdAt": extract_created_at_from_html(html),
+        "listedBy": listed_by.group(1) if listed_by else None,
+    }
+
+
+def snapshot_from_html(html: str) -> Dict[str, Any]:
+    """Build a LISTING_SNAPSHOT_JS-shaped payload from server-rendered listing HTML."""
+    json_ld_texts = [html_lib.unescape(text) for text in JSON_LD_SCRIPT_RX.findall(html or "")]
+    time_match = TIME_DATETIME_RX.search(html or "")
+    shop_match = SHOP_LINK_HREF_RX.search(html or "")
+    return {
+        **listing_meta_from_html(html),
+        "title": "",
+        "bodyText": html_to_text(html),
+        "jsonLd": json_ld_texts,
+        "shopHref": html_lib.unescape(shop_match.group(1)) if shop_match else None,
+        "timeDatetime": time_match.group(1) if time_match else None,
+        "timeText": html_to_text(time_match.group(2)) if time_match else "",
+        "hasListingEvidence": bool(json_ld_texts or time_match or shop_match),
+    }
+
+
+def _get_http_client():
+    """Return the shared keep-alive HTTP client used for browserless listing fetches."""
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            import httpx
+
+            _HTTP_CLIENT = httpx.Client(
+                headers={
+                    "User-Agent": BROWSER_CONTEXT_OPTIONS["user_agent"],
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.5",
+                },
+                follow_redirects=True,
+                timeout=HTTP_FETCH_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=HTTP_FETCH_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_FETCH_MAX_CONNECTIONS,
+                ),
+            )
+        return _HTTP_CLIENT
 
-        if not image_url:
-            try:
-                img2 = page.locator("img[srcset], img[src]").first
-                if img2.count():
-                    srcset = img2.get_attribute("srcset")
-                    if srcset:
-                        parts = [p.strip() for p in srcset.split(',') if p.strip()]
-                        if parts:
-                            image_url = parts[-1].split()[0]
-                    if not image_url:
-                        image_url = img2.get_attribute("src")
-            except Exception:
-                    pass
 
-        # Seller info
-        seller_name = _extract_seller_name(page, "")
-        if not seller_name:
-            page_html = page.content()
-            seller_name = _extract_seller_name(page, page_html)
+def fetch_listing_via_http(url: str, should_cancel: CancelCheck = None) -> Optional[Dict[str, Any]]:
+    """Fetch and parse a listing without a browser; return None when Playwright should take over."""
+    if "/products/" not in urlparse(url).path:
+        return None
+
+    raise_if_cancelled(should_cancel)
+    acquire_navigation_slot(should_cancel)
+
+    try:
+        response = _get_http_client().get(url)
+        html = response.text or ""
+        status = int(response.status_code)
+    except Exception as exc:
+        log_debug(f"[http-fetch] {url} failed, escalating to browser: {exc}")
+        HTTP_FETCH_STATS["escalated"] += 1
+        return None
+
+    snapshot = snapshot_from_html(html)
+    item = build_listing_from_snapshot(url, snapshot) if snapshot["jsonLd"] else None
+    content_missing = not item or not (item["description"] or item["price"])
+    blocked = extract_rate_limit_message(
+        snapshot["bodyText"],
+        status=status,
+        expected_content_missing=content_missing,
+    )
+    if blocked or content_missing or status >= 400:
+        log_debug(f"[http-fetch] {url} returned {status}; escalating to browser")
+        HTTP_FETCH_STATS["escalated"] += 1
+        return None
+
+    record_navigation_success()
+    HTTP_FETCH_STATS["fetched"] += 1
+    return item
+
+
+def begin_listing_navigation(page: Page, url: str, should_cancel: CancelCheck = None):
+    """Start loading a listing without waiting for DOMContentLoaded; finish with parse_listing(prefetched=True)."""
+    raise_if_cancelled(should_cancel)
+    return guarded_goto(page, url, wait_until="commit", timeout=60_000, should_cancel=should_cancel)
 
-        try:
-            body_text = page.inner_text("body", timeout=1_500) or ""
-        except Exception:
-            body_text = ""
 
-        size_label = extract_size_label_from_text(body_text)
-        if not size_label:
-            size_label = extract_size_label_from_text(desc)
+def parse_listing(
+    page: Page,
+    url: str,
+    should_cancel: CancelCheck = None,
+    prefetched: bool = False,
+    prefetched_response: Any = None,
+) -> Optional[Dict[str, Any]]:
+    """Parse a single listing page and extract item details.
+
+    Concurrent calls for the same listing share one navigation. With ``prefetched``,
+    the page is already navigating to ``url`` (see begin_listing_navigation) and
+    ``prefetched_response`` is that navigation's response. Returns None only when
+    the page could not be loaded; a loaded page always yields an item.
+    """
+    if prefetched:
+        return _parse_listing_page(page, url, should_cancel, prefetched=True, prefetched_response=prefetched_response)
+
+    item, shared = LISTING_FLIGHTS.do(
+        normalize_flight_url(url),
+        lambda: _parse_listing_page(page, url, should_cancel),
+        check_cancelled=lambda: raise_if_cancelled(should_cancel),
+    )
+    return dict(item) if shared and item is not None else item
+
+
+def _parse_listing_page(
+    page: Page,
+    url: str,
+    should_cancel: CancelCheck = None,
+    prefetched: bool = False,
+    prefetched_response: Any = None,
+) -> Optional[Dict[str, Any]]:
+    """Navigate page to a listing (unless prefetched) and extract its details."""
+    try:
+        if prefetched:
+            response = prefetched_response
+            raise_if_cancelled(should_cancel)
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=60_000)
+            except Exception:
+                pass
+        else:
+            if LISTING_FETCH_MODE == "http":
+                item = fetch_listing_via_http(url, should_cancel=should_cancel)
+                if item is not None:
+                    return item
 
-        # Listing time
-        listed_at_iso: Optional[str] = None
-        age_days: Optional[float] = None
+            raise_if_cancelled(should_cancel)
+            response = guarded_goto(page, url, wait_until="domcontentloaded", timeout=60_000, should_cancel=should_cancel)
+        raise_if_cancelled(should_cancel)
+        overlays_guarded = has_overlay_guard(page)
+        if not overlays_guarded:
+            accept_cookies(page)
         try:
-            tloc = page.locator("time[datetime]").first
-            if tloc.count():
-                dt_attr = tloc.get_attribute("datetime")
-                if dt_attr:
-                    listed_at_iso = dt_attr
-                    parsed_dt = parse_iso_datetime(dt_attr)
-                    if parsed_dt:
-                        age_days = age_days_from(parsed_dt)
-                
-                if age_days is None:
-                    time_text = tloc.inner_text(timeout=400) or ""
-                    rel_dt = parse_relative_time(time_text)
-                    if rel_dt:
-                        age_days = age_days_from(rel_dt)
-                        listed_at_iso = rel_dt.isoformat()
+            page.wait_for_selector(LISTING_READY_SELECTOR, timeout=LISTING_READY_TIMEOUT_MS)
         except Exception:
             pass
+        if not overlays_guarded:
+            dismiss_login_modal(page)
+
+        if LISTING_EXTRACTION_MODE == "script":
+            snapshot = capture_listing_snapshot(page)
+            if snapshot is not None:
+                raise_for_snapshot_rate_limit(
+                    snapshot,
+                    response_status=_response_status(response),
+                    retry_after_seconds=extract_retry_after_seconds(response),
+                )
+                record_navigation_success()
+                return build_listing_from_snapshot(url, snapshot)
 
-        if age_days is None:
-            rel_dt = parse_relative_time(body_text)
-            if rel_dt:
-                age_days = age_days_from(rel_dt)
-                listed_at_iso = rel_dt.isoformat()
-
-        if listed_at_iso is None:
-            created_at = extract_created_at_from_json_ld(product_json_ld)
-            parsed_dt = parse_iso_datetime(created_at or "")
-            if parsed_dt:
-                listed_at_iso = parsed_dt.isoformat()
-                age_days = age_days_from(parsed_dt)
-
-        if listed_at_iso is None:
-            if not page_html:
-                page_html = page.content()
-            created_at = extract_created_at_from_html(page_html)
-            parsed_dt = parse_iso_datetime(created_at or "")
-            if parsed_dt:
-                listed_at_iso = parsed_dt.isoformat()
-                age_days = age_days_from(parsed_dt)
-
-        if age_days is None and page_html:
-            rel_dt = parse_relative_time(page_html)
-            if rel_dt:
-                age_days = age_days_from(rel_dt)
-                listed_at_iso = rel_dt.isoformat()
-
-        if not any([desc, price_text, image_url, seller_name]):
+        check_page_for_rate_limit(
+            page,
+            response_status=_response_status(response),
+            expect_listing=True,
+            retry_after_seconds=extract_retry_after_seconds(response),
+        )
+        item = build_listing_from_snapshot(url, read_listing_dom(page))
+        if not listing_item_has_evidence(item):
             check_page_for_rate_limit(
                 page,
                 response_status=_response_status(response),
                 expect_listing=True,
             )
 
-        return {
-            "url": url,
-            "description": desc,
-            "image": image_url,
-            "price": price_text,
-            "listedAt": listed_at_iso,
-            "ageDays": age_days,
-            "seller": seller_name,
-            "sizeLabel": size_label,
-            "soldCount": None,
-        }
+        record_navigation_success()
+        return item
     except SearchCancelled:
         raise
     except RateLimitError:
@@ -1022,27 +1756,36 @@ def parse_listing(
         return None
 
 
-def create_browser_context(pw, headless: bool = True, slowmo: int = 0) -> tuple:
-    """Create a browser and context with anti-detection settings."""
+def launch_browser(pw, headless: bool = True, slowmo: int = 0):
+    """Launch the Firefox browser used for scraping."""
     # Use Firefox - harder to fingerprint than Chromium
-    browser = pw.firefox.launch(
+    return pw.firefox.launch(
         headless=headless,
         slow_mo=slowmo,
     )
-    ctx = browser.new_context(
-        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0",
-        viewport={"width": 1280, "height": 900},
-        locale="en-US",
-        timezone_id="America/New_York",
-    )
+
+
+def new_browser_context(browser) -> BrowserContext:
+    """Create a context with anti-detection settings on an existing browser."""
+    ctx = browser.new_context(**BROWSER_CONTEXT_OPTIONS)
     try:
         install_resource_blocking(ctx)
     except Exception as exc:
         log_debug(f"[browser] Failed to install resource blocking: {exc}")
-    return browser, ctx
+    try:
+        install_overlay_guard(ctx)
+    except Exception as exc:
+        log_debug(f"[browser] Failed to install overlay guard: {exc}")
+    return ctx
+
+
+def create_browser_context(pw, headless: bool = True, slowmo: int = 0) -> tuple:
+    """Create a browser and context with anti-detection settings."""
+    browser = launch_browser(pw, headless=headless, slowmo=slowmo)
+    return browser, new_browser_context(browser)
 
 
-def get_following_list(page: Page, username: str) -> List[str]:
+def get_following_list(page: Page, username: str, should_cancel: CancelCheck = None) -> List[str]:
     """
     Navigate to a user's profile, click the following button to open modal,
     and extract all usernames they are following.
@@ -1050,7 +1793,7 @@ def get_following_list(page: Page, username: str) -> List[str]:
     profile_url = f"https://www.depop.com/{username.strip().lstrip('@').strip('/')}/"
     log_debug(f"[following] Navigating to {profile_url}")
     
-    guarded_goto(page, profile_url, wait_until="domcontentloaded", timeout=60000)
+    guarded_goto(page, profile_url, wait_until="domcontentloaded", timeout=60000, should_cancel=should_cancel)
     accept_cookies(page)
     page.wait_for_load_state("networkidle", timeout=60000)
     
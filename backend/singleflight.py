@@ -0,0 +1,139 @@
+"""Process-wide deduplication of identical in-flight fetches.
+
+Concurrent searches often open the same listing or seller profile. A
+SingleFlight lets the first caller for a key do the work while every other
+caller (sync thread or asyncio task) waits for and shares that result, so
+duplicate navigations never reach the pacing budget.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+from urllib.parse import urlparse, urlunparse
+
+
+# How often a waiting follower re-checks whether its own search was cancelled
+FLIGHT_CANCEL_POLL_SECONDS = 0.25
+
+def normalize_flight_url(url: str, keep_query: bool = False) -> str:
+    """Normalize a URL into a singleflight key (case-folded host, no fragment or trailing slash)."""
+    parsed = urlparse((url or "").strip())
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse((
+        (parsed.scheme or "https").lower(),
+        parsed.netloc.lower(),
+        path,
+        "",
+        parsed.query if keep_query else "",
+        "",
+    ))
+
+
+class SingleFlight:
+    """Share one in-flight call per key between concurrent sync and async callers."""
+
+    def __init__(self, name: str, retry_on: Tuple[Type[BaseException], ...] = ()):
+        self.name = name
+        # Errors specific to the leader (e.g. its search being cancelled) make followers run their own call
+        self.retry_on = retry_on
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self.led = 0
+        self.shared = 0
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """Return the in-flight future for key and whether the caller leads it."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            self.led += 1
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _leader_failed_retryably(self, future: Future) -> bool:
+        """Whether the leader failed for its own reasons (cancellation) rather than the fetch's."""
+        if not future.done() or future.cancelled():
+            return False
+        return isinstance(future.exception(), self.retry_on + (asyncio.CancelledError,))
+
+    @staticmethod
+    def _wait(future: Future, check_cancelled: Optional[Callable[[], None]]) -> Any:
+        if check_cancelled is None:
+            return future.result()
+        while True:
+            check_cancelled()
+            try:
+                return future.result(timeout=FLIGHT_CANCEL_POLL_SECONDS)
+            except FutureTimeoutError:
+                continue
+
+    def do(self, key: str, fn: Callable[[], Any],
+           check_cancelled: Optional[Callable[[], None]] = None) -> Tuple[Any, bool]:
+        """Run fn once per concurrent key; return (result, shared).
+
+        Followers wait in short polls and call ``check_cancelled``, which raises
+        to abandon the wait when their own search is cancelled.
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                try:
+                    result = fn()
+                except BaseException as exc:
+                    self._finish(key, future, error=exc)
+                    raise
+                self._finish(key, future, result=result)
+                return result, False
+            try:
+                return self._wait(future, check_cancelled), True
+            except BaseException:
+                if self._leader_failed_retryably(future):
+                    continue
+                raise
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]],
+                       check_cancelled: Optional[Callable[[], None]] = None) -> Tuple[Any, bool]:
+        """Async counterpart of do; followers wait without blocking the event loop."""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                try:
+                    result = await fn()
+                except BaseException as exc:
+                    self._finish(key, future, error=exc)
+                    raise
+                self._finish(key, future, result=result)
+                return result, False
+            try:
+                # asyncio.wait never cancels what it waits on, so a cancelled follower leaves the shared future alone
+                waiter = asyncio.wrap_future(future)
+                while True:
+                    if check_cancelled is not None:
+                        check_cancelled()
+                    timeout = FLIGHT_CANCEL_POLL_SECONDS if check_cancelled is not None else None
+                    done, _ = await asyncio.wait({waiter}, timeout=timeout)
+                    if done:
+                        return waiter.result(), True
+            except BaseException:
+                if self._leader_failed_retryably(future):
+                    continue
+                raise
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"led": self.led, "shared": self.shared, "inflight": len(self._inflight)}
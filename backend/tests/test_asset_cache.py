@@ -0,0 +1,152 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    from asset_cache import StaticAssetCache, is_cacheable_asset  # noqa: E402
+    from scraper import serve_static_asset  # noqa: E402
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+BUNDLE_URL = "https://www.depop.com/_next/static/chunks/pages/products-3f9a1c2b7d.js"
+
+
+def asset_request(url=BUNDLE_URL, resource_type="script", method="GET"):
+    return SimpleNamespace(url=url, resource_type=resource_type, method=method)
+
+
+class FakeFetchResponse:
+    def __init__(self, body, ok=True):
+        self._body = body
+        self.ok = ok
+        self.headers = {"content-type": "application/javascript"}
+
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, url=BUNDLE_URL, body=b"console.log(1)"):
+        self.request = asset_request(url)
+        self.fetches = 0
+        self.fulfilled = []
+        self._body = body
+
+    def fetch(self):
+        self.fetches += 1
+        return FakeFetchResponse(self._body)
+
+    def fulfill(self, **kwargs):
+        self.fulfilled.append(kwargs)
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Asset cache tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class StaticAssetCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.directory = str(Path(self.tmpdir.name) / "assets")
+
+    def _open(self, **kwargs):
+        cache = StaticAssetCache(self.directory, **kwargs)
+        cache.open()
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_only_hashed_scripts_and_stylesheets_are_cacheable(self):
+        self.assertTrue(is_cacheable_asset(asset_request()))
+        self.assertTrue(is_cacheable_asset(asset_request("https://cdn.depop.com/app.5e1f0c9ab2.css", "stylesheet")))
+        self.assertFalse(is_cacheable_asset(asset_request("https://www.depop.com/app.js")))
+        self.assertFalse(is_cacheable_asset(asset_request(resource_type="document")))
+        self.assertFalse(is_cacheable_asset(asset_request(method="POST")))
+
+    def test_bodies_are_shared_by_digest_and_survive_reopen(self):
+        cache = self._open()
+        cache.store(BUNDLE_URL, b"same", "application/javascript")
+        cache.store(BUNDLE_URL + "?v=2", b"same", "application/javascript")
+
+        self.assertEqual(cache.stats()["bytes"], 4)
+        self.assertEqual(len([name for name in os.listdir(self.directory) if not name.startswith("index")]), 1)
+        cache.close()
+
+        reopened = self._open()
+        self.assertEqual(reopened.lookup(BUNDLE_URL), (b"same", "application/javascript"))
+        self.assertIsNone(reopened.lookup("https://www.depop.com/_next/static/other-aaaaaaaa11.js"))
+        self.assertEqual(reopened.stats()["hitRate"], 0.5)
+
+    def test_least_recently_used_assets_are_evicted_past_the_size_budget(self):
+        cache = self._open(max_bytes=10)
+        cache.store("https://a/x-0000000001.js", b"aaaa")
+        cache.store("https://a/x-0000000002.js", b"bbbb")
+        cache.lookup("https://a/x-0000000001.js")
+        cache.store("https://a/x-0000000003.js", b"cccc")
+
+        self.assertIsNotNone(cache.lookup("https://a/x-0000000001.js"))
+        self.assertIsNone(cache.lookup("https://a/x-0000000002.js"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.stats()["bytes"], 8)
+
+    def test_index_is_saved_on_close_not_on_every_store(self):
+        cache = self._open()
+        index_path = os.path.join(self.directory, "index.json")
+        with mock.patch("asset_cache.time.monotonic", return_value=1_000.0):
+            cache.store("https://a/x-0000000001.js", b"aaaa")
+            saved_once = os.path.getmtime(index_path)
+            os.utime(index_path, (0, 0))
+            cache.store("https://a/x-0000000002.js", b"bbbb")
+        self.assertEqual(os.path.getmtime(index_path), 0)
+
+        cache.close()
+        self.assertGreaterEqual(os.path.getmtime(index_path), saved_once)
+        reopened = self._open()
+        self.assertEqual(reopened.stats()["entries"], 2)
+
+    def test_reopen_sweeps_bodies_missing_from_the_index(self):
+        os.makedirs(self.directory)
+        orphan = os.path.join(self.directory, "ab" * 32)
+        with open(orphan, "wb") as handle:
+            handle.write(b"lost")
+
+        cache = self._open()
+
+        self.assertFalse(os.path.exists(orphan))
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_replacing_an_asset_keeps_the_byte_total_in_step(self):
+        cache = self._open()
+        cache.store(BUNDLE_URL, b"old body")
+        cache.store(BUNDLE_URL, b"new")
+
+        self.assertEqual(cache.stats()["bytes"], 3)
+        self.assertEqual(len([name for name in os.listdir(self.directory) if not name.startswith("index")]), 1)
+
+    def test_route_fetches_once_then_serves_from_cache(self):
+        cache = self._open()
+        first, second = FakeRoute(), FakeRoute()
+
+        with mock.patch("scraper.STATIC_ASSETS", cache):
+            serve_static_asset(first)
+            serve_static_asset(second)
+
+        self.assertEqual((first.fetches, second.fetches), (1, 0))
+        self.assertEqual(second.fulfilled[0]["body"], b"console.log(1)")
+        self.assertEqual(second.fulfilled[0]["headers"]["content-type"], "application/javascript")
+
+
+if __name__ == "__main__":
+    unittest.main()
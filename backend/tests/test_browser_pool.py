@@ -0,0 +1,128 @@
+import contextlib
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    from browser_pool import BrowserPool, BrowserSlot  # noqa: E402
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.closed = True
+        self.connected = False
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@contextlib.contextmanager
+def fake_sync_playwright():
+    yield object()
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Browser pool tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class BrowserPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.browsers = []
+        patchers = [
+            mock.patch("browser_pool.launch_browser", side_effect=self._launch),
+            mock.patch("browser_pool.new_browser_context", side_effect=lambda browser: FakeContext()),
+            mock.patch("browser_pool.sync_playwright", fake_sync_playwright),
+            mock.patch("builtins.print"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _launch(self, pw, headless=True):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    def test_slot_hands_out_prewarmed_context_and_relaunches_after_crash(self):
+        slot = BrowserSlot(0, object())
+        slot.launch()
+        warm_ctx = slot.warm_ctx
+
+        self.assertIs(slot.new_context(), warm_ctx)
+        self.assertIsNone(slot.warm_ctx)
+
+        slot.browser.connected = False
+        slot.new_context()
+
+        self.assertEqual(slot.crashes, 1)
+        self.assertEqual(len(self.browsers), 2)
+        self.assertTrue(self.browsers[0].closed)
+
+    def test_pool_runs_jobs_on_warm_slots_and_recycles_after_navigation_budget(self):
+        pool = BrowserPool(size=1, max_navigations=2)
+        pool.start()
+        self.addCleanup(pool.shutdown)
+
+        with mock.patch("browser_pool.navigation_count", side_effect=[0, 3, 0, 0]):
+            first = pool.submit(lambda slot: slot.browser).result(timeout=5)
+            second = pool.submit(lambda slot: slot.browser).result(timeout=5)
+
+        self.assertIs(first, self.browsers[0])
+        self.assertIs(second, self.browsers[1])
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["busy"], 0)
+        self.assertEqual(stats["slots"][0]["leases"], 2)
+        self.assertEqual(stats["slots"][0]["recycles"], 1)
+
+    def test_pool_propagates_job_errors(self):
+        pool = BrowserPool(size=1)
+        pool.start()
+        self.addCleanup(pool.shutdown)
+
+        def failing_job(slot):
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            pool.submit(failing_job).result(timeout=5)
+
+    def test_try_submit_declines_instead_of_queueing_when_every_slot_is_leased(self):
+        pool = BrowserPool(size=1)
+        pool.start()
+        self.addCleanup(pool.shutdown)
+        release = threading.Event()
+
+        running = pool.try_submit(lambda slot: release.wait(5))
+
+        self.assertIsNotNone(running)
+        self.assertIsNone(pool.try_submit(lambda slot: None))
+        release.set()
+        running.result(timeout=5)
+        self.assertEqual(pool.try_submit(lambda slot: "free again").result(timeout=5), "free again")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    from listing_cache import ListingCache, NegativeCache, SellerStatsCache, WatermarkStore  # noqa: E402
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+LISTING = {
+    "url": "https://www.depop.com/products/abc/",
+    "description": "Pit to pit 21in",
+    "image": "https://media/abc.jpg",
+    "price": "$40.00",
+    "listedAt": "2026-10-01T00:00:00+00:00",
+    "ageDays": 3.0,
+    "seller": "onthemarkco",
+    "sizeLabel": "M",
+    "soldCount": None,
+}
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Listing cache tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class ListingCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = str(Path(self.tmpdir.name) / "listings.sqlite3")
+
+    def _open(self, **kwargs):
+        cache = ListingCache(self.path, **kwargs)
+        cache.open()
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_closed_cache_never_serves_or_stores(self):
+        cache = ListingCache(self.path)
+
+        cache.put(LISTING["url"], LISTING)
+
+        self.assertIsNone(cache.get(LISTING["url"]))
+        self.assertFalse(Path(self.path).exists())
+
+    def test_pending_writes_are_served_and_survive_reopen(self):
+        cache = self._open(flush_interval=60)
+        cache.put(LISTING["url"], LISTING)
+
+        pending_hit = cache.get("https://www.depop.com/products/abc")
+        self.assertEqual(pending_hit["description"], "Pit to pit 21in")
+        self.assertEqual(cache.stats()["pendingWrites"], 1)
+        cache.close()
+
+        reopened = self._open()
+        item = reopened.get(LISTING["url"])
+        self.assertEqual(item["price"], "$40.00")
+        self.assertEqual(item["url"], LISTING["url"])
+        self.assertGreater(item["ageDays"], 0)
+
+    def test_stale_volatile_field_turns_listing_into_a_miss(self):
+        cache = self._open(field_ttls={"price": 60, "description": 3600})
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            cache.put(LISTING["url"], LISTING)
+        cache.flush()
+
+        with mock.patch("listing_cache.time.time", return_value=1_030.0):
+            self.assertIsNotNone(cache.get(LISTING["url"]))
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            self.assertIsNone(cache.get(LISTING["url"]))
+
+        # Re-parsing refreshes only the fields it carries
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            cache.put(LISTING["url"], {"price": "$35.00"})
+            item = cache.get(LISTING["url"])
+        self.assertEqual(item["price"], "$35.00")
+        self.assertEqual(item["description"], "Pit to pit 21in")
+
+    def test_allow_stale_relaxes_stable_fields_but_not_price(self):
+        cache = self._open(field_ttls={"price": 3600, "description": 60})
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            cache.put(LISTING["url"], LISTING)
+            cache.put("https://www.depop.com/products/partial/", {"price": "$10.00"})
+
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            self.assertIsNone(cache.get(LISTING["url"]))
+            self.assertEqual(cache.get(LISTING["url"], allow_stale=True)["price"], "$40.00")
+            self.assertIsNone(cache.get("https://www.depop.com/products/partial/", allow_stale=True))
+
+        # A stale price is never served, so known links are re-parsed once it expires
+        with mock.patch("listing_cache.time.time", return_value=5_000.0):
+            self.assertIsNone(cache.get(LISTING["url"], allow_stale=True))
+            # ...unless a price just read from the grid replaces it
+            self.assertEqual(cache.get(LISTING["url"], allow_stale=True, fresh={"price": "$35.00"})["price"], "$35.00")
+
+    def test_derived_measurements_are_optional_and_dropped_once_stale(self):
+        cache = self._open(field_ttls={"price": 3600, "measurements": 60})
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            cache.put(LISTING["url"], LISTING)
+            self.assertNotIn("measurements", cache.get(LISTING["url"]))
+            cache.put(LISTING["url"], {"measurements": {"version": 1}})
+            self.assertEqual(cache.get(LISTING["url"])["measurements"], {"version": 1})
+
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            item = cache.get(LISTING["url"])
+        self.assertEqual(item["price"], "$40.00")
+        self.assertNotIn("measurements", item)
+
+    def test_lookups_are_counted_per_search(self):
+        cache = self._open()
+
+        cache.record("search-1", hit=True)
+        cache.record("search-1", hit=False)
+        cache.record(None, hit=False)
+
+        self.assertEqual(cache.search_stats("search-1"), {"hits": 1, "misses": 1})
+        self.assertEqual(cache.stats()["misses"], 2)
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Listing cache tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class SellerStatsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = str(Path(self.tmpdir.name) / "listings.sqlite3")
+
+    def _open(self, **kwargs):
+        cache = SellerStatsCache(self.path, **kwargs)
+        cache.open()
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_counts_expire_after_ttl_and_survive_reopen(self):
+        cache = self._open(ttl_seconds=60)
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            cache.put("@OnTheMarkCo", 120)
+            cache.put("unknown", None)
+        with mock.patch("listing_cache.time.time", return_value=1_030.0):
+            self.assertEqual(cache.get("onthemarkco"), 120)
+            self.assertIsNone(cache.get("unknown"))
+        cache.close()
+
+        with mock.patch("listing_cache.time.time", return_value=1_030.0):
+            reopened = self._open(ttl_seconds=60)
+            self.assertEqual(reopened.get("onthemarkco"), 120)
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            self.assertIsNone(reopened.get("onthemarkco"))
+
+    def test_lru_evicts_least_recently_used_seller(self):
+        cache = self._open(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["entries"], 2)
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Listing cache tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class WatermarkStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = str(Path(self.tmpdir.name) / "listings.sqlite3")
+
+    def test_advance_prepends_new_urls_per_shop_and_caps_the_list(self):
+        store = WatermarkStore(self.path, max_urls=3)
+        store.open()
+        self.addCleanup(store.close)
+
+        store.advance("@OnTheMarkCo", "tops", "male", ["b", "a"])
+        store.advance("onthemarkco", "tops", "male", ["d", "c", "b"])
+
+        self.assertEqual(store.known_urls("onthemarkco", "tops", "male"), ["d", "c", "b"])
+        self.assertEqual(store.known_urls("onthemarkco", "bottoms", "male"), [])
+
+    def test_expired_watermark_forces_a_full_crawl(self):
+        store = WatermarkStore(self.path, ttl_seconds=60)
+        store.open()
+        self.addCleanup(store.close)
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            store.advance("onthemarkco", "tops", "male", ["a"])
+
+        with mock.patch("listing_cache.time.time", return_value=1_030.0):
+            self.assertEqual(store.known_urls("onthemarkco", "tops", "male"), ["a"])
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            self.assertEqual(store.known_urls("onthemarkco", "tops", "male"), [])
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Listing cache tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class NegativeCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = str(Path(self.tmpdir.name) / "listings.sqlite3")
+
+    def test_verdicts_expire_by_reason_and_survive_reopen(self):
+        cache = NegativeCache(self.path, reason_ttls={"sold": 3600, "parse_failed": 60})
+        cache.open()
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            cache.put("https://www.depop.com/products/sold/", "sold")
+            cache.put("https://www.depop.com/products/broken", "parse_failed")
+        cache.close()
+
+        reopened = NegativeCache(self.path, reason_ttls={"sold": 3600, "parse_failed": 60})
+        with mock.patch("listing_cache.time.time", return_value=1_030.0):
+            reopened.open()
+            self.addCleanup(reopened.close)
+            self.assertEqual(len(reopened.reasons([
+                "https://www.depop.com/products/sold",
+                "https://www.depop.com/products/broken/",
+            ])), 2)
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            self.assertEqual(
+                reopened.reasons(["https://www.depop.com/products/sold", "https://www.depop.com/products/broken/"]),
+                {"https://www.depop.com/products/sold": "sold"},
+            )
+        with self.assertRaises(ValueError):
+            reopened.put("https://www.depop.com/products/x/", "boring")
+
+    def test_skips_are_counted_per_search(self):
+        cache = NegativeCache(self.path)
+
+        cache.record_skips("search-1", {"sold": 2})
+        cache.record_skips("search-1", {"sold": 1, "too_old": 1})
+
+        self.assertEqual(cache.search_skips("search-1"), {"sold": 3, "too_old": 1})
+        self.assertIsNone(cache.search_skips("search-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import random
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    import numpy  # noqa: E402,F401
+    import main  # noqa: E402
+    from listing_cache import ListingCache, NegativeCache  # noqa: E402
+    from measurement_index import MeasurementIndex  # noqa: E402
+    from parser import parser  # noqa: E402
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+def random_listing(rng, index):
+    lines = []
+    for label, low, high in (
+        ("pit to pit", 17, 26), ("length", 24, 32), ("waist", 26, 38),
+        ("inseam", 26, 34), ("rise", 9, 13), ("leg opening", 6, 11),
+    ):
+        if rng.random() < 0.45:
+            lines.append(f"{label} {rng.randint(low, high)}{rng.choice(['', '.5'])}")
+    return {
+        "url": f"https://www.depop.com/products/item-{index}",
+        "description": "\n".join(lines),
+        "sizeLabel": rng.choice(["M", "W32", "30", "US 10", "", "L"]),
+        "seller": rng.choice(["alpha", "beta", "gamma"]),
+        "price": f"${rng.randint(10, 90)}.00",
+        "listedAt": f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T00:00:00+00:00",
+        "soldCount": rng.choice([None, 5, 120]),
+        "image": None,
+        "category": rng.choice(["tops", "coats-jackets", "bottoms", "footwear", "accessories"]),
+        "gender": "male",
+    }
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Measurement index tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class MeasurementIndexTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.items = [random_listing(rng, index) for index in range(400)]
+        self.index = MeasurementIndex(capacity=16)
+        self.index.open()
+        for item in self.items:
+            self.index.add(item["url"], item, parser.extract_all(item["description"], item["sizeLabel"]))
+
+    def _assert_same(self, category, *targets, **kwargs):
+        crawled = [item for item in self.items if item["category"] == category]
+        matches = [main._process_item(dict(item), *targets, category=category, **kwargs) for item in crawled]
+        expected = {match["url"]: match for match in matches if match}
+        result = self.index.query(category, *targets, **kwargs)
+        self.assertEqual(result["total"], len(expected))
+        self.assertEqual({row["url"] for row in result["matches"]}, set(expected))
+        for row in result["matches"]:
+            for key, value in row["values"].items():
+                self.assertEqual(value, expected[row["url"]][key])
+
+    def test_masks_agree_with_process_item(self):
+        self._assert_same("tops", 21.0, 28.0, 0.5, 1.25)
+        self._assert_same("tops", None, 28.0, 0.5, 1.25)
+        self._assert_same("coats-jackets", 24.0, None, 2.0, 0.0)
+        self._assert_same("accessories", None, None, 0.5, 1.25)
+        self._assert_same("bottoms", None, None, 0.5, 1.25, size_range={"min": 30, "max": 34})
+        self._assert_same("footwear", None, None, 0.5, 1.25, size_range={"min": 9, "max": 11})
+        self._assert_same(
+            "bottoms", None, None, 0.5, 1.25,
+            bottoms_measurements={"waist": {"min": 30, "max": 34}, "inseamRise": {"min": 38, "max": 44}},
+        )
+
+    def test_filters_limit_and_newest_first(self):
+        result = self.index.query("accessories", seller="Beta", max_price=50, limit=5)
+
+        self.assertEqual(len(result["matches"]), 5)
+        self.assertTrue(all(row["seller"] == "beta" for row in result["matches"]))
+        ages = [row["ageDays"] for row in result["matches"]]
+        self.assertEqual(ages, sorted(ages))
+        self.assertEqual(self.index.query("accessories", seller="nobody")["total"], 0)
+
+    def test_listings_only_match_the_category_and_gender_they_were_crawled_under(self):
+        jeans = {"url": "https://www.depop.com/products/jeans", "description": "waist 32 inseam 30 length 22",
+                 "category": "bottoms", "gender": "male"}
+        self.index.add(jeans["url"], jeans, parser.extract_all(jeans["description"]))
+
+        self.assertNotIn(jeans["url"], {row["url"] for row in self.index.query("tops", None, 22.0, 1.0, 1.0)["matches"]})
+        self.assertIn(jeans["url"], {row["url"] for row in self.index.query(
+            "bottoms", bottoms_measurements={"waist": {"min": 31, "max": 33}},
+        )["matches"]})
+        accessories = self.index.query("accessories")
+        self.assertEqual(accessories["total"], sum(item["category"] == "accessories" for item in self.items))
+        self.assertEqual(self.index.query("bottoms", gender="female")["total"], 0)
+
+    def test_rows_are_replaced_per_url_and_closed_index_is_inert(self):
+        item = dict(self.items[0], description="pit to pit 40", category="tops")
+        self.index.add(item["url"], item, parser.extract_all(item["description"]))
+
+        self.assertEqual(len(self.index), len(self.items))
+        self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 1)
+        self.index.close()
+        self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 0)
+
+    def test_removed_rows_are_skipped_until_added_again(self):
+        item = dict(self.items[0], description="pit to pit 40", category="tops")
+        record = parser.extract_all(item["description"])
+        self.index.add(item["url"], item, record)
+
+        self.index.remove(item["url"])
+        self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 0)
+        self.assertEqual(len(self.index), len(self.items) - 1)
+
+        self.index.add(item["url"], item, record)
+        self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 1)
+        self.assertEqual(len(self.index), len(self.items))
+
+    def test_negative_verdicts_keep_listings_out_of_the_index(self):
+        item = dict(self.items[0], description="pit to pit 40", sold=False)
+        with (
+            mock.patch("main.MEASUREMENT_INDEX", self.index),
+            mock.patch("main.LISTING_CACHE"),
+            mock.patch("main.NEGATIVE_CACHE") as negative,
+        ):
+            main._remember_listing(item["url"], dict(item, sold=True), "tops", "male")
+            self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 0)
+
+            main._remember_listing(item["url"], item, "tops", "male")
+            self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 1)
+
+            main._without_harvested_sold([item["url"]], {item["url"]: {"sold": True}})
+            self.assertEqual(self.index.query("tops", 40.0, 40.0, 0.1, 0.1)["total"], 0)
+
+        self.assertEqual([call.args[1] for call in negative.put.call_args_list], ["sold", "sold"])
+
+    def test_load_skips_expired_and_negatively_cached_listings(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = str(Path(tmpdir.name) / "listings.sqlite3")
+        cache = ListingCache(path, field_ttls={"price": 60, "description": 3600, "category": 3600})
+        negative = NegativeCache(path)
+        for store in (cache, negative):
+            store.open()
+            self.addCleanup(store.close)
+        with mock.patch("listing_cache.time.time", return_value=1_000.0):
+            for name in ("fresh", "sold"):
+                cache.put(f"https://www.depop.com/products/{name}", {"description": "pit to pit 21", "price": "$40.00", "category": "tops"})
+        with mock.patch("listing_cache.time.time", return_value=-5_000.0):
+            cache.put("https://www.depop.com/products/expired", {"description": "pit to pit 21", "price": "$40.00", "category": "tops"})
+        negative.put("https://www.depop.com/products/sold", "sold")
+
+        index = MeasurementIndex()
+        index.open()
+        with mock.patch("listing_cache.time.time", return_value=1_100.0):
+            loaded = index.load(cache, negative)
+
+        self.assertEqual(loaded, 1)
+        rows = index.query("tops", 21.0, None, 0.5, 0.0)["matches"]
+        self.assertEqual([row["url"] for row in rows], ["https://www.depop.com/products/fresh"])
+        # The price is past its TTL, so it is left out rather than served stale
+        self.assertIsNone(rows[0]["price"])
+
+    def test_hundred_thousand_listings_filter_in_milliseconds(self):
+        index = MeasurementIndex()
+        index.open()
+        records = [parser.extract_all(item["description"], item["sizeLabel"]) for item in self.items]
+        for position in range(100_000):
+            item = self.items[position % len(self.items)]
+            index.add(f"{item['url']}-{position}", item, records[position % len(records)])
+
+        started = time.perf_counter()
+        index.query("tops", 21.0, 28.0, 0.5, 1.25, limit=40)
+        self.assertLess(time.perf_counter() - started, 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,280 @@
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    from pacing import (  # noqa: E402
+        MIN_NAV_INTERVAL_SECONDS,
+        AdaptivePacer,
+        CircuitBreaker,
+        NavigationScheduler,
+        PacingStateStore,
+        navigation_owner,
+    )
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Pacing tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class AdaptivePacerTest(unittest.TestCase):
+    def test_clean_runs_lower_interval_down_to_floor(self):
+        pacer = AdaptivePacer(initial=2.0, floor=1.5, ceiling=10.0, decrease=0.25, backoff=2.0, clean_run=3)
+
+        for _ in range(2):
+            pacer.record_success()
+        self.assertEqual(pacer.interval(), 2.0)
+
+        pacer.record_success()
+        self.assertEqual(pacer.interval(), 1.75)
+
+        for _ in range(9):
+            pacer.record_success()
+        self.assertEqual(pacer.interval(), 1.5)
+
+    def test_default_floor_is_the_minimum_navigation_interval(self):
+        pacer = AdaptivePacer(ceiling=MIN_NAV_INTERVAL_SECONDS * 4, decrease=0.5, clean_run=1)
+
+        self.assertEqual(pacer.floor, MIN_NAV_INTERVAL_SECONDS)
+        pacer.record_rate_limit()
+        for _ in range(100):
+            pacer.record_success()
+        self.assertEqual(pacer.interval(), MIN_NAV_INTERVAL_SECONDS)
+
+    def test_rate_limit_multiplies_interval_up_to_ceiling_and_resets_streak(self):
+        pacer = AdaptivePacer(initial=3.0, floor=1.5, ceiling=10.0, decrease=0.25, backoff=2.0, clean_run=2)
+        pacer.record_success()
+
+        pacer.record_rate_limit()
+        self.assertEqual(pacer.interval(), 6.0)
+        pacer.record_success()
+        self.assertEqual(pacer.interval(), 6.0)
+
+        pacer.record_rate_limit()
+        self.assertEqual(pacer.interval(), 10.0)
+        self.assertIsNotNone(pacer.stats()["lastRateLimitAt"])
+
+    def test_reserve_spaces_starts_and_retry_after_holds_next_start(self):
+        pacer = AdaptivePacer(initial=2.0, floor=1.0, ceiling=8.0, backoff=2.0, clean_run=5)
+
+        with mock.patch("pacing.time.monotonic", return_value=100.0):
+            self.assertEqual(pacer.reserve(), 0.0)
+            self.assertEqual(pacer.reserve(), 2.0)
+            pacer.record_rate_limit(retry_after_seconds=30)
+            # Retry-After is capped at the ceiling
+            self.assertEqual(pacer.reserve(), 8.0)
+
+    def test_stats_report_rate_per_minute(self):
+        pacer = AdaptivePacer(initial=3.0, floor=1.0, ceiling=10.0)
+
+        stats = pacer.stats()
+
+        self.assertEqual(stats["intervalSeconds"], 3.0)
+        self.assertEqual(stats["navigationsPerMinute"], 20.0)
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Pacing tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class NavigationSchedulerTest(unittest.TestCase):
+    def _scheduler(self, interval=0.0):
+        return NavigationScheduler(AdaptivePacer(initial=interval, floor=0.0, ceiling=max(interval, 1.0)))
+
+    def test_weighted_round_robin_favors_seller_without_starving_browse(self):
+        scheduler = self._scheduler()
+        tickets = {
+            "seller": [scheduler._enqueue("s1", "seller") for _ in range(8)],
+            "browse": [scheduler._enqueue("b1", "browse") for _ in range(8)],
+            "following": [scheduler._enqueue("f1", "following") for _ in range(8)],
+        }
+
+        order = []
+        with scheduler._cond:
+            for _ in range(7):
+                scheduler._grant_next()
+                for kind, queue in tickets.items():
+                    granted = [ticket for ticket in queue if ticket.granted]
+                    if len(granted) > sum(1 for entry in order if entry == kind):
+                        order.append(kind)
+
+        self.assertEqual(order.count("seller"), 4)
+        self.assertEqual(order.count("browse"), 2)
+        self.assertEqual(order.count("following"), 1)
+        self.assertEqual(order[0], "seller")
+
+    def test_acquire_records_wait_per_search(self):
+        scheduler = self._scheduler()
+
+        with navigation_owner("search-1", "seller"):
+            scheduler.acquire()
+            scheduler.acquire()
+
+        stats = scheduler.wait_stats("search-1")
+        self.assertEqual(stats["kind"], "seller")
+        self.assertEqual(stats["navigations"], 2)
+        self.assertIsNone(scheduler.wait_stats("missing"))
+
+    def test_acquire_returns_none_and_leaves_queue_when_cancelled(self):
+        scheduler = self._scheduler(interval=30.0)
+        scheduler.acquire()
+        cancelled = threading.Event()
+        result = []
+
+        def waiter():
+            with navigation_owner("search-2", "browse"):
+                result.append(scheduler.acquire(should_cancel=cancelled.is_set))
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        cancelled.set()
+        thread.join(timeout=5)
+
+        self.assertEqual(result, [None])
+        self.assertEqual(scheduler.wait_stats()["waiting"], {})
+
+    def test_async_acquire_polls_without_a_thread_and_leaves_queue_on_cancel(self):
+        scheduler = self._scheduler(interval=30.0)
+        scheduler.acquire()
+        cancelled = threading.Event()
+
+        async def run():
+            with navigation_owner("search-2", "browse"):
+                waiter = asyncio.ensure_future(scheduler.acquire_async(should_cancel=cancelled.is_set))
+                await asyncio.sleep(0.1)
+                self.assertEqual(scheduler.wait_stats()["waiting"], {"search-2": 1})
+                cancelled.set()
+                self.assertIsNone(await asyncio.wait_for(waiter, timeout=1))
+
+                stuck = asyncio.ensure_future(scheduler.acquire_async())
+                await asyncio.sleep(0.1)
+                stuck.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await stuck
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.wait_stats()["waiting"], {})
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Pacing tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class CircuitBreakerTest(unittest.TestCase):
+    def test_breaker_opens_admits_one_probe_and_closes_on_success(self):
+        breaker = CircuitBreaker(probe_timeout=30.0)
+
+        with mock.patch("pacing.time.monotonic", return_value=100.0):
+            self.assertEqual(breaker.trip(60), 60)
+            # A shorter trip never shortens the shared cooldown
+            self.assertEqual(breaker.trip(10), 60)
+            self.assertEqual(breaker.ready_in(), 60.0)
+
+        with mock.patch("pacing.time.monotonic", return_value=160.0):
+            self.assertEqual(breaker.ready_in(), 0.0)
+            breaker.admit()
+            self.assertEqual(breaker.state, "half_open")
+            self.assertEqual(breaker.ready_in(), 30.0)
+
+        self.assertTrue(breaker.record_success())
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(breaker.ready_in(), 0.0)
+        self.assertFalse(breaker.record_success())
+
+    def test_scheduler_holds_navigations_until_probe_succeeds(self):
+        breaker = CircuitBreaker(probe_timeout=30.0)
+        scheduler = NavigationScheduler(AdaptivePacer(initial=0.0, floor=0.0, ceiling=1.0), breaker)
+        breaker.trip(0)
+        scheduler.acquire()
+        self.assertEqual(breaker.state, "half_open")
+
+        granted = threading.Event()
+
+        def follower():
+            scheduler.acquire()
+            granted.set()
+
+        thread = threading.Thread(target=follower)
+        thread.start()
+        self.assertFalse(granted.wait(0.2))
+
+        breaker.record_success()
+        scheduler.wake()
+        thread.join(timeout=5)
+        self.assertTrue(granted.is_set())
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Pacing tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class PacingStateStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = str(Path(self.tmpdir.name) / "state.json")
+
+    def _store(self):
+        pacer = AdaptivePacer(initial=3.0, floor=1.0, ceiling=20.0)
+        return PacingStateStore(self.path, pacer, CircuitBreaker())
+
+    def test_state_survives_restart_with_active_cooldown(self):
+        store = self._store()
+        store.load()
+        store.pacer.record_rate_limit()
+        store.breaker.trip(600)
+        store.extras["recentRateLimitUntil"] = 123.0
+        store.record_rate_limit()
+
+        restored = self._store()
+        restored.load()
+
+        self.assertEqual(restored.pacer.interval(), 6.0)
+        self.assertEqual(restored.breaker.state, "open")
+        self.assertGreater(restored.breaker.ready_in(), 590)
+        self.assertEqual(len(restored.rate_limit_history), 1)
+        self.assertEqual(restored.extras["recentRateLimitUntil"], 123.0)
+
+    def test_expired_cooldown_is_not_restored_and_routine_writes_are_coalesced(self):
+        Path(self.path).write_text(json.dumps({"intervalSeconds": 2.0, "cooldownUntil": time.time() - 5}))
+        store = self._store()
+        store.load()
+
+        self.assertEqual(store.pacer.interval(), 2.0)
+        self.assertEqual(store.breaker.state, "closed")
+
+        self.assertTrue(store.save())
+        self.assertFalse(store.save())
+        self.assertTrue(store.flush())
+
+    def test_store_does_not_write_until_loaded(self):
+        store = self._store()
+
+        self.assertFalse(store.save(force=True))
+        self.assertFalse(Path(self.path).exists())
+
+    def test_corrupt_state_file_is_ignored(self):
+        Path(self.path).write_text("{not json")
+        store = self._store()
+
+        self.assertEqual(store.load(), {})
+        self.assertEqual(store.pacer.interval(), 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
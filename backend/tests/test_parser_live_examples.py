@@ -8,6 +8,15 @@ if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
 from parser import parser  # noqa: E402
+from benchmarks.parser_corpus import (  # noqa: E402
+    BOTTOMS_EXAMPLES,
+    TOPS_EXAMPLES,
+    corpus_segments,
+    legacy_values,
+    matcher_values,
+    synthetic_descriptions,
+)
+from benchmarks.parser_suite import compare_results  # noqa: E402
 
 
 class ParserLiveExamplesTest(unittest.TestCase):
@@ -315,5 +324,129 @@ class ParserLiveExamplesTest(unittest.TestCase):
                     self.assertAlmostEqual(measurements[key], expected_value)
 
 
+class LabelMatcherTest(unittest.TestCase):
+    def test_matcher_agrees_with_legacy_lookup(self):
+        tricky = [
+            "21 inches chest",
+            "bottom hem opening 8",
+            "across chest 22 length 29",
+            "length: p2p 21",
+            "size 32 1/2 waist",
+            "1/2 chest",
+            "leg opening" + " " * 36 + "9",
+            "34 waist 30 inseam 12 front rise",
+            "waist 5 1/0 inseam 30",
+        ]
+        for segment in [*corpus_segments(), *tricky]:
+            with self.subTest(segment=segment):
+                self.assertEqual(matcher_values(segment), legacy_values(segment))
+
+    def test_candidate_table_keeps_both_label_orders(self):
+        table = parser.LABEL_MATCHER.candidates("34 waist 30 inseam")
+
+        self.assertEqual([(c.order, c.val) for c in table["waist"]], [("after", "30"), ("before", "34")])
+        self.assertEqual([(c.order, c.val) for c in table["inseam"]], [("before", "30")])
+
+    def test_shoulder_to_cuff_is_a_sleeve_label(self):
+        self.assertEqual(parser.LABEL_MATCHER.values("shoulder to cuff 25", parser.to_inches), {"sleeve": 25.0})
+        self.assertEqual(
+            parser.LABEL_MATCHER.values("shoulders 19 shoulder to cuff 25", parser.to_inches),
+            {"shoulder": 19.0, "sleeve": 25.0},
+        )
+
+
+class ExtractAllTest(unittest.TestCase):
+    def test_record_carries_every_family_with_provenance(self):
+        record = parser.extract_all(
+            "pit to pit 22\nlength 29\nshoulder 19\n25 sleeve",
+            size_label="W32 L30",
+        )
+
+        self.assertEqual(record["version"], parser.RECORD_VERSION)
+        self.assertEqual(record["p2p"]["value"], 22.0)
+        self.assertEqual((record["p2p"]["source"], record["p2p"]["text"]), ("label", "pit to pit 22"))
+        self.assertEqual((record["shoulder"]["value"], record["sleeve"]["value"]), (19.0, 25.0))
+        self.assertEqual(record["sleeve"]["source"], "label_before")
+        self.assertGreater(record["p2p"]["confidence"], record["sleeve"]["confidence"])
+        self.assertEqual((record["sizeWaist"]["value"], record["sizeWaist"]["source"]), (32.0, "size_label"))
+        self.assertIsNone(record["inseam"])
+
+    def test_wrappers_read_the_same_record(self):
+        for case in [*TOPS_EXAMPLES, *BOTTOMS_EXAMPLES]:
+            with self.subTest(name=case["name"]):
+                record = parser.extract_all(case["description"])
+                self.assertEqual(
+                    parser.extract_tops(case["description"]),
+                    (parser.value(record, "p2p"), parser.value(record, "length")),
+                )
+                self.assertEqual(
+                    parser.extract_bottoms(case["description"]),
+                    {key: parser.value(record, key) for key in ("waist", "inseam", "rise", "legOpening")},
+                )
+
+    def test_family_subsets_match_the_full_record(self):
+        texts = [case["description"] for case in [*TOPS_EXAMPLES, *BOTTOMS_EXAMPLES]] + synthetic_descriptions()
+        texts += ["shoulder to hem 28 chest 21", "34 waist 30 inseam 12 front rise", "length 29\nlength 31"]
+        for families in (parser.TOPS_KEYS, parser.BOTTOMS_KEYS, ("length",), ("sleeve",), ("sizeWaist",)):
+            for text in texts:
+                with self.subTest(families=families, text=text[:40]):
+                    full = parser.extract_all(text, "W32")
+                    partial = parser.extract_all(text, "W32", families=families)
+                    self.assertEqual(
+                        {key: value for key, value in partial.items() if value is not None and key != "version"},
+                        {key: full[key] for key in families if full[key] is not None},
+                    )
+
+    def test_shoulder_to_cuff_reads_as_sleeve(self):
+        record = parser.extract_all("shoulder to cuff 25")
+
+        self.assertIsNone(record["shoulder"])
+        self.assertEqual((record["sleeve"]["value"], record["sleeve"]["source"]), (25.0, "label"))
+
+    def test_doubled_flat_waist_is_flagged(self):
+        record = parser.extract_all("waist 16\ninseam 30")
+
+        self.assertEqual(record["waist"]["value"], 32.0)
+        self.assertTrue(record["waist"]["flatDoubled"])
+
+
+class ExtractManyTest(unittest.TestCase):
+    def _items(self):
+        cases = [*TOPS_EXAMPLES, *BOTTOMS_EXAMPLES]
+        return [(case["description"], "W30") if index % 2 else case["description"] for index, case in enumerate(cases)]
+
+    def _expected(self, items):
+        return [parser.extract_all(item) if isinstance(item, str) else parser.extract_all(*item) for item in items]
+
+    def test_inline_parsing_streams_records_in_input_order(self):
+        items = self._items()
+
+        self.assertEqual(list(parser.extract_many(iter(items), workers=1, chunksize=4)), self._expected(items))
+
+    def test_process_pool_keeps_input_order_when_later_chunks_finish_first(self):
+        # A slow first chunk and more chunks than the pool keeps in flight, so results arrive out of order
+        slow = "\n\n".join(synthetic_descriptions()[:20])
+        items = [slow, slow, *self._items()]
+        self.assertEqual(list(parser.extract_many(iter(items), workers=2, chunksize=2)), self._expected(items))
+
+
+class ParserSuiteTest(unittest.TestCase):
+    def test_synthetic_corpus_is_frozen_and_parseable(self):
+        texts = synthetic_descriptions()
+
+        self.assertEqual(texts, synthetic_descriptions())
+        self.assertTrue(any(len(text) > 2000 for text in texts))
+        self.assertTrue(all(any(parser.extract_tops(text)) or any(parser.extract_bottoms(text).values()) for text in texts))
+
+    def test_regressions_past_the_threshold_are_reported(self):
+        baseline = {"corpus": {"sha256": "a"}, "results": {"extract_tops": {"throughput": 1000.0, "p99Us": 10.0}}}
+        steady = {"corpus": {"sha256": "a"}, "results": {"extract_tops": {"throughput": 900.0, "p99Us": 11.0}}}
+        slower = {"corpus": {"sha256": "a"}, "results": {"extract_tops": {"throughput": 700.0, "p99Us": 14.0}}}
+
+        self.assertEqual(compare_results(steady, baseline, 0.25), [])
+        self.assertEqual(len(compare_results(slower, baseline, 0.25)), 2)
+        self.assertEqual(len(compare_results({**steady, "corpus": {"sha256": "b"}}, baseline, 0.25)), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    from listing_cache import ListingCache  # noqa: E402
+    from parser import parser  # noqa: E402
+    from reparse import main, reparse_listings  # noqa: E402
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Reparse tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class ReparseTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = str(Path(self.tmpdir.name) / "listings.sqlite3")
+
+    def _open(self):
+        cache = ListingCache(self.path, flush_interval=60)
+        cache.open()
+        self.addCleanup(cache.close)
+        return cache
+
+    def _seed(self, cache, count):
+        for index in range(count):
+            cache.put(
+                f"https://www.depop.com/products/item-{index:03d}/",
+                {"description": f"pit to pit {18 + index % 8}\nlength {26 + index % 5}", "sizeLabel": "M"},
+            )
+        cache.put("https://www.depop.com/products/no-description/", {"price": "$10.00"})
+
+    def test_scan_pages_through_every_stored_listing(self):
+        cache = self._open()
+        self._seed(cache, 7)
+
+        urls = [url for url, _ in cache.scan(page_size=3)]
+
+        self.assertEqual(len(urls), 8)
+        self.assertEqual(urls, sorted(urls))
+
+    def test_records_are_written_back_for_every_description(self):
+        cache = self._open()
+        self._seed(cache, 25)
+
+        written = reparse_listings(cache, workers=1, chunksize=4, batch=10)
+
+        self.assertEqual(written, 25)
+        stored = dict(cache.scan())
+        self.assertEqual(
+            stored["https://www.depop.com/products/item-003"]["measurements"],
+            parser.extract_all("pit to pit 21\nlength 29", "M"),
+        )
+        self.assertNotIn("measurements", stored["https://www.depop.com/products/no-description"])
+
+    def test_cli_reparses_a_database_file(self):
+        cache = self._open()
+        self._seed(cache, 5)
+        cache.close()
+
+        with mock.patch("builtins.print") as printed:
+            self.assertEqual(main(["--db", self.path, "--workers", "2", "--chunksize", "2"]), 0)
+
+        self.assertIn("re-parsed 5 listings", printed.call_args.args[0])
+
+        reopened = self._open()
+        records = [fields.get("measurements") for _, fields in reopened.scan()]
+        self.assertEqual(sum(1 for record in records if record), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
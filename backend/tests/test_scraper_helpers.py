@@ -14,8 +14,12 @@ try:
     from scraper import (  # noqa: E402
         LOGIN_MODAL_MAX_ATTEMPTS,
         LOGIN_MODAL_WAIT_MS,
+        OVERLAY_GUARD_BINDING,
+        OVERLAY_SUPPRESSIONS,
         RateLimitError,
         SearchCancelled,
+        build_listing_from_snapshot,
+        check_page_for_rate_limit,
         collect_listing_links,
         dismiss_login_modal,
         extract_created_at_from_html,
@@ -23,10 +27,18 @@ try:
         extract_seller_sold_count_from_text,
         extract_seller_username_from_href,
         extract_size_label_from_text,
+        fetch_listing_via_http,
         flush_debug_logs,
+        has_overlay_guard,
+        install_overlay_guard,
         log_debug,
         parse_listing,
+        raise_for_snapshot_rate_limit,
+        read_listing_dom,
+        snapshot_from_html,
+        tile_meta_from_text,
     )
+    from pacing import CircuitBreaker  # noqa: E402
 except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
     DEPENDENCY_IMPORT_ERROR = exc
 
@@ -109,6 +121,54 @@ class FakeCollectPage:
         return FakeLocator(count=count)
 
 
+class FakeProductListResponse:
+    def __init__(self, payload):
+        self.url = "https://webapi.depop.com/api/v3/shop/123/products/?limit=24"
+        self.headers = {"content-type": "application/json"}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeHarvestingCollectPage(FakeCollectPage):
+    def __init__(self, href_sequences, payload):
+        super().__init__(href_sequences)
+        self.handlers = []
+        self._payload = payload
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers.remove(handler)
+
+    def evaluate(self, script, arg=None):
+        if "window.scrollBy" in script:
+            for handler in list(self.handlers):
+                handler(FakeProductListResponse(self._payload))
+        return super().evaluate(script, arg)
+
+
+class FakeDomListingPage:
+    def __init__(self, locators, body_text="", html=""):
+        self._locators = locators
+        self._body_text = body_text
+        self._html = html
+
+    def locator(self, selector):
+        return self._locators.get(selector) or FakeLocator()
+
+    def inner_text(self, selector, timeout=None):
+        return self._body_text
+
+    def content(self):
+        return self._html
+
+    def eval_on_selector_all(self, selector, script):
+        return []
+
+
 class FakeResponse:
     def __init__(self, status):
         self.status = status
@@ -139,6 +199,59 @@ class FakeRateLimitedListingPage:
         return ms
 
 
+class FakeSnapshotListingPage(FakeRateLimitedListingPage):
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.evaluate_calls = 0
+        self.locator_calls = 0
+
+    def goto(self, url, wait_until=None, timeout=None):
+        return FakeResponse(200)
+
+    def wait_for_selector(self, selector, timeout=None):
+        return None
+
+    def evaluate(self, script, arg=None):
+        self.evaluate_calls += 1
+        return self.snapshot
+
+    def locator(self, selector):
+        self.locator_calls += 1
+        return FakeLocator()
+
+    @property
+    def keyboard(self):
+        return FakeKeyboard()
+
+
+class FakeProbePage:
+    def __init__(self, probe, body_text=""):
+        self.probe = probe
+        self.body_text = body_text
+        self.evaluate_calls = 0
+        self.inner_text_calls = 0
+
+    def evaluate(self, script, arg=None):
+        self.evaluate_calls += 1
+        return dict(self.probe, selectors=arg["selectors"])
+
+    def inner_text(self, selector, timeout=None):
+        self.inner_text_calls += 1
+        return self.body_text
+
+
+class FakeGuardContext:
+    def __init__(self):
+        self.exposed = {}
+        self.init_scripts = []
+
+    def expose_function(self, name, callback):
+        self.exposed[name] = callback
+
+    def add_init_script(self, script=None):
+        self.init_scripts.append(script)
+
+
 class FakeNoModalPage:
     def __init__(self):
         self.keyboard = FakeKeyboard()
@@ -226,6 +339,88 @@ class ScraperHelpersTest(unittest.TestCase):
         self.assertTrue(page.scroll_amounts)
         self.assertTrue(all(amount == 700 for amount in page.scroll_amounts))
 
+    def test_collect_listing_links_stops_once_known_links_appear(self):
+        page = FakeCollectPage([
+            ["/products/new-1/", "/products/old-1/"],
+            ["/products/new-1/", "/products/old-1/", "/products/new-2/", "/products/old-2/", "/products/old-3/"],
+        ])
+
+        links = collect_listing_links(
+            page,
+            max_scrolls=4,
+            per_scroll_wait_ms=1,
+            known_links={
+                "https://www.depop.com/products/old-1/",
+                "https://www.depop.com/products/old-2/",
+                "https://www.depop.com/products/old-3/",
+            },
+        )
+
+        self.assertEqual(
+            links,
+            ["https://www.depop.com/products/new-1/", "https://www.depop.com/products/new-2/"],
+        )
+        self.assertEqual(page._eval_calls, 2)
+
+    def test_collect_listing_links_harvests_product_list_responses(self):
+        payload = {
+            "products": [
+                {
+                    "slug": "seller-vintage-tee",
+                    "price": {"priceAmount": "45.00", "currencyName": "CAD"},
+                    "sizes": [{"name": "M"}],
+                    "status": "SOLD",
+                    "dateCreated": "2026-03-20T21:16:13Z",
+                    "seller": {"username": "seller"},
+                },
+                {"slug": "seller-jeans", "price": {"priceAmount": "30"}, "sizes": ["W32"], "sold": False},
+            ]
+        }
+        page = FakeHarvestingCollectPage([["/products/a/"], ["/products/a/", "/products/b/"]], payload)
+        listing_data = {}
+
+        collect_listing_links(
+            page,
+            max_scrolls=1,
+            per_scroll_wait_ms=1,
+            listing_data=listing_data,
+            harvest_responses=True,
+        )
+
+        self.assertEqual(page.handlers, [])
+        tee = listing_data["https://www.depop.com/products/seller-vintage-tee/"]
+        self.assertEqual(tee["price"], "$45.00")
+        self.assertEqual(tee["sizeLabel"], "M")
+        self.assertTrue(tee["sold"])
+        self.assertEqual(tee["seller"], "seller")
+        self.assertEqual(tee["listedAt"], "2026-03-20T21:16:13+00:00")
+        jeans = listing_data["https://www.depop.com/products/seller-jeans/"]
+        self.assertEqual(jeans["sizeLabel"], "W32")
+        self.assertFalse(jeans["sold"])
+
+    def test_collect_listing_links_reads_tile_metadata_with_links(self):
+        page = FakeCollectPage([[
+            {"href": "/products/a/", "text": "$45.00\nUS 10"},
+            {"href": "/products/b/", "text": "£20.00\nW32\nSold"},
+        ]])
+        listing_data = {}
+
+        links = collect_listing_links(page, max_scrolls=0, listing_data=listing_data, read_tiles=True)
+
+        self.assertEqual(links, ["https://www.depop.com/products/a/", "https://www.depop.com/products/b/"])
+        self.assertEqual(
+            listing_data["https://www.depop.com/products/a/"],
+            {"price": "$45.00", "sizeLabel": "US 10", "sold": False},
+        )
+        self.assertTrue(listing_data["https://www.depop.com/products/b/"]["sold"])
+
+    def test_tile_meta_ignores_unrecognized_size_lines(self):
+        meta = tile_meta_from_text("$12.00\n3 likes\nBoosted")
+
+        self.assertEqual(meta["price"], "$12.00")
+        self.assertIsNone(meta["sizeLabel"])
+        self.assertFalse(meta["sold"])
+
     def test_collect_listing_links_waits_through_initial_plateau_before_stopping(self):
         page = FakeCollectPage([
             ["/products/a/"],
@@ -282,6 +477,222 @@ class ScraperHelpersTest(unittest.TestCase):
         with self.assertRaises(RateLimitError):
             parse_listing(FakeRateLimitedListingPage(), "https://www.depop.com/products/example/")
 
+    def test_build_listing_from_snapshot_prefers_json_ld_and_falls_back_to_dom_fields(self):
+        snapshot = {
+            "title": "Depop",
+            "bodyText": "Vintage tee\nSize\nL\nListed 3 days ago",
+            "jsonLd": [
+                '{"@type": "Product", "description": "Pit to pit 22", '
+                '"offers": {"price": "45", "priceCurrency": "CAD"}}'
+            ],
+            "description": "DOM description",
+            "price": "$99.00",
+            "imageItemSrc": None,
+            "imageSrcset": "https://img/a.jpg 320w, https://img/b.jpg 1280w",
+            "imageSrc": "https://img/a.jpg",
+            "shopText": "Visit shop",
+            "shopHref": "/hycen88/?productId=1",
+            "sellerHrefs": [],
+            "timeDatetime": "2026-03-20T21:16:13Z",
+            "timeText": "",
+            "createdAt": None,
+            "listedBy": None,
+            "hasListingEvidence": True,
+        }
+
+        item = build_listing_from_snapshot("https://www.depop.com/products/x/", snapshot)
+
+        self.assertEqual(item["description"], "Pit to pit 22")
+        self.assertEqual(item["price"], "$45.00")
+        self.assertEqual(item["image"], "https://img/b.jpg")
+        self.assertEqual(item["seller"], "hycen88")
+        self.assertEqual(item["sizeLabel"], "L")
+        self.assertEqual(item["listedAt"], "2026-03-20T21:16:13Z")
+        self.assertIsNotNone(item["ageDays"])
+
+    def test_read_listing_dom_feeds_the_shared_snapshot_builder(self):
+        page = FakeDomListingPage(
+            {
+                "[data-testid*='description'], [itemprop='description']": FakeLocator(count=1, text="Pit to pit 21"),
+                "p[aria-label='Price']": FakeLocator(count=1, text="$30.00"),
+                "a[aria-label$=\"'s shop\"]": FakeLocator(count=1, text="Visit shop", attrs={"href": "/hycen88/"}),
+                "time[datetime]": FakeLocator(count=1, text="2 days ago", attrs={"datetime": "2026-03-20T21:16:13Z"}),
+            },
+            body_text="Size\nM",
+            html='<script>{"createdAt":"2026-01-01T00:00:00Z"}</script>',
+        )
+
+        item = build_listing_from_snapshot("https://www.depop.com/products/x/", read_listing_dom(page))
+
+        self.assertEqual(item["description"], "Pit to pit 21")
+        self.assertEqual(item["price"], "$30.00")
+        self.assertEqual(item["seller"], "hycen88")
+        self.assertEqual(item["sizeLabel"], "M")
+        self.assertEqual(item["listedAt"], "2026-03-20T21:16:13Z")
+
+    def test_build_listing_from_snapshot_uses_hydration_created_at(self):
+        item = build_listing_from_snapshot(
+            "https://www.depop.com/products/x/",
+            {"bodyText": "", "createdAt": "2026-03-20T21:16:13.033766Z", "listedBy": "seller_1"},
+        )
+
+        self.assertEqual(item["listedAt"], "2026-03-20T21:16:13.033766+00:00")
+        self.assertEqual(item["seller"], "seller_1")
+
+    def test_raise_for_snapshot_rate_limit_flags_challenge_without_listing_evidence(self):
+        with self.assertRaises(RateLimitError):
+            raise_for_snapshot_rate_limit(
+                {"title": "Attention Required", "bodyText": "Checking your browser", "hasListingEvidence": False},
+                response_status=403,
+            )
+        raise_for_snapshot_rate_limit(
+            {"title": "Depop", "bodyText": "Checking your browser", "hasListingEvidence": True},
+            response_status=200,
+        )
+
+    def test_parse_listing_reads_fields_with_single_evaluate(self):
+        page = FakeSnapshotListingPage({
+            "title": "Depop",
+            "bodyText": "Size M",
+            "description": "Chest 21",
+            "price": "$30.00",
+            "shopText": "@drewzal",
+            "hasListingEvidence": True,
+        })
+
+        with mock.patch("scraper.guarded_goto", return_value=FakeResponse(200)), \
+                mock.patch("scraper.accept_cookies"), mock.patch("scraper.dismiss_login_modal"):
+            item = parse_listing(page, "https://www.depop.com/products/example/")
+
+        self.assertEqual(page.evaluate_calls, 1)
+        self.assertEqual(page.locator_calls, 0)
+        self.assertEqual(item["seller"], "drewzal")
+        self.assertEqual(item["description"], "Chest 21")
+        self.assertEqual(item["sizeLabel"], "M")
+
+    def test_half_open_probe_on_a_challenge_page_keeps_the_breaker_half_open(self):
+        breaker = CircuitBreaker()
+        breaker.trip(0)
+        breaker.admit()
+        challenge = FakeSnapshotListingPage(
+            {"title": "Attention Required", "bodyText": "Checking your browser", "hasListingEvidence": False}
+        )
+        listing = FakeSnapshotListingPage(
+            {"title": "Depop", "bodyText": "Size M", "description": "Chest 21", "hasListingEvidence": True}
+        )
+
+        with mock.patch("scraper.NAVIGATION_BREAKER", breaker), \
+                mock.patch("scraper.acquire_navigation_slot", return_value=0.0), \
+                mock.patch("scraper.accept_cookies"), mock.patch("scraper.dismiss_login_modal"):
+            with self.assertRaises(RateLimitError):
+                parse_listing(challenge, "https://www.depop.com/products/challenge/")
+            self.assertEqual(breaker.state, "half_open")
+
+            parse_listing(listing, "https://www.depop.com/products/example/")
+        self.assertEqual(breaker.state, "closed")
+
+    def test_challenge_pages_do_not_count_as_clean_navigations(self):
+        pacer = mock.Mock()
+        pacer.record_success.return_value = False
+        challenge = FakeSnapshotListingPage(
+            {"title": "Attention Required", "bodyText": "Checking your browser", "hasListingEvidence": False}
+        )
+
+        with mock.patch("scraper.NAVIGATION_PACER", pacer), \
+                mock.patch("scraper.acquire_navigation_slot", return_value=0.0), \
+                mock.patch("scraper.accept_cookies"), mock.patch("scraper.dismiss_login_modal"):
+            with self.assertRaises(RateLimitError):
+                parse_listing(challenge, "https://www.depop.com/products/challenge/")
+
+        pacer.record_success.assert_not_called()
+
+    def test_snapshot_from_html_reads_server_rendered_listing(self):
+        html = (
+            "<html><head><script type=\"application/ld+json\">"
+            '{"@type": "Product", "description": "Pit to pit 22 &amp; length 28", '
+            '"offers": {"price": "45", "priceCurrency": "CAD"}}</script>'
+            "<style>.x{}</style></head><body>"
+            "<a aria-label=\"hycen88's shop\" href=\"/hycen88/\">Shop</a>"
+            "<p>Size</p><p>L</p>"
+            "<time datetime=\"2026-03-20T21:16:13Z\">3 days ago</time>"
+            "</body></html>"
+        )
+
+        snapshot = snapshot_from_html(html)
+        item = build_listing_from_snapshot("https://www.depop.com/products/x/", snapshot)
+
+        self.assertTrue(snapshot["hasListingEvidence"])
+        self.assertNotIn(".x{}", snapshot["bodyText"])
+        self.assertEqual(item["description"], "Pit to pit 22 & length 28")
+        self.assertEqual(item["price"], "$45.00")
+        self.assertEqual(item["seller"], "hycen88")
+        self.assertEqual(item["sizeLabel"], "L")
+        self.assertEqual(item["listedAt"], "2026-03-20T21:16:13Z")
+
+    def test_fetch_listing_via_http_escalates_when_rate_limited(self):
+        client = mock.Mock()
+        client.get.return_value = mock.Mock(status_code=429, text="Too Many Requests")
+
+        with mock.patch("scraper._get_http_client", return_value=client), \
+                mock.patch("scraper.acquire_navigation_slot", return_value=0.0):
+            item = fetch_listing_via_http("https://www.depop.com/products/example/")
+
+        self.assertIsNone(item)
+        client.get.assert_called_once()
+
+    def test_overlay_guard_counts_suppressions_and_skips_per_page_polling(self):
+        ctx = FakeGuardContext()
+        install_overlay_guard(ctx)
+        before = OVERLAY_SUPPRESSIONS["login"]
+
+        ctx.exposed[OVERLAY_GUARD_BINDING]("login")
+
+        self.assertEqual(OVERLAY_SUPPRESSIONS["login"], before + 1)
+        self.assertIn("MutationObserver", ctx.init_scripts[0])
+
+        page = FakeSnapshotListingPage({"title": "Depop", "bodyText": "Size M", "hasListingEvidence": True})
+        page.context = ctx
+        self.assertTrue(has_overlay_guard(page))
+        with mock.patch("scraper.guarded_goto", return_value=FakeResponse(200)), \
+                mock.patch("scraper.accept_cookies") as cookies_mock, \
+                mock.patch("scraper.dismiss_login_modal") as modal_mock:
+            parse_listing(page, "https://www.depop.com/products/example/")
+
+        cookies_mock.assert_not_called()
+        modal_mock.assert_not_called()
+
+    def test_check_page_for_rate_limit_skips_full_text_on_healthy_pages(self):
+        page = FakeProbePage(
+            {"title": "Depop", "sample": "Vintage tee", "truncated": True, "hasExpected": True},
+            body_text="... try again later ...",
+        )
+
+        check_page_for_rate_limit(page, response_status=200, expect_listing=True)
+
+        self.assertEqual(page.evaluate_calls, 1)
+        self.assertEqual(page.inner_text_calls, 0)
+
+    def test_check_page_for_rate_limit_scans_full_text_when_content_missing(self):
+        page = FakeProbePage(
+            {"title": "Depop", "sample": "Loading", "truncated": True, "hasExpected": False},
+            body_text="Loading ... Checking your browser before accessing depop.com",
+        )
+
+        with self.assertRaises(RateLimitError) as ctx:
+            check_page_for_rate_limit(page, response_status=403, expect_product_links=True, retry_after_seconds=30)
+
+        self.assertEqual(page.inner_text_calls, 1)
+        self.assertEqual(ctx.exception.status, 403)
+        self.assertEqual(ctx.exception.retry_after_seconds, 30)
+
+    def test_check_page_for_rate_limit_raises_on_429_before_reading_page(self):
+        page = FakeProbePage({"title": "", "sample": "", "truncated": False, "hasExpected": True})
+
+        with self.assertRaises(RateLimitError):
+            check_page_for_rate_limit(page, response_status=429)
+
+        self.assertEqual(page.evaluate_calls, 0)
+
     def test_dismiss_login_modal_exits_quickly_when_absent(self):
         page = FakeNoModalPage()
 
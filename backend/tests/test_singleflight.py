@@ -0,0 +1,164 @@
+import asyncio
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEPENDENCY_IMPORT_ERROR = None
+
+try:
+    from singleflight import SingleFlight, normalize_flight_url  # noqa: E402
+except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
+    DEPENDENCY_IMPORT_ERROR = exc
+
+
+class LeaderCancelled(Exception):
+    pass
+
+
+@unittest.skipIf(
+    DEPENDENCY_IMPORT_ERROR is not None,
+    f"Singleflight tests require backend dependencies: {DEPENDENCY_IMPORT_ERROR}",
+)
+class SingleFlightTest(unittest.TestCase):
+    def test_normalize_flight_url_drops_fragment_query_and_trailing_slash(self):
+        self.assertEqual(
+            normalize_flight_url("https://WWW.Depop.com/products/abc/?ref=grid#top"),
+            "https://www.depop.com/products/abc",
+        )
+        self.assertEqual(
+            normalize_flight_url("https://www.depop.com/seller/?groups=tops", keep_query=True),
+            "https://www.depop.com/seller?groups=tops",
+        )
+
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight("test")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append("fetch")
+            started.set()
+            release.wait(5)
+            return {"url": "u1"}
+
+        leader = threading.Thread(target=lambda: results.append(flights.do("u1", fetch)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(flights.do("u1", fetch)))
+        follower.start()
+        while flights.stats()["shared"] == 0:
+            pass
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(calls, ["fetch"])
+        self.assertEqual(sorted(shared for _, shared in results), [False, True])
+        self.assertEqual(flights.stats(), {"led": 1, "shared": 1, "inflight": 0})
+
+    def test_follower_reruns_when_leader_is_cancelled(self):
+        flights = SingleFlight("test", retry_on=(LeaderCancelled,))
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def cancelled_fetch():
+            started.set()
+            release.wait(5)
+            raise LeaderCancelled()
+
+        def leader():
+            try:
+                flights.do("u1", cancelled_fetch)
+            except LeaderCancelled:
+                results.append("leader cancelled")
+
+        leader_thread = threading.Thread(target=leader)
+        leader_thread.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(flights.do("u1", lambda: "own")))
+        follower.start()
+        while flights.stats()["shared"] == 0:
+            pass
+        release.set()
+        leader_thread.join(5)
+        follower.join(5)
+
+        self.assertIn("leader cancelled", results)
+        self.assertIn(("own", False), results)
+
+    def test_cancelled_follower_stops_waiting_while_leader_runs(self):
+        flights = SingleFlight("test", retry_on=(LeaderCancelled,))
+        started = threading.Event()
+        release = threading.Event()
+        cancelled = threading.Event()
+        results = []
+
+        def slow_fetch():
+            started.set()
+            release.wait(5)
+            return "leader"
+
+        def check_cancelled():
+            if cancelled.is_set():
+                raise LeaderCancelled()
+
+        def follower():
+            try:
+                flights.do("u1", lambda: "own", check_cancelled=check_cancelled)
+            except LeaderCancelled:
+                results.append("follower cancelled")
+
+        leader_thread = threading.Thread(target=lambda: results.append(flights.do("u1", slow_fetch)))
+        leader_thread.start()
+        started.wait(5)
+        follower_thread = threading.Thread(target=follower)
+        follower_thread.start()
+        while flights.stats()["shared"] == 0:
+            pass
+        cancelled.set()
+        follower_thread.join(2)
+
+        self.assertFalse(follower_thread.is_alive())
+        self.assertEqual(results, ["follower cancelled"])
+        release.set()
+        leader_thread.join(5)
+        self.assertIn(("leader", False), results)
+
+    def test_async_follower_shares_sync_leader_result(self):
+        flights = SingleFlight("test")
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            return 42
+
+        leader = threading.Thread(target=lambda: flights.do("seller", fetch))
+        leader.start()
+        started.wait(5)
+
+        async def follow():
+            async def own_fetch():
+                return -1
+
+            task = asyncio.create_task(flights.do_async("seller", own_fetch))
+            await asyncio.sleep(0.05)
+            release.set()
+            return await task
+
+        self.assertEqual(asyncio.run(follow()), (42, True))
+        leader.join(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
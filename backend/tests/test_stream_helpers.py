@@ -1,8 +1,11 @@
+import asyncio
 import json
+import queue
 import sys
+import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
@@ -16,10 +19,17 @@ try:
         _error_payload_for_exception,
         MAX_LISTING_AGE_DAYS,
         _process_item,
+        _recover_session,
+        _recovery_tier,
+        _resolve_engine,
         _run_with_rate_limit_retries,
         _search_seller,
+        _search_seller_async,
         _sse,
     )
+    import main  # noqa: E402
+    from listing_cache import ListingCache, NegativeCache, WatermarkStore  # noqa: E402
+    from pacing import CircuitBreaker  # noqa: E402
     from scraper import RateLimitError, SearchCancelled, sleep_with_cancel  # noqa: E402
 except Exception as exc:  # pragma: no cover - protects VS Code discovery on wrong interpreter
     DEPENDENCY_IMPORT_ERROR = exc
@@ -37,6 +47,33 @@ class FakePage:
         self.closed = True
 
 
+class FakeBrowser:
+    def __init__(self, connected=True):
+        self.connected = connected
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.closed = True
+
+    def new_context(self, **kwargs):
+        ctx = FakeContext()
+        self.contexts.append(ctx)
+        return ctx
+
+
+class FakeAsyncSession:
+    def __init__(self):
+        self.page = object()
+        self.resets = 0
+
+    async def reset(self, exc=None, attempt=1):
+        self.resets += 1
+
+
 class FakeContext:
     def __init__(self):
         self.new_page_calls = 0
@@ -58,6 +95,9 @@ class StreamHelpersTest(unittest.TestCase):
         self.jitter_patcher = patch("main._sleep_request_jitter")
         self.jitter_patcher.start()
         self.addCleanup(self.jitter_patcher.stop)
+        self.breaker_patcher = patch("main.NAVIGATION_BREAKER", CircuitBreaker())
+        self.breaker_patcher.start()
+        self.addCleanup(self.breaker_patcher.stop)
 
     @staticmethod
     def _decode_events(events):
@@ -104,6 +144,33 @@ class StreamHelpersTest(unittest.TestCase):
             "Rate limited after 3 cooldown attempts while listing page.",
         )
 
+    def test_run_with_rate_limit_retries_shares_cooldown_with_other_searches(self):
+        other_events = []
+        own_events = []
+        attempts = []
+
+        def action():
+            attempts.append("try")
+            if len(attempts) == 1:
+                raise RateLimitError("Depop returned HTTP 429 Too Many Requests.", status=429, retry_after_seconds=240)
+            return "ok"
+
+        def own_notify(attempt, total_attempts, delay, exc, label):
+            own_events.append((delay, label))
+
+        main.NAVIGATION_BREAKER.subscribe("own", own_notify)
+        main.NAVIGATION_BREAKER.subscribe(
+            "other",
+            lambda attempt, total_attempts, delay, exc, label: other_events.append((delay, label)),
+        )
+        with patch("builtins.print"), patch("main.sleep_with_cancel"):
+            result = _run_with_rate_limit_retries(action, lambda: False, "listing page", on_rate_limit=own_notify)
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(own_events, [(240, "listing page")])
+        self.assertEqual(other_events, [(240, "another search is rate limited")])
+        self.assertEqual(main.NAVIGATION_BREAKER.state, "open")
+
     def test_run_with_rate_limit_retries_honors_retry_after_and_rebuilds_session(self):
         attempts = []
         delays = []
@@ -172,6 +239,47 @@ class StreamHelpersTest(unittest.TestCase):
         self.assertEqual(event["code"], "rate_limited")
         self.assertEqual(event["searchId"], "search-123")
 
+    def test_recovery_tier_escalates_by_error_class_and_attempt(self):
+        navigation_error = Exception("Navigation failed because page was closed")
+        rate_limit = RateLimitError("blocked", status=429)
+
+        self.assertEqual(
+            [_recovery_tier(navigation_error, attempt) for attempt in (1, 2, 3)],
+            ["page", "context", "browser"],
+        )
+        self.assertEqual(
+            [_recovery_tier(rate_limit, attempt) for attempt in (1, 2, 3)],
+            ["context", "context", "browser"],
+        )
+
+    def test_recover_session_reuses_browser_for_page_and_context_tiers(self):
+        browser = FakeBrowser()
+        ctx = FakeContext()
+        page = ctx.new_page()
+
+        with patch("builtins.print"), patch("main.new_browser_context", side_effect=lambda b: b.new_context()):
+            same_browser, same_ctx, new_page = _recover_session(None, None, browser, ctx, page, "page", True, 0)
+            self.assertIs(same_browser, browser)
+            self.assertIs(same_ctx, ctx)
+            self.assertTrue(page.closed)
+            self.assertIsNot(new_page, page)
+
+            _, fresh_ctx, _ = _recover_session(None, None, browser, ctx, new_page, "context", True, 0)
+            self.assertIs(fresh_ctx, browser.contexts[0])
+            self.assertFalse(browser.closed)
+
+        crashed = FakeBrowser(connected=False)
+        relaunched = FakeBrowser()
+        with (
+            patch("builtins.print"),
+            patch("main.create_browser_context", return_value=(relaunched, FakeContext())) as create_mock,
+        ):
+            new_browser, _, _ = _recover_session(None, None, crashed, FakeContext(), FakePage(), "page", True, 0)
+
+        create_mock.assert_called_once()
+        self.assertTrue(crashed.closed)
+        self.assertIs(new_browser, relaunched)
+
     def test_browse_all_reuses_single_item_page(self):
         ctx = FakeContext()
         browse_page = FakePage()
@@ -486,6 +594,345 @@ class StreamHelpersTest(unittest.TestCase):
         self.assertEqual(progress_events[-1]['processed'], 2)
         self.assertEqual(progress_events[-1]['total'], 2)
 
+    def test_search_seller_serves_repeat_listings_from_listing_cache(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        cache = ListingCache(str(Path(tmpdir.name) / "listings.sqlite3"))
+        cache.open()
+        self.addCleanup(cache.close)
+        parse_calls = []
+
+        def fake_parse(page, url, should_cancel=None):
+            parse_calls.append(url)
+            return {
+                'url': url, 'seller': 'onthemarkco', 'description': 'Pit to pit 21', 'price': '$40.00',
+                'image': None, 'sizeLabel': 'M', 'listedAt': '2026-10-01T00:00:00+00:00', 'ageDays': 2.0,
+            }
+
+        def run(search_id):
+            with (
+                patch('builtins.print'),
+                patch('main.LISTING_CACHE', cache),
+                patch('main._load_page_with_retries'),
+                patch('main.extract_seller_sold_count', return_value=110),
+                patch('main.remove_sold_sections'),
+                patch('main.collect_listing_links', return_value=['https://www.depop.com/products/a/', 'https://www.depop.com/products/b/']),
+                patch('main.parse_listing', side_effect=fake_parse),
+                patch('main._process_item', return_value=None),
+                patch('main._listing_exceeds_age_window', return_value=False),
+            ):
+                return self._decode_events(list(_search_seller(
+                    FakeContext(), FakePage(), 'onthemarkco', ['tops'], 'male', 21.5, 27.25, 0.5, 1,
+                    max_items=40, max_links=100, max_scrolls=4, search_id=search_id,
+                )))
+
+        first = run('search-cold')
+        second = run('search-warm')
+
+        self.assertEqual(len(parse_calls), 2)
+        self.assertEqual(first[-1]['listingCache'], {'hits': 0, 'misses': 2})
+        self.assertEqual(second[-1]['listingCache'], {'hits': 2, 'misses': 0})
+
+    def test_search_seller_rescan_parses_only_listings_newer_than_watermark(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = str(Path(tmpdir.name) / "listings.sqlite3")
+        # Negative TTLs keep every cached field stale, so only watermarked listings with a grid price may be served
+        cache = ListingCache(path, field_ttls={'price': -1, 'description': -1})
+        watermarks = WatermarkStore(path)
+        negative = NegativeCache(path)
+        for store in (cache, watermarks, negative):
+            store.open()
+            self.addCleanup(store.close)
+        parse_calls = []
+        collect_calls = []
+        served = []
+        a, b, c, d = (f'https://www.depop.com/products/{name}/' for name in 'abcd')
+        grids = [[a, b, d], [c]]
+        # On the rescan the grid still shows a at a new price and b as sold; d is gone
+        rescan_tiles = {c: {'price': '$50.00'}, a: {'price': '$35.00'}, b: {'price': '$40.00', 'sold': True}}
+
+        def fake_collect(*args, known_links=None, listing_data=None, **kwargs):
+            collect_calls.append(known_links)
+            if known_links:
+                listing_data.update(rescan_tiles)
+            return grids[len(collect_calls) - 1]
+
+        def fake_parse(page, url, should_cancel=None):
+            parse_calls.append(url)
+            return {'url': url, 'seller': 'onthemarkco', 'description': 'Pit to pit 21', 'price': '$40.00'}
+
+        def fake_process(item, *args):
+            served.append((item['url'], item['price']))
+            return None
+
+        def run(search_id):
+            with (
+                patch('builtins.print'),
+                patch('main.LISTING_CACHE', cache),
+                patch('main.SELLER_WATERMARKS', watermarks),
+                patch('main.NEGATIVE_CACHE', negative),
+                patch('main._load_page_with_retries'),
+                patch('main.extract_seller_sold_count', return_value=110),
+                patch('main.remove_sold_sections'),
+                patch('main.collect_listing_links', side_effect=fake_collect),
+                patch('main.parse_listing', side_effect=fake_parse),
+                patch('main._process_item', side_effect=fake_process),
+                patch('main._listing_exceeds_age_window', return_value=False),
+            ):
+                return self._decode_events(list(_search_seller(
+                    FakeContext(), FakePage(), 'onthemarkco', ['tops'], 'male', 21.5, 27.25, 0.5, 1,
+                    max_items=40, max_links=100, max_scrolls=4, search_id=search_id,
+                )))
+
+        run('search-first')
+        served.clear()
+        rescan = run('search-rescan')
+
+        meta = next(evt for evt in rescan if evt['type'] == 'meta')
+        self.assertEqual(collect_calls[0], None)
+        self.assertEqual(collect_calls[1], set(grids[0]))
+        self.assertEqual(parse_calls, [*grids[0], *grids[1]])
+        self.assertEqual((meta['links'], meta['knownLinks']), (2, 1))
+        self.assertEqual(served, [(c, '$40.00'), (a, '$35.00')])
+        self.assertEqual(negative.reasons([b]), {b: 'sold'})
+        self.assertEqual(
+            watermarks.known_urls('onthemarkco', 'tops', 'male'),
+            [*grids[1], *grids[0]],
+        )
+
+    def test_search_seller_skips_negatively_cached_listings_before_navigation(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        negative = NegativeCache(str(Path(tmpdir.name) / "listings.sqlite3"))
+        negative.open()
+        self.addCleanup(negative.close)
+        parse_calls = []
+        parse_results = {
+            'timeout': None,
+            'broken': {'url': 'broken', 'description': '', 'price': '', 'image': None, 'seller': ''},
+            'plain': {'url': 'plain', 'seller': 'onthemarkco', 'description': 'Great tee', 'ageDays': 1.0},
+            'measured': {'url': 'measured', 'seller': 'onthemarkco', 'description': 'Pit to pit 21 length 28', 'ageDays': 2.0},
+            'stale': {'url': 'stale', 'seller': 'onthemarkco', 'description': 'Pit to pit 22', 'ageDays': MAX_LISTING_AGE_DAYS + 1.0},
+        }
+
+        def fake_parse(page, url, should_cancel=None):
+            parse_calls.append(url)
+            return parse_results[url]
+
+        def run(search_id):
+            with (
+                patch('builtins.print'),
+                patch('main.NEGATIVE_CACHE', negative),
+                patch('main._load_page_with_retries'),
+                patch('main.extract_seller_sold_count', return_value=110),
+                patch('main.remove_sold_sections'),
+                patch('main.collect_listing_links', return_value=['timeout', 'broken', 'plain', 'measured', 'stale', 'older']),
+                patch('main.parse_listing', side_effect=fake_parse),
+                patch('main._process_item', return_value=None),
+            ):
+                return self._decode_events(list(_search_seller(
+                    FakeContext(), FakePage(), 'onthemarkco', ['tops'], 'male', 21.5, 27.25, 0.5, 1,
+                    max_items=40, max_links=100, max_scrolls=4, search_id=search_id,
+                )))
+
+        run('search-first')
+        parse_calls.clear()
+        rescan = run('search-rescan')
+
+        progress = [evt for evt in rescan if evt['type'] == 'progress']
+        # A page that never loaded is retried; a loaded page without listing evidence is not
+        self.assertEqual(parse_calls, ['timeout', 'measured'])
+        self.assertEqual(progress[-1]['negativeSkips'], {'parse_failed': 1, 'no_measurements': 1, 'too_old': 1})
+        self.assertEqual(rescan[-1]['stopReason'], 'age_window')
+
+    def test_search_seller_skips_listings_ruled_out_by_harvested_grid_data(self):
+        ctx = FakeContext()
+        page = FakePage()
+        parse_calls = []
+
+        def fake_collect(*args, listing_data=None, **kwargs):
+            listing_data.update({
+                'sold-1': {'url': 'sold-1', 'sold': True},
+                'stale-3': {'url': 'stale-3', 'sold': False, 'ageDays': MAX_LISTING_AGE_DAYS + 5.0},
+            })
+            return ['sold-1', 'fresh-2', 'stale-3', 'never-4']
+
+        def fake_parse(page, url, should_cancel=None):
+            parse_calls.append(url)
+            return {'seller': 'onthemarkco', 'url': url, 'ageDays': 1.0}
+
+        with (
+            patch('builtins.print'),
+            patch('main.LISTING_XHR_HARVEST', True),
+            patch('main._load_page_with_retries'),
+            patch('main.extract_seller_sold_count', return_value=110),
+            patch('main.remove_sold_sections'),
+            patch('main.collect_listing_links', side_effect=fake_collect),
+            patch('main.parse_listing', side_effect=fake_parse),
+            patch('main._process_item', return_value=None),
+        ):
+            events = list(
+                _search_seller(
+                    ctx, page, 'onthemarkco', ['tops'], 'male', 21.5, 27.25, 0.5, 1,
+                    max_items=40, max_links=100, max_scrolls=4, search_id='search-harvested',
+                )
+            )
+
+        decoded = self._decode_events(events)
+        self.assertEqual(parse_calls, ['fresh-2'])
+        self.assertEqual(decoded[-1]['type'], 'done')
+        self.assertEqual(decoded[-1]['total'], 3)
+        self.assertEqual(decoded[-1]['stopReason'], 'age_window')
+
+    def test_browse_all_prefetches_next_listing_in_spare_tab(self):
+        ctx = FakeContext()
+        browse_page = FakePage()
+        timeline = []
+
+        def fake_begin(page, url, should_cancel=None):
+            timeline.append(("begin", url, ctx.pages.index(page)))
+            return f"response-{url}"
+
+        def fake_parse(page, url, should_cancel=None, prefetched=False, prefetched_response=None):
+            timeline.append(("parse", url, ctx.pages.index(page), prefetched_response))
+            return {"seller": "seller", "url": url}
+
+        with (
+            patch("builtins.print"),
+            patch("main.LISTING_PREFETCH", True),
+            patch("main._load_page_with_retries"),
+            patch("main.collect_listing_links", side_effect=[["a", "b", "c"], [], [], []]),
+            patch("main.begin_listing_navigation", side_effect=fake_begin),
+            patch("main.parse_listing", side_effect=fake_parse),
+            patch("main._process_item", return_value=None),
+        ):
+            list(
+                _browse_all(
+                    ctx, browse_page, "tops", "male", 21.5, 27.0, 0.5, 0.75,
+                    max_items=10, max_links=3, max_scrolls=1, search_id="search-prefetch",
+                )
+            )
+
+        self.assertEqual(timeline, [
+            ("begin", "a", 0),
+            ("parse", "a", 0, "response-a"),
+            ("begin", "b", 1),
+            ("parse", "b", 1, "response-b"),
+            ("begin", "c", 0),
+            ("parse", "c", 0, "response-c"),
+        ])
+        self.assertTrue(all(page.closed for page in ctx.pages))
+
+    def test_browse_all_does_not_prefetch_past_an_age_window_stop(self):
+        ctx = FakeContext()
+        browse_page = FakePage()
+        begun = []
+
+        def fake_begin(page, url, should_cancel=None):
+            begun.append(url)
+            return f"response-{url}"
+
+        def fake_parse(page, url, should_cancel=None, prefetched=False, prefetched_response=None):
+            return {"seller": "seller", "url": url, "ageDays": MAX_LISTING_AGE_DAYS + 1.0}
+
+        with (
+            patch("builtins.print"),
+            patch("main.LISTING_PREFETCH", True),
+            patch("main._load_page_with_retries"),
+            patch("main.collect_listing_links", side_effect=[["a", "b", "c"], [], [], []]),
+            patch("main.begin_listing_navigation", side_effect=fake_begin),
+            patch("main.parse_listing", side_effect=fake_parse),
+            patch("main._process_item", return_value=None),
+        ):
+            list(
+                _browse_all(
+                    ctx, browse_page, "tops", "male", 21.5, 27.0, 0.5, 0.75,
+                    max_items=10, max_links=3, max_scrolls=1, search_id="search-prefetch-age",
+                )
+            )
+
+        self.assertEqual(begun, ["a"])
+
+    def test_browse_all_prefilters_tiles_outside_size_range(self):
+        ctx = FakeContext()
+        browse_page = FakePage()
+        parse_calls = []
+        tiles = {
+            'small': {'sizeLabel': 'US 8'},
+            'fits': {'sizeLabel': 'US 10'},
+            'unknown': {'sizeLabel': None},
+        }
+
+        def fake_collect(*args, listing_data=None, read_tiles=False, **kwargs):
+            self.assertTrue(read_tiles)
+            listing_data.update(tiles)
+            return list(tiles)
+
+        def fake_parse(page, url, should_cancel=None):
+            parse_calls.append(url)
+            return {'url': url, 'sizeLabel': 'US 10'}
+
+        with (
+            patch('builtins.print'),
+            patch('main._load_page_with_retries'),
+            patch('main.collect_listing_links', side_effect=fake_collect),
+            patch('main.parse_listing', side_effect=fake_parse),
+            patch('main._resolve_seller_sold_count', return_value=99),
+        ):
+            events = list(
+                _browse_all(
+                    ctx, browse_page, 'footwear', 'male', 0, 0, 0, 0,
+                    max_items=1, max_links=3, max_scrolls=1, search_id='search-prefilter',
+                    category='footwear', size_range={'min': 9.5, 'max': 10.5},
+                )
+            )
+
+        decoded = self._decode_events(events)
+        self.assertEqual(parse_calls, ['fits'])
+        self.assertEqual(decoded[-1]['type'], 'done')
+        self.assertEqual(decoded[-1]['prefiltered'], 1)
+        self.assertEqual(decoded[-1]['matches'], 1)
+
+    def test_search_seller_reports_prefiltered_links_outside_the_total(self):
+        ctx = FakeContext()
+        page = FakePage()
+        tiles = {
+            'small': {'sizeLabel': 'US 8'},
+            'fits': {'sizeLabel': 'US 10'},
+        }
+
+        def fake_collect(*args, listing_data=None, read_tiles=False, **kwargs):
+            listing_data.update(tiles)
+            return list(tiles)
+
+        def fake_parse(page, url, should_cancel=None):
+            return {'seller': 'onthemarkco', 'url': url, 'sizeLabel': 'US 10', 'ageDays': 1.0}
+
+        with (
+            patch('builtins.print'),
+            patch('main._load_page_with_retries'),
+            patch('main.extract_seller_sold_count', return_value=110),
+            patch('main.remove_sold_sections'),
+            patch('main.collect_listing_links', side_effect=fake_collect),
+            patch('main.parse_listing', side_effect=fake_parse),
+            patch('main._process_item', return_value=None),
+        ):
+            events = list(
+                _search_seller(
+                    ctx, page, 'onthemarkco', ['footwear'], 'male', 0, 0, 0, 0,
+                    max_items=40, max_links=100, max_scrolls=4, search_id='search-seller-prefilter',
+                    category='footwear', size_range={'min': 9.5, 'max': 10.5},
+                )
+            )
+
+        decoded = self._decode_events(events)
+        meta = next(event for event in decoded if event['type'] == 'meta')
+        self.assertEqual(meta['links'], 1)
+        self.assertEqual(meta['prefiltered'], 1)
+        last_progress = [event for event in decoded if event['type'] == 'progress'][-1]
+        self.assertEqual(last_progress['processed'], last_progress['total'])
+
     def test_search_seller_stops_current_group_once_listing_exceeds_age_window(self):
         ctx = FakeContext()
         page = FakePage()
@@ -644,6 +1091,138 @@ class StreamHelpersTest(unittest.TestCase):
         self.assertEqual(decoded[-1]['type'], 'done')
         self.assertEqual(decoded[-1]['stopReason'], 'match_limit')
 
+    def test_resolve_engine_prefers_request_then_default(self):
+        self.assertEqual(_resolve_engine({"engine": "async"}), "async")
+        self.assertEqual(_resolve_engine({"engine": "ASYNC "}), "async")
+        self.assertEqual(_resolve_engine({"engine": "threads"}), "sync")
+        with patch("main.SEARCH_ENGINE", "async"):
+            self.assertEqual(_resolve_engine({}), "async")
+
+    def test_stream_tally_closes_the_stream_at_the_match_limit(self):
+        tally = main._StreamTally("search-1", max_matches=2, total=5)
+        tally.processed = 3
+
+        self.assertEqual(len(tally.count_match({"url": "a"})), 1)
+        chunks = tally.count_match({"url": "b"}, seller="shop")
+
+        self.assertTrue(tally.reached_limit())
+        events = self._decode_events(chunks)
+        self.assertEqual([event["type"] for event in events], ["match", "done"])
+        self.assertEqual(events[0]["seller"], "shop")
+        self.assertEqual((events[1]["stopReason"], events[1]["processed"], events[1]["total"]), ("match_limit", 3, 5))
+
+        tally.stop_for_age({"ageDays": 99.0}, "@shop group=tops")
+        self.assertEqual(self._decode_events([tally.done()])[0]["stopReason"], "age_window")
+
+    def test_stream_worker_starts_on_its_own_browser_when_the_pool_is_full(self):
+        started = queue.Queue()
+        full_pool = type("FullPool", (), {"try_submit": lambda self, job: None})()
+
+        with patch("main.BROWSER_POOL", full_pool):
+            _is_alive, cancel = main._start_stream_worker(started.put, use_pool=True)
+
+        self.assertIsNone(started.get(timeout=5))
+        self.assertFalse(cancel())
+
+    def test_async_pipeline_launches_its_own_browser_for_headed_or_slowmo_runs(self):
+        launched = []
+        sessions = []
+
+        class FakeBrowserManager:
+            def __init__(self, headless=True, slowmo=0):
+                self.options = (headless, slowmo)
+                self.closed = False
+                launched.append(self)
+
+            async def close(self):
+                self.closed = True
+
+        class RecordingSession:
+            def __init__(self, browser):
+                self.browser = browser
+                sessions.append(self)
+
+            async def open(self):
+                return self
+
+            async def close(self):
+                pass
+
+        def pipeline(session, emit_event):
+            async def events():
+                yield _sse({"type": "done"})
+            return events()
+
+        async def run(**options):
+            return [chunk async for chunk in main._run_async_pipeline("async-headed", "stream", pipeline, **options)]
+
+        with (
+            patch('builtins.print'),
+            patch('main.AsyncBrowserManager', FakeBrowserManager),
+            patch('main._AsyncSession', RecordingSession),
+        ):
+            asyncio.run(run())
+            asyncio.run(run(headless=False, slowmo=250))
+
+        self.assertIs(sessions[0].browser, main.ASYNC_BROWSER)
+        self.assertEqual([browser.options for browser in launched], [(False, 250)])
+        self.assertIs(sessions[1].browser, launched[0])
+        self.assertTrue(launched[0].closed)
+
+    def test_async_search_seller_streams_matches_and_recovers_from_rate_limit(self):
+        session = FakeAsyncSession()
+        emitted_progress = []
+
+        async def fake_parse(page, url, should_cancel=None):
+            return {'seller': 'drewzal', 'url': url}
+
+        async def collect_events():
+            return [
+                chunk
+                async for chunk in _search_seller_async(
+                    session,
+                    'drewzal',
+                    ['tops'],
+                    'male',
+                    21.5,
+                    27.25,
+                    0.5,
+                    1,
+                    max_items=40,
+                    max_links=100,
+                    max_scrolls=4,
+                    search_id='async-search',
+                    emit_event=emitted_progress.append,
+                )
+            ]
+
+        with (
+            patch('builtins.print'),
+            patch('main._load_page_with_retries_async', new=AsyncMock()),
+            patch('main._sleep_request_jitter_async', new=AsyncMock()),
+            patch('async_scraper.sleep_with_cancel', new=AsyncMock()),
+            patch('async_scraper.extract_seller_sold_count', new=AsyncMock(return_value=77)),
+            patch('async_scraper.remove_sold_sections', new=AsyncMock()),
+            patch(
+                'async_scraper.collect_listing_links',
+                new=AsyncMock(side_effect=[RateLimitError("Depop appears to be rate limiting requests right now."), ['a', 'b']]),
+            ),
+            patch('async_scraper.parse_listing', side_effect=fake_parse),
+            patch('main._process_item', side_effect=lambda item, *args: dict(item)),
+        ):
+            events = asyncio.run(collect_events())
+
+        decoded = self._decode_events(events)
+        match_events = [evt for evt in decoded if evt['type'] == 'match']
+
+        self.assertEqual(session.resets, 1)
+        self.assertEqual(emitted_progress[0]['phase'], 'rate_limited')
+        self.assertEqual(emitted_progress[0]['retryDelaySeconds'], 60)
+        self.assertEqual([evt['item']['url'] for evt in match_events], ['a', 'b'])
+        self.assertTrue(all(evt['item']['soldCount'] == 77 for evt in match_events))
+        self.assertEqual(decoded[-1]['type'], 'done')
+        self.assertEqual(decoded[-1]['stopReason'], 'completed')
+
     def test_process_item_matches_bottoms_by_size_range(self):
         item = {
             "url": "https://www.depop.com/products/example-bottoms/",